@@ -9,7 +9,13 @@
 #   Mancala - Mancala class representing the game as played.
 #   Player - Player class representing each of the players.
 #   Board - Board class representing the Mancala board.
+#   BoardTopology - BoardTopology class representing the immutable layout shared by boards of one size.
+#   MoveResult - MoveResult class representing the outcome of a single move.
+#   BoardStats - BoardStats class representing the opt-in instrumentation counters of a board.
+#   Position - Position class representing a compact, hashable board position.
+#   ContainerBase - ContainerBase class holding the ids, type and pointers of a pit/store.
 #   Container - Container class representing seed pits/stores.
+#   ContainerView - ContainerView class representing a pit/store of a Board, over the board's seed counts.
 #
 # The smallest abstraction is a Container class that is used to represent seed 'pits' and 'stores'. Containers can
 # store seeds, and have attribute pointers to the next pits/store in line (similar to nodes in a tree). Containers can
@@ -26,6 +32,12 @@
 # manipulation of seed values, in conjunction with the pointers, trivial for tasks such as distributing and transfering
 # seeds between other pits and stores.
 #
+# The layout of the circuit (the next and adjacent containers, owners and types, and where every move sows) never
+# changes, so it is held once per board size by a shared, immutable BoardTopology object. A Board itself only keeps
+# its seeds, as one flat list of integers. The Container circuit is built on demand as a view of the counts
+# (ContainerView objects), so the pointer-based access above works unchanged. ArrayBoard, the former name of the
+# flat representation, is kept as an alias of Board.
+#
 # Players are presented by a trivial Player class with their names.
 #
 # The Mancala class representing the game as played, builds on the other class abstractions. Each Mancala object
@@ -34,6 +46,9 @@
 # To play a game, simply call:
 #       Mancala().new_game()
 
+import struct
+import time
+
 
 class Mancala:
     """Mancala class representing the game as played. The class contains information about
@@ -45,12 +60,31 @@ class Mancala:
                         corresponding to player 1 or 2.
         _current    : integer representing the current player 1 or 2 turn.
     """
-    def __init__(self):
-        """Initializes a Mancala game object."""
-        self._board = Board(num_pits=6, num_seeds=4)
+    def __init__(self, board=None):
+        """Initializes a Mancala game object.
+
+        Parameters:
+            board : optional Board object to play on. Defaults to a standard
+                    Board with 6 pits and 4 seeds.
+        """
+        if board is None:
+            board = Board(num_pits=6, num_seeds=4)
+        self._board = board
         self._players = {1: None, 2: None}
         self._current = 1
 
+    def get_board(self):
+        """Returns the Board object of the game."""
+        return self._board
+
+    def get_current(self):
+        """Returns the player index (1 or 2) whose turn it is."""
+        return self._current
+
+    def get_player(self, player_idx):
+        """Returns the Player object of a player index (1 or 2), or None if not created yet."""
+        return self._players[player_idx]
+
     def create_player(self, name):
         """Creates/adds a player to the game."""
         # If player 1 already added, add player 2.
@@ -130,28 +164,52 @@ class Mancala:
                 Player2 pit1, player2 pit2, player2 pit3, player2 pit4, player2 pit5, player2 pit6, player2 store,]
 
         """
-        # If the user pit index is invalid (outside [1,6]), return.
-        if pit_idx > 6 or pit_idx < 1:
+        # If the user pit index is invalid (outside [1,6] on the standard board), return.
+        if not self._board.is_valid_pit(pit_idx):
             return "Invalid number for pit index"
 
         # If the game is already over, return.
         if self._board.is_game_over():
             return "Game is ended"
 
+        # Play a round of the game according to the rules, printing why the move is invalid
+        # or "player <player_number> take another turn" if applicable.
+        try:
+            result = self.apply_move(player_idx, pit_idx)
+        except ValueError as error:
+            print(error)
+        else:
+            if result.is_extra_turn():
+                print(f"player {player_idx} take another turn")
+
+        # Finally, return the list of seed and store tallies.
+        return self._board.get_seed_list()
+
+    def apply_move(self, player_idx, pit_idx):
+        """Executes a single turn of a player like play_game, but without any printing and
+        without building the seed list. Following the turn, if the game is over, performs
+        the final tally.
+
+        Parameters:
+            player_idx  : integer representing the player index (1 or 2)
+            pit_idx     : integer representing the pit index (1 to the number of pits)
+        Returns:
+            MoveResult object describing the outcome of the move.
+        Raises:
+            ValueError if the game is already over, or the move is invalid.
+        """
+        # If the game is already over, the move is invalid.
+        if self._board.is_game_over():
+            raise ValueError("Game is ended")
+
         # Play a round of the game according to the rules.
-        # The play_turn method on board will print "player <player_number> take another turn" if applicable.
-        board = self._board
-        board.play_turn(player_idx, pit_idx)
+        result = self._board.apply_move(player_idx, pit_idx)
 
         # Following the turn, if the game is over, perform a final tally by moving any remaining seeds in
         # the pits to their respective player store.
-        if self._board.is_game_over():
+        if result.is_game_over():
             self._board.final_tally()
-
-        # Finally, return the list of seed and store tallies.
-        seeds = board.get_pit_seeds(1) + [board.get_store_seeds(1)]   # Player 1 pits + store
-        seeds += board.get_pit_seeds(2) + [board.get_store_seeds(2)]  # Player 2 pits + store
-        return seeds
+        return result
 
     def print_title(self):
         title = ("\u001b[31m"
@@ -165,18 +223,28 @@ class Mancala:
         "\u001b[33mBy Kevin Kuei\n\033[0m")
         print(title)
 
-    def new_game(self):
+    def new_game(self, engines=None, book=None):
         """Implements the logic for running a full Mancala game in console properly, with
         input solicitation from players.
+
+        Parameters:
+            engines : optional dictionary mapping a player index (1 or 2) to a computer player,
+                        i.e. an object with get_name() and choose_move(board, player_id) methods,
+                        such as MancalaSearch.SearchEngine. Other players are asked for input.
+            book    : optional opening book (e.g. MancalaBook.OpeningBook), with a probe(board,
+                        player_id) method, consulted for the computer players before they search.
         """
+        engines = engines or {}
+
         # Print the game title.
         self.print_title()
 
         # Get the player names.
-        player1 = input("Enter player 1 name: ")
-        self.create_player(player1)
-        player2 = input("Enter player 2 name: ")
-        self.create_player(player2)
+        for player_idx in (1, 2):
+            if player_idx in engines:
+                self.create_player(engines[player_idx].get_name())
+            else:
+                self.create_player(input(f"Enter player {player_idx} name: "))
 
         # Print the initial board.
         print("\nInitial board:")
@@ -184,8 +252,16 @@ class Mancala:
 
         # Enter the main game loop.
         while not self._board.is_game_over():
-            # Get the current player's input (pit index).
-            pit_idx = self.get_user_input()
+            # Get the current player's input (pit index), or the computer's choice.
+            if self._current in engines:
+                entry = book.probe(self._board, self._current) if book is not None else None
+                if entry is not None:
+                    pit_idx = entry[0]
+                else:
+                    pit_idx = engines[self._current].choose_move(self._board, self._current)
+                print(f"Player {self._current} ({self._players[self._current].get_name()}) chooses pit {pit_idx}.")
+            else:
+                pit_idx = self.get_user_input()
 
             # Play the turn, and store the return skip flag value in skip.
             skip = self._board.play_turn(self._current, pit_idx)
@@ -231,8 +307,7 @@ class Mancala:
 
         # Checks that the input is for a pit that is non-zero.
         pit_idx = int(user_input)
-        board = self._board.get_board()
-        if not board[self._current][pit_idx].get_seeds() > 0:
+        if not self._board.get_seeds(self._current, pit_idx) > 0:
             print("Player must select a pit that is not empty!")
             return False
         return True
@@ -262,10 +337,15 @@ class Player:
 class Board:
     """Board class representing the Mancala game board. Uses a composition-based approach.
 
-    The board is represented by a collection of containers that represent the pits
-    and stores for player 1 and 2. The containers are connected to form a closed-circuit
-    representing the board. Given the location of any pit, we can traverse the board by
-    moving in a counter-clockwise direction.
+    The board is represented by the containers that represent the pits and stores for player
+    1 and 2. The containers are connected to form a closed-circuit representing the board.
+    Given the location of any pit, we can traverse the board by moving in a counter-clockwise
+    direction.
+
+    The circuit (the next and adjacent containers, owners and types) is the same for every
+    board with the same number of pits, so it is held once, by a shared BoardTopology object
+    (see board_topology), and each board only keeps its seed counts, as one flat list. The
+    Container circuit is built as a view of the counts on demand (see get_board).
 
     A board is initialized with number of pits. The pits are initialized with an initial
     number of seeds.
@@ -274,21 +354,43 @@ class Board:
     | p2    | num_pits | .. | 2   | 1       | p1    |
     | Store | 1        | 2  | ... | num_pits| Store |
 
+    Seed counts (flat indices):
+    | p1 pits 1..num_pits | p1 store | p2 pits 1..num_pits | p2 store     |
+    | 0 .. num_pits-1     | num_pits | num_pits+1 .. 2n    | 2*num_pits+1 |
+
+    This is the same ordering as the seed list returned by Mancala.play_game.
+
     Attributes:
         _num_pits   : integer representing the number of pits to setup the board with.
         _num_seeds  : integer representing the number of seeds to initially seed the pits with.
-        _board      : object representing common access interface for the pits; represented by
-                        a nested dictionary, where the first level is the player id (1 or 2),
-                        and the second level is the Container class (pit/store) id value, either
-                        an integer between 1 and num_pits, or 'store'.
+        _topology   : BoardTopology object of the circuit, shared by all boards with the same
+                        number of pits.
+        _seeds      : list of integers representing the seeds in each pit/store (flat layout).
+        _view       : object representing common access interface for the pits, built on first
+                        use by get_board; represented by a nested dictionary, where the first level
+                        is the player id (1 or 2), and the second level is the Container class
+                        (pit/store) id value, either an integer between 1 and num_pits, or 'store'.
+        _to_move    : integer representing the player id (1 or 2) to move, as tracked by make_move.
+        _undo       : list representing the stack of undo records pushed by make_move.
+        _pit_totals : list representing the running total of seeds in the pits of player 1 and 2
+                        (at index 1 and 2), kept up to date by the moves so that game over and
+                        winner checks do not need to walk the pits.
+        _stats      : BoardStats object counting the board's work while instrumentation is
+                        enabled (see enable_stats), or None.
     """
     def __init__(self, num_pits=6, num_seeds=4):
         """Initializes Board object."""
         self._num_pits = num_pits
         self._num_seeds = num_seeds
-        self._board = None
-
-        # Initializes the board access interface.
+        self._topology = board_topology(num_pits)
+        self._seeds = None
+        self._view = None
+        self._to_move = 1
+        self._undo = []
+        self._pit_totals = [0, 0, 0]
+        self._stats = None
+
+        # Initializes the seeds.
         self.setup_board()
 
     # Public getters
@@ -301,56 +403,48 @@ class Board:
         return self._num_seeds
 
     def get_board(self):
-        """Returns the board dictionary/ common access interface."""
-        return self._board
+        """Returns the board dictionary/ common access interface, a Container view of the seeds
+        built on first use (see BoardTopology.build_view). Setting the seeds of the containers
+        changes the board's seeds, and keeps its pit totals up to date."""
+        if self._view is None:
+            self._view = self._topology.build_view(self._seeds, self._pit_totals)
+        return self._view
+
+    def get_topology(self):
+        """Returns the shared BoardTopology object of the board."""
+        return self._topology
+
+    def get_pit_total(self, player):
+        """Given the player id, returns the total number of seeds left in their pits."""
+        return self._pit_totals[player]
+
+    def get_to_move(self):
+        """Returns the player id (1 or 2) to move."""
+        return self._to_move
+
+    def get_stats(self):
+        """Returns the BoardStats object of the board while instrumentation is enabled, or None."""
+        return self._stats
+
+    # Public setters
+    def set_to_move(self, player):
+        """Sets the player id (1 or 2) to move."""
+        self._to_move = player
 
     # Public methods
     def setup_board(self):
-        """Sets up the Mancala board with appropriate number of seed pits and seeds.
-        The board is represented by a chain/closed-circuit of containers representing
-        either the seed 'pit' or 'store'.
-        """
-        # Create player 1 store and pits.
-        p1_store = Container('store', 1, 'store')
-        p1_pits = [Container(i, 1, 'pit') for i in range(1, self.get_num_pits()+1)]
-
-        # Create player 2 store and pits.
-        p2_store = Container('store', 2, 'store')
-        p2_pits = [Container(i, 2, 'pit') for i in range(1, self.get_num_pits()+1)]
-
-        # Next, create a closed-circuit for the game board by connecting the containers.
-        # First, chain the pits together, consecutively, for player 1 and 2.
-        for i in range(0, self.get_num_pits() - 1):
-            p1_pits[i].set_next(p1_pits[i + 1])
-            p2_pits[i].set_next(p2_pits[i + 1])
-
-        # Next, chains the ends of the stores and pits for player 1 and 2.
-        p1_pits[-1].set_next(p1_store)
-        p1_store.set_next(p2_pits[0])
-        p2_pits[-1].set_next(p2_store)
-        p2_store.set_next(p1_pits[0])
-
-        # Set the adjacent nodes, which will be opposing, i.e.
-        #   p2: 6 5 4 3 2 1
-        #   p1: 1 2 3 4 5 6
-        for i in range(0, self.get_num_pits()):
-            p1_pits[i].set_adjacent(p2_pits[self.get_num_pits()-1-i])
-            p2_pits[i].set_adjacent(p1_pits[self.get_num_pits()-1-i])
-
-        # Initialize all the pits with the specified number of seeds.
-        [pit.set_seeds(self.get_num_seeds()) for pit in p1_pits + p2_pits]
-
-        # Create a common access interface for the containers. Represent the board
-        # with a nested dictionary, where the first level is player id (1 or 2), and
-        # the second is the pit/store id.
-        board = {1: {}, 2: {}}
-        for pit in p1_pits:
-            board[1][pit.get_id()] = pit
-        for pit in p2_pits:
-            board[2][pit.get_id()] = pit
-        board[1]['store'] = p1_store
-        board[2]['store'] = p2_store
-        self._board = board
+        """Sets up the Mancala board with appropriate number of seed pits and seeds. Only the
+        seed counts are set up per board; the circuit of containers is shared (see
+        BoardTopology).
+        """
+        # Initialize all the pits with the specified number of seeds, and empty stores.
+        self._seeds = ([self.get_num_seeds()] * self.get_num_pits() + [0]) * 2
+        self._view = None
+        self.recount_seeds()
+
+    def recount_seeds(self):
+        """Recounts the running totals of seeds in the pits of each player."""
+        self._pit_totals[:] = [0, sum(self.get_pit_seeds(1)), sum(self.get_pit_seeds(2))]
 
     def print_board(self):
         """Prints the current board state.
@@ -398,25 +492,50 @@ class Board:
         print(txt)
 
     def get_pits(self, player):
-        """Given the player id, returns the pits in consecutive order.
+        """Given the player id, returns the pits (Container view) in consecutive order.
         Parameters:
           player : integer representing the player id (1 or 2).
         """
-        return [item for item in self._board[player].values() if item.get_type() == "pit"]
+        containers = self.get_board()[player]
+        return [containers[pit] for pit in range(1, self._num_pits + 1)]
+
+    def get_pit_index(self, player, pit_number):
+        """Given the player id and pit number, returns the flat index of the pit."""
+        return (player - 1) * (self._num_pits + 1) + pit_number - 1
+
+    def get_store_index(self, player):
+        """Given the player id, returns the flat index of the player store."""
+        return player * (self._num_pits + 1) - 1
+
+    def get_container(self, index):
+        """Given a flat index, returns the (player id, container id) it represents, where the
+        container id is a pit number or 'store'."""
+        return self._topology.get_name(index)
 
     def get_pit_seeds(self, player):
         """Given the player id, returns the number of seeds in each pit, as a list.
         Parameters:
           player : integer representing the player id (1 or 2).
         """
-        return [pit.get_seeds() for pit in self.get_pits(player)]
+        start = (player - 1) * (self._num_pits + 1)
+        return self._seeds[start:start + self._num_pits]
 
     def get_store_seeds(self, player):
         """Given the player id, returns the number of seeds in their store.
         Parameters:
           player : integer representing the player id (1 or 2).
         """
-        return self._board[player]['store'].get_seeds()
+        return self._seeds[player * (self._num_pits + 1) - 1]
+
+    def get_seeds(self, player, container_id):
+        """Given the player id and container id, returns the number of seeds in the container.
+        Parameters:
+          player       : integer representing the player id (1 or 2).
+          container_id : integer representing the pit number (1 to num_pits), or 'store'.
+        """
+        if container_id == 'store':
+            return self._seeds[self.get_store_index(player)]
+        return self._seeds[self.get_pit_index(player, container_id)]
 
     def get_empty_pits(self, player):
         """Given the player id, returns a list of booleans representing if the pits are empty.
@@ -429,10 +548,8 @@ class Board:
         """Returns a boolean representing whether the game is over.  The game is over when
          a player has zero seeds left in their pits.
         """
-        for player in [1, 2]:
-            if all(self.get_empty_pits(player)):
-                return True
-        return False
+        totals = self._pit_totals
+        return totals[1] == 0 or totals[2] == 0
 
     def return_winner(self):
         """Returns the winner (player id), and None if there is no winner.
@@ -446,8 +563,8 @@ class Board:
             return None
 
         # Get the seed totals for each player (remaining seeds in their pits + store).
-        p1_total = sum(self.get_pit_seeds(1)) + self.get_store_seeds(1)
-        p2_total = sum(self.get_pit_seeds(2)) + self.get_store_seeds(2)
+        p1_total = self._pit_totals[1] + self.get_store_seeds(1)
+        p2_total = self._pit_totals[2] + self.get_store_seeds(2)
 
         # Return the winner.
         # A tie.
@@ -464,20 +581,23 @@ class Board:
         """Performs a final tally by moving any seeds remaining in the pits to their respective
         player store. Can prematurely end the game by removing all the seeds from the pits.
         """
-        # Get the store accessors.
-        p1_store = self._board[1]['store']
-        p2_store = self._board[2]['store']
-
         # Add the remaining seeds in the pits to the stores.
-        p1_store.add_seeds(sum(self.get_pit_seeds(1)))
-        p2_store.add_seeds(sum(self.get_pit_seeds(2)))
+        seeds = self._seeds
+        num_pits = self._num_pits
+        p1_store, p2_store = num_pits, 2 * num_pits + 1
+        seeds[p1_store] += self._pit_totals[1]
+        seeds[p2_store] += self._pit_totals[2]
 
         # Clear the seeds from the pits.
-        [p.clear_seeds() for p in self.get_pits(1)+self.get_pits(2)]
+        for i in range(num_pits):
+            seeds[i] = 0
+            seeds[p1_store + 1 + i] = 0
+        self._pit_totals[:] = [0, 0, 0]
 
     def play_turn(self, player_id, pit_number):
         """Executes a single player turn if valid. Given a player id and pit number,
         validates the request, then distributes the seeds counter-clockwise around the board.
+        Thin printing wrapper around apply_move.
 
         Special cases/scenarios:
             i.   Passing opposing player's store -- does not distribute a seed.
@@ -492,64 +612,143 @@ class Board:
             Returns None, except for the case where the player gets another turn--in that case, a
                 string 'skip' is returned.
         """
-        # Guard cases.
+        # Play the move, printing the reason if it is invalid.
+        try:
+            result = self.apply_move(player_id, pit_number)
+        except ValueError as error:
+            print(error)
+            return
+
+        # If our last piece fell in the player store, the player gets another turn, so
+        # state that, and return a 'skip' flag.
+        if result.is_extra_turn():
+            print(f"player {player_id} take another turn")
+            return 'skip'
+
+    def check_move(self, player_id, pit_number):
+        """Validates a move without playing it.
+        Parameters:
+            player_id : integer representing the player id (1 or 2)
+            pit_number: integer representing the player pit number (must be between 1 and _num_pits).
+        Raises:
+            ValueError if the player id or pit number are invalid, or the pit is empty.
+        """
         # Must be valid player number.
         if player_id not in (1, 2):
-            print("Invalid player selection. Pick 1 or 2.")
-            return
+            raise ValueError("Invalid player selection. Pick 1 or 2.")
 
         # Must be valid pit number.
         if not self.is_valid_pit(pit_number):
-            print(f"Invalid pit number selection. Pick a number between 1 and {self.get_num_pits()}")
-            return
+            raise ValueError(f"Invalid pit number selection. Pick a number between 1 and {self.get_num_pits()}")
 
         # Must select a non-empty pit.
-        pit = self._board[player_id][pit_number]
-        if pit.get_seeds() == 0:
-            print("Invalid selection. Player must choose a non-empty pit.")
-            return
+        if self.get_seeds(player_id, pit_number) == 0:
+            raise ValueError("Invalid selection. Player must choose a non-empty pit.")
 
-        # Initialize traversal.
-        seed_count = pit.get_seeds()
-        pit.clear_seeds()
-        current = pit
+    def apply_move(self, player_id, pit_number):
+        """Executes a single player turn in place, without any printing. Given a player id and
+        pit number, validates the request, then distributes the seeds counter-clockwise around
+        the board, following the same rules as play_turn.
 
-        # While we still have seeds to distribute.
-        while seed_count > 0:
+        Parameters:
+            player_id : integer representing the player id (1 or 2)
+            pit_number: integer representing the player pit number (must be between 1 and _num_pits).
+        Returns:
+            MoveResult object describing the outcome of the move.
+        Raises:
+            ValueError if the move is invalid (see check_move).
+        """
+        self.check_move(player_id, pit_number)
 
-            # Gets the next seed.
-            current = current.get_next()
+        # Play the move with the sowing table, and keep the pit totals up to date.
+        current, kind, captured, own_change, opponent_change = \
+            self._topology.get_sowing().play(self._seeds, player_id, pit_number)
+        self._pit_totals[player_id] += own_change
+        self._pit_totals[3 - player_id] += opponent_change
 
-            # If our last piece falls in an empty pit belonging to player, move the seed
-            # and adjacent seeds to the player store.
-            if seed_count == 1 and current.get_player() == player_id and current.get_type() == 'pit' \
-                    and current.get_seeds() == 0:
-                # Get the adjacent (opposing player's) pit.
-                adjacent = current.get_adjacent()
+        # If our last piece fell in the player store, the player gets another turn.
+        return MoveResult(player_id, pit_number, self._topology.get_name(current), captured,
+                          kind == LANDS_STORE, self.is_game_over())
 
-                # Add the adjacent and current seed to the player store.
-                store = self._board[player_id]['store']
-                store.add_seeds(adjacent.get_seeds() + 1)
+    def get_seed_list(self):
+        """Returns a list of the current seeds, in the same order as Mancala.play_game:
+            [player1 pit1, ..., player1 pitN, player1 store, player2 pit1, ..., player2 pitN, player2 store]
+        """
+        return list(self._seeds)
 
-                # Clear the seeds from the adjacent pit.
-                adjacent.clear_seeds()
+    def set_seed_list(self, seeds):
+        """Sets the seeds of every pit and store from a list in the same order as get_seed_list.
+        The counts are replaced in place, so a Container view (see get_board) stays valid.
+        Parameters:
+            seeds : sequence of integers of length 2 * num_pits + 2.
+        """
+        self._seeds[:] = seeds
+        self.recount_seeds()
 
-                # Decrement the current seed count.
-                seed_count -= 1
+    def make_move(self, player_id, pit_number):
+        """Plays a move in place like apply_move, but so that it can be taken back with
+        unmake_move. Pushes an undo record holding the seeds before the move, the previous
+        player to move and the move result, then passes the turn to the other player (unless
+        the player gets another turn).
 
-            # Otherwise, distribute the seed so long as it's not the opposing player's store.
-            elif not (current.get_player() != player_id and current.get_type() == 'store'):
-                # Increment the current container.
-                current.increment_seeds()
+        The undo record keeps a tuple of every pit/store count rather than only the changed
+        containers; with at most 2 * num_pits + 2 small integers this is cheaper to take and
+        restore than tracking the individual changes.
 
-                # Decrement the current seed count.
-                seed_count -= 1
+        Parameters:
+            player_id : integer representing the player id (1 or 2)
+            pit_number: integer representing the player pit number (must be between 1 and _num_pits).
+        Returns:
+            MoveResult object describing the outcome of the move.
+        Raises:
+            ValueError if the move is invalid (see check_move). Nothing is pushed in that case.
+        """
+        counts = self.get_seed_tuple()
+        result = self.apply_move(player_id, pit_number)
+        self._undo.append((counts, self._to_move, result))
+        self._to_move = player_id if result.is_extra_turn() else 3 - player_id
+        return result
+
+    def unmake_move(self):
+        """Takes back the last move played with make_move, restoring the seeds and the player
+        to move exactly.
+        Returns:
+            MoveResult object of the move taken back.
+        """
+        counts, self._to_move, result = self._undo.pop()
+        self.set_seed_list(counts)
+        return result
+
+    def get_undo_depth(self):
+        """Returns the number of moves that can be taken back with unmake_move."""
+        return len(self._undo)
+
+    def get_seed_tuple(self):
+        """Returns the seeds of every pit and store as a tuple, in the same order as get_seed_list."""
+        return tuple(self._seeds)
 
-            # If our last piece falls in the player store, the player gets another turn, so
-            # state that, and return a 'skip' flag.
-            if seed_count == 0 and current.get_player() == player_id and current.get_type() == 'store':
-                print(f"player {player_id} take another turn")
-                return 'skip'
+    def get_position(self):
+        """Returns the current Position (seeds and player to move) of the board."""
+        return Position(self.get_seed_tuple(), self._to_move)
+
+    def set_position(self, position):
+        """Sets the seeds and player to move of the board from a Position.
+        Parameters:
+            position : Position object with the same number of pits as the board.
+        """
+        if position.get_num_pits() != self._num_pits:
+            raise ValueError(f"Position has {position.get_num_pits()} pits, board has {self._num_pits}.")
+        self.set_seed_list(position.get_seeds())
+        self._to_move = position.get_to_move()
+
+    def count_skips(self, pit_number, seed_count):
+        """Returns the number of times sowing seed_count seeds from a pit passes (and skips) the
+        opposing player's store."""
+        cycle = 2 * self._num_pits + 1
+        before = cycle - pit_number    # Containers sown before reaching the opposing store.
+        if seed_count <= before:
+            return 0
+        return (seed_count - before - 1) // cycle + 1
 
     def is_valid_pit(self, num):
         """Check if pit input number is valid."""
@@ -557,34 +756,703 @@ class Board:
             return False
         return True
 
+    def enable_stats(self, timing=False):
+        """Enables the instrumentation of the board, and returns its (new) BoardStats object.
 
-class Container:
-    """Container Class that can be used to represent a 'pit' or a 'store' for a given player.
+        The instrumented methods (see BoardStats.INSTRUMENTED) are replaced, on this board only,
+        by counting (and optionally timing) wrappers. The methods themselves are not changed, so
+        a board without instrumentation pays nothing for it.
 
-    We can chain several such containers to form a closed circuit to make a Mancala board,
-    such that given any one of the containers forming the board, one can traverse the
-    game board recursively.
+        Parameters:
+            timing : boolean representing whether to also time each instrumented method.
+        """
+        self.disable_stats()
+        self._stats = BoardStats(timing)
+        for name in BoardStats.INSTRUMENTED:
+            setattr(self, name, self._stats.wrap(self, name, getattr(type(self), name)))
+        return self._stats
+
+    def disable_stats(self):
+        """Disables the instrumentation of the board, restoring the plain methods."""
+        if self._stats is not None:
+            for name in BoardStats.INSTRUMENTED:
+                delattr(self, name)
+            self._stats = None
+
+    def get_legal_mask(self, player):
+        """Given the player id, returns the playable (non-empty) pits as a bitmask, where bit
+        (pit number - 1) is set if the pit can be played. Zero if the game is over."""
+        if self.is_game_over():
+            return 0
+        seeds = self._seeds
+        start = (player - 1) * (self._num_pits + 1)
+        mask = 0
+        for i in range(start + self._num_pits - 1, start - 1, -1):
+            mask = (mask << 1) | (seeds[i] > 0)
+        return mask
+
+    def get_legal_moves(self, player):
+        """Given the player id, returns the playable (non-empty) pit numbers as a tuple, in
+        increasing order. The tuples are shared (see legal_moves), so no list is built per call."""
+        return legal_moves(self.get_legal_mask(player))
+
+    def get_ordered_moves(self, player):
+        """Given the player id, returns the playable pit numbers as a tuple ordered for search:
+        moves earning another turn first, then captures (largest capture first), then the rest.
+        Computed from the seed counts alone, without playing the moves.
+
+        The landing of each move is read from the sowing table (see SowingTable). A move captures
+        if its last seed lands in one of the player's pits that is empty before the last seed:
+        this needs no full lap (a lap drops a seed in every pit first), and the pit to be empty or
+        to be the emptied pit played (when the move has exactly a lap of seeds).
+        """
+        num_pits = self._num_pits
+        cycle = 2 * num_pits + 1
+        sowing = self._topology.get_sowing()
+        landings, kinds = sowing.get_landings(), sowing.get_kinds()
+        own = self.get_pit_seeds(player)
+        opponent = None
+        extra, captures, rest = [], [], []
+        for pit in legal_moves(self.get_legal_mask(player)):
+            seeds = own[pit - 1]
+            remainder = (seeds - 1) % cycle + 1
+            kind = kinds[pit - 1][remainder]
+            landing = landings[pit - 1][remainder]
+            if kind == LANDS_STORE:
+                extra.append(pit)
+            elif kind == LANDS_OWN_PIT and seeds <= cycle and (own[landing] == 0 or landing == pit - 1):
+                if opponent is None:
+                    opponent = self.get_pit_seeds(3 - player)
+                captures.append((-opponent[num_pits - 1 - landing], pit))
+            else:
+                rest.append(pit)
+        if captures:
+            captures.sort()
+            extra.extend(pit for _, pit in captures)
+        return tuple(extra + rest)
+
+
+# Cache of the playable pit number tuples, keyed by bitmask (see legal_moves).
+_LEGAL_MOVES = {}
+
+
+def legal_moves(mask):
+    """Returns the pit numbers of the bits set in a bitmask (bit 0 is pit 1) as a tuple. The
+    tuples are cached, so the same tuple is returned for the same bitmask."""
+    moves = _LEGAL_MOVES.get(mask)
+    if moves is None:
+        moves = _LEGAL_MOVES[mask] = tuple(i + 1 for i in range(mask.bit_length()) if mask >> i & 1)
+    return moves
+
+
+# Cache of the precomputed (next, opposite, side) index tables, keyed by the number of pits.
+_CIRCUIT_TABLES = {}
+
+
+def circuit_tables(num_pits):
+    """Returns the precomputed (next, opposite, side) index tables for a flat board layout with
+    num_pits pits per player. The tables are shared by all BoardTopology objects of the same size.
+
+    Flat layout:
+        | p1 pits 1..num_pits | p1 store | p2 pits 1..num_pits | p2 store    |
+        | 0 .. num_pits-1     | num_pits | num_pits+1 .. 2n    | 2*num_pits+1|
+
+    Returns:
+        next     : tuple mapping each index to the next index counter-clockwise.
+        opposite : tuple mapping each pit index to the opposing pit index (-1 for the stores).
+        side     : tuple mapping each pit index to its player id (0 for the stores).
+    """
+    tables = _CIRCUIT_TABLES.get(num_pits)
+    if tables is None:
+        size = 2 * num_pits + 2
+        stores = (num_pits, size - 1)
+        nxt = tuple((i + 1) % size for i in range(size))
+        opposite = tuple(-1 if i in stores else 2 * num_pits - i for i in range(size))
+        side = tuple(0 if i in stores else 1 if i < num_pits else 2 for i in range(size))
+        tables = _CIRCUIT_TABLES[num_pits] = (nxt, opposite, side)
+    return tables
+
+
+# Where the last seed of a move lands, relative to the player moving (see SowingTable).
+LANDS_OPPONENT_PIT = 0
+LANDS_STORE = 1
+LANDS_OWN_PIT = 2
+
+# Cache of the precomputed SowingTable objects, keyed by the number of pits.
+_SOWING_TABLES = {}
+
+
+def sowing_table(num_pits):
+    """Returns the precomputed SowingTable for boards with num_pits pits per player. The tables
+    are shared by all Board objects of the same size."""
+    table = _SOWING_TABLES.get(num_pits)
+    if table is None:
+        table = _SOWING_TABLES[num_pits] = SowingTable(num_pits)
+    return table
+
+
+class SowingTable:
+    """SowingTable class representing the precomputed outcome of sowing from every pit, for
+    boards with a given number of pits per player.
+
+    A move from a pit with s seeds sows laps = (s - 1) // cycle full laps, one seed to each of the
+    cycle = 2 * num_pits + 1 containers other than the opposing store, then the remaining
+    1 <= remainder <= cycle seeds one at a time. Everything but the laps depends only on the pit
+    and the remainder, so the tables below, for every pit and every remainder (every seed count up
+    to one lap), give the outcome of a move with any number of seeds.
+
+    The tables are indexed [pit number - 1][remainder]. Positions relative to the player moving
+    count the player's pits 0 to num_pits - 1, then the player's store (num_pits), then the
+    opponent's pits. The containers sown by the remainder of a move from pit p are the relative
+    positions p + 1 to p + remainder, so they are read as a slice of the player's sowing order
+    rather than stored per move, and the tables grow with the square of the number of pits.
 
-    Each container has a player number/id, type (pit or store), number of seeds, and pointers
-    to the next or adjacent containers (if pit) in the circuit.
+    Attributes:
+        _num_pits       : integer representing the number of pits per player.
+        _landings       : table of the relative position of the container the last seed lands in.
+        _kinds          : table of where the last seed lands: LANDS_STORE (another turn),
+                            LANDS_OWN_PIT (a capture if the pit was empty) or LANDS_OPPONENT_PIT.
+        _own_gains      : table of the seeds the remainder sows into the player's pits.
+        _opponent_gains : table of the seeds the remainder sows into the opponent's pits.
+        _flat           : tuple (None, player 1 map, player 2 map) mapping relative positions to
+                            flat indices (Board layout).
+        _orders         : tuple (None, player 1 order, player 2 order) of the flat indices of the
+                            relative positions 0 to 2 * cycle - 1 (two laps), so the containers sown
+                            by any remainder are one slice.
+    """
+    __slots__ = ('_num_pits', '_landings', '_kinds', '_own_gains', '_opponent_gains', '_flat', '_orders')
+
+    def __init__(self, num_pits):
+        """Precomputes the tables for a number of pits per player."""
+        n = num_pits
+        cycle = 2 * n + 1
+        self._num_pits = n
+        # Relative position q is flat index q for player 1, and a side further for player 2.
+        self._flat = (None, tuple(range(cycle)), tuple((q + n + 1) % (cycle + 1) for q in range(cycle)))
+        self._orders = (None,) + tuple(flat + flat for flat in self._flat[1:])
+
+        # The seeds sown into each side by relative positions 0 to x - 1 (counting from the
+        # start of a lap), so the seeds sown by p + 1 to p + remainder are a difference.
+        def own(x):
+            return x // cycle * n + min(x % cycle, n)
+
+        def opponent(x):
+            return x // cycle * n + max(x % cycle - n - 1, 0)
+
+        remainders = range(cycle + 1)
+        self._landings = tuple(tuple((pit + r) % cycle for r in remainders) for pit in range(n))
+        self._kinds = tuple(tuple(LANDS_STORE if q == n else LANDS_OWN_PIT if q < n else LANDS_OPPONENT_PIT
+                                  for q in row) for row in self._landings)
+        self._own_gains = tuple(tuple(own(pit + r + 1) - own(pit + 1) for r in remainders) for pit in range(n))
+        self._opponent_gains = tuple(tuple(opponent(pit + r + 1) - opponent(pit + 1) for r in remainders)
+                                     for pit in range(n))
 
-    Collect the access pointers for the pits/stores in one place to provide easy access
-    and updating.
+    # Public getters
+    def get_num_pits(self):
+        """Returns the number of pits per player."""
+        return self._num_pits
+
+    def get_landings(self):
+        """Returns the table of the relative positions the last seed lands in."""
+        return self._landings
+
+    def get_kinds(self):
+        """Returns the table of where the last seed lands (LANDS_STORE, LANDS_OWN_PIT or
+        LANDS_OPPONENT_PIT)."""
+        return self._kinds
+
+    def get_own_gains(self):
+        """Returns the table of the seeds sown into the player's pits by the remainder."""
+        return self._own_gains
+
+    def get_opponent_gains(self):
+        """Returns the table of the seeds sown into the opponent's pits by the remainder."""
+        return self._opponent_gains
+
+    def get_flat(self, player):
+        """Returns the tuple mapping the relative positions of a player id to flat indices."""
+        return self._flat[player]
+
+    def get_order(self, player):
+        """Returns the flat indices of two laps of a player id's relative positions, so that
+        order[pit + 1:pit + 1 + remainder] are the containers sown by a remainder."""
+        return self._orders[player]
+
+    # Public methods
+    def play(self, seeds, player, pit_number):
+        """Plays a move in place on a flat seed list (Board layout), following the rules of
+        the game: the seeds of the pit are sown counter-clockwise, skipping the opposing player's
+        store, and a last seed landing in an empty pit of the player captures it and the seeds of
+        the opposing pit. Every move of the board, search and analysis code is played here. The
+        move must be valid, and the final tally is left to the caller.
+
+        Parameters:
+            seeds      : list of the 2 * num_pits + 2 seed counts, updated in place.
+            player     : integer representing the player id (1 or 2) to move.
+            pit_number : integer representing the player pit number (1 to num_pits).
+        Returns:
+            Tuple (flat index of the container the last seed landed in, landing kind, seeds
+            captured from the opposing pit or None if there was no capture, change in the seeds
+            of the player's pits, change in the seeds of the opponent's pits).
+        """
+        n = self._num_pits
+        row = pit_number - 1
+        own_store = player * (n + 1) - 1
+
+        # Pick up the seeds.
+        pit = own_store - n + row
+        seed_count = seeds[pit]
+        seeds[pit] = 0
+
+        # Sow any full laps in bulk. A lap visits every container except the opposing player's
+        # store, so each of them gets one seed per lap. At least one seed (up to a full lap) is
+        # always left over to be sown below, so the last seed rules still apply as usual.
+        laps, remainder = divmod(seed_count - 1, 2 * n + 1)
+        remainder += 1
+        if laps > 0:
+            for i in range(len(seeds)):
+                seeds[i] += laps
+            seeds[(own_store + n + 1) % len(seeds)] -= laps
+
+        # Sow the remaining seeds along the player's sowing order.
+        order = self._orders[player]
+        for index in order[pit_number:pit_number + remainder]:
+            seeds[index] += 1
+        own_change = laps * n + self._own_gains[row][remainder] - seed_count
+        opponent_change = laps * n + self._opponent_gains[row][remainder]
+        current = order[pit_number + remainder - 1]
+        kind = self._kinds[row][remainder]
+
+        # If the last seed fell in an empty pit of the player, move the seed and the opposing
+        # pit's seeds to the player store.
+        captured = None
+        if kind == LANDS_OWN_PIT and seeds[current] == 1:
+            adjacent = 2 * n - current
+            captured = seeds[adjacent]
+            seeds[own_store] += captured + 1
+            seeds[adjacent] = 0
+            seeds[current] = 0
+            own_change -= 1
+            opponent_change -= captured
+        return current, kind, captured, own_change, opponent_change
+
+
+# Cache of the shared BoardTopology objects, keyed by the number of pits.
+_TOPOLOGIES = {}
+
+
+def board_topology(num_pits):
+    """Returns the BoardTopology for boards with num_pits pits per player. The topologies are
+    shared by all Board objects of the same size."""
+    topology = _TOPOLOGIES.get(num_pits)
+    if topology is None:
+        topology = _TOPOLOGIES[num_pits] = BoardTopology(num_pits)
+    return topology
+
+
+class BoardTopology:
+    """BoardTopology class representing the immutable layout of a board with a given number of
+    pits per player: which container follows which, which pits are opposite each other, who
+    owns each container and whether it is a pit or a store, and where every move sows.
+
+    None of it depends on the seeds, so a single topology is shared by every board of the same
+    size (see board_topology), and a board only keeps its flat list of seed counts.
+
+    Attributes:
+        _num_pits : integer representing the number of pits per player.
+        _names    : tuple mapping each flat index to its (player id, container id), where the
+                      container id is a pit number or 'store'.
+        _next     : tuple mapping each flat index to the next index counter-clockwise.
+        _opposite : tuple mapping each pit index to the opposing pit index (-1 for the stores).
+        _side     : tuple mapping each pit index to its player id (0 for the stores).
+        _sowing   : SowingTable object of the board size.
+    """
+    __slots__ = ('_num_pits', '_names', '_next', '_opposite', '_side', '_sowing')
+
+    def __init__(self, num_pits):
+        """Initializes the topology for a number of pits per player."""
+        self._num_pits = num_pits
+        self._names = tuple((player, pit) for player in (1, 2)
+                            for pit in list(range(1, num_pits + 1)) + ['store'])
+        self._next, self._opposite, self._side = circuit_tables(num_pits)
+        self._sowing = sowing_table(num_pits)
+
+    # Public getters
+    def get_num_pits(self):
+        """Returns the number of pits per player."""
+        return self._num_pits
+
+    def get_size(self):
+        """Returns the number of containers (pits and stores) on the board."""
+        return len(self._names)
+
+    def get_name(self, index):
+        """Given a flat index, returns the (player id, container id) it represents."""
+        return self._names[index]
+
+    def get_next(self):
+        """Returns the tuple mapping each flat index to the next index counter-clockwise."""
+        return self._next
+
+    def get_opposite(self):
+        """Returns the tuple mapping each pit index to the opposing pit index (-1 for the stores)."""
+        return self._opposite
+
+    def get_side(self):
+        """Returns the tuple mapping each pit index to its player id (0 for the stores)."""
+        return self._side
+
+    def get_sowing(self):
+        """Returns the SowingTable of the board size."""
+        return self._sowing
+
+    # Public methods
+    def build_view(self, seeds, totals):
+        """Builds the closed circuit of Containers over a board's seed counts, and returns the
+        board dictionary/ common access interface (see Board.get_board). The containers read
+        and write the counts in the list, rather than keeping seeds of their own, and keep the
+        board's running pit totals up to date.
+        Parameters:
+            seeds  : list of integers representing the seeds of the board (flat layout).
+            totals : list of the board's running pit totals [0, player 1, player 2].
+        """
+        # Create a container for every pit and store.
+        containers = []
+        for index, (player, container_id) in enumerate(self._names):
+            container_type = 'store' if container_id == 'store' else 'pit'
+            containers.append(ContainerView(container_id, player, container_type, seeds, totals, index))
+
+        # Link the containers into the closed circuit, and link the opposing pits.
+        for index, container in enumerate(containers):
+            container.set_next(containers[self._next[index]])
+            if self._opposite[index] >= 0:
+                container.set_adjacent(containers[self._opposite[index]])
+
+        # Group the containers by player id and container id.
+        view = {1: {}, 2: {}}
+        for container in containers:
+            view[container.get_player()][container.get_id()] = container
+        return view
+
+
+# ArrayBoard is the former name of the flat seed array board, and is the same class as Board.
+ArrayBoard = Board
+
+
+class MoveResult:
+    """MoveResult class representing the outcome of a single move, as returned by
+    Board.apply_move.
+
+    Attributes:
+        _player     : integer representing the player id (1 or 2) that moved.
+        _pit        : integer representing the pit number that was played.
+        _landing    : tuple (player id, container id) of the container the last seed landed in,
+                        where the container id is a pit number or 'store'.
+        _captured   : integer representing the seeds captured from the opposing pit, or None
+                        if there was no capture.
+        _extra_turn : boolean representing whether the player gets another turn.
+        _game_over  : boolean representing whether the game is over after the move.
+    """
+    __slots__ = ('_player', '_pit', '_landing', '_captured', '_extra_turn', '_game_over')
+
+    def __init__(self, player, pit, landing, captured, extra_turn, game_over):
+        """Initializes a move result."""
+        self._player = player
+        self._pit = pit
+        self._landing = landing
+        self._captured = captured
+        self._extra_turn = extra_turn
+        self._game_over = game_over
+
+    def __repr__(self):
+        return (f"MoveResult(player={self._player}, pit={self._pit}, landing={self._landing}, "
+                f"captured={self._captured}, extra_turn={self._extra_turn}, game_over={self._game_over})")
+
+    # Public getters
+    def get_player(self):
+        """Returns the player id that moved."""
+        return self._player
+
+    def get_pit(self):
+        """Returns the pit number that was played."""
+        return self._pit
+
+    def get_landing(self):
+        """Returns the (player id, container id) of the container the last seed landed in."""
+        return self._landing
+
+    def is_capture(self):
+        """Returns whether the last seed captured the opposing pit."""
+        return self._captured is not None
+
+    def get_captured_seeds(self):
+        """Returns the number of seeds taken from the opposing pit (0 if there was no capture)."""
+        return self._captured or 0
+
+    def is_extra_turn(self):
+        """Returns whether the player gets another turn."""
+        return self._extra_turn
+
+    def is_game_over(self):
+        """Returns whether the game is over after the move."""
+        return self._game_over
+
+
+class BoardStats:
+    """BoardStats class representing the instrumentation counters of a board, and optionally the
+    time spent in each instrumented method. Created by Board.enable_stats.
+
+    Counters:
+        moves                : valid moves played (apply_move, and so play_turn and make_move).
+        invalid_moves        : moves rejected as invalid.
+        seeds_sown           : seeds picked up and sown by the moves.
+        containers_traversed : containers the sowing passed, including the skipped opposing stores.
+        captures             : moves that captured.
+        captured_seeds       : seeds taken from the opposing pits by the captures.
+        extra_turns          : moves that earned another turn.
+        game_over_checks     : calls of is_game_over.
+        final_tallies        : calls of final_tally.
+        displays             : calls of print_board and print_fancy_board.
+
+    Attributes:
+        _counters : dictionary mapping the counter names to integers.
+        _timing   : boolean representing whether the instrumented methods are timed.
+        _times    : dictionary mapping the instrumented method names to the seconds spent in them
+                      (including any instrumented methods they call).
+    """
+    # Board methods replaced by counting wrappers while instrumentation is enabled.
+    INSTRUMENTED = ('apply_move', 'is_game_over', 'final_tally', 'print_board', 'print_fancy_board')
+    COUNTERS = ('moves', 'invalid_moves', 'seeds_sown', 'containers_traversed', 'captures', 'captured_seeds',
+                'extra_turns', 'game_over_checks', 'final_tallies', 'displays')
+
+    def __init__(self, timing=False):
+        """Initializes zero counters."""
+        self._timing = timing
+        self._counters = dict.fromkeys(self.COUNTERS, 0)
+        self._times = dict.fromkeys(self.INSTRUMENTED, 0.0)
+
+    def __repr__(self):
+        return f"BoardStats({self._counters})"
+
+    # Public getters
+    def get_counters(self):
+        """Returns a copy of the dictionary of counters."""
+        return dict(self._counters)
+
+    def get_times(self):
+        """Returns a copy of the dictionary of seconds spent per instrumented method (all zero
+        unless timing is enabled)."""
+        return dict(self._times)
+
+    def is_timing(self):
+        """Returns whether the instrumented methods are timed."""
+        return self._timing
+
+    # Public methods
+    def reset(self):
+        """Resets the counters and times to zero."""
+        self._counters = dict.fromkeys(self.COUNTERS, 0)
+        self._times = dict.fromkeys(self.INSTRUMENTED, 0.0)
+
+    def merge(self, other):
+        """Adds the counters and times of another BoardStats object (e.g. from another board)."""
+        for name, value in other._counters.items():
+            self._counters[name] += value
+        for name, value in other._times.items():
+            self._times[name] += value
+
+    def format_stats(self):
+        """Returns the counters (and times, if timing) as lines of text."""
+        lines = [f"{name:<22} {value}" for name, value in self._counters.items()]
+        if self._timing:
+            lines += [f"{name + ' (s)':<22} {seconds:.6f}" for name, seconds in self._times.items()]
+        return "\n".join(lines)
+
+    def wrap(self, board, name, method):
+        """Returns a wrapper of an instrumented board method, bound to the board, that updates the
+        counters (and times the call if timing is enabled)."""
+        counters, times = self._counters, self._times
+        counter = {'is_game_over': 'game_over_checks', 'final_tally': 'final_tallies'}.get(name, 'displays')
+
+        if name == 'apply_move':
+            def call(player_id, pit_number):
+                seeds = 0
+                if player_id in (1, 2) and board.is_valid_pit(pit_number):
+                    seeds = board.get_seeds(player_id, pit_number)
+                try:
+                    result = method(board, player_id, pit_number)
+                except ValueError:
+                    counters['invalid_moves'] += 1
+                    raise
+                counters['moves'] += 1
+                counters['seeds_sown'] += seeds
+                counters['containers_traversed'] += seeds + board.count_skips(pit_number, seeds)
+                if result.is_capture():
+                    counters['captures'] += 1
+                    counters['captured_seeds'] += result.get_captured_seeds()
+                if result.is_extra_turn():
+                    counters['extra_turns'] += 1
+                return result
+        else:
+            def call(*args):
+                counters[counter] += 1
+                return method(board, *args)
+
+        if not self._timing:
+            return call
+
+        def timed(*args):
+            start = time.perf_counter()
+            try:
+                return call(*args)
+            finally:
+                times[name] += time.perf_counter() - start
+        return timed
+
+
+class Position:
+    """Position class representing a compact, hashable board position: the seeds in every pit
+    and store, and the player to move. Positions compare equal, and hash the same, if and only
+    if the seeds and player to move are the same, so they can be used as keys for caches,
+    transposition tables and on-disk databases.
+
+    The position is packed into a single bytes key (see get_key):
+        byte 0   : the player to move (1 or 2), plus 0x80 if the counts are packed as 16 bits.
+        byte 1.. : the seed counts in the same order as Board.get_seed_list, one byte each, or
+                    two bytes each (little-endian) if any count is 256 or more.
+
+    The board is symmetric between the players: a position with player 2 to move plays exactly
+    as its mirror (the two sides and stores swapped) with player 1 to move. The canonical form
+    of a position is the one with player 1 to move, so a table keyed by canonical positions
+    stores each position once. Moves are pit numbers of the player to move, so they are the
+    same in both forms, as are scores from the point of view of the player to move; scores from
+    player 1's point of view are negated (see from_canonical_score).
+
+    Attributes:
+        _key : bytes representing the packed position.
+    """
+    __slots__ = ('_key',)
+
+    def __init__(self, seeds, to_move=1):
+        """Initializes a position.
+        Parameters:
+            seeds   : sequence of integers representing the seeds in every pit and store, in
+                        the same order as Board.get_seed_list.
+            to_move : integer representing the player id (1 or 2) to move.
+        """
+        if max(seeds) < 256:
+            self._key = bytes((to_move,)) + bytes(seeds)
+        else:
+            self._key = bytes((to_move | 0x80,)) + struct.pack(f"<{len(seeds)}H", *seeds)
+
+    @classmethod
+    def from_key(cls, key):
+        """Returns the position packed into a key returned by get_key."""
+        position = cls.__new__(cls)
+        position._key = bytes(key)
+        return position
+
+    @classmethod
+    def from_board(cls, board, to_move=None):
+        """Returns the position of a board.
+        Parameters:
+            board   : Board object.
+            to_move : integer representing the player id (1 or 2) to move. Defaults to the
+                        board's player to move.
+        """
+        if to_move is None:
+            to_move = board.get_to_move()
+        return cls(board.get_seed_tuple(), to_move)
+
+    def __eq__(self, other):
+        return isinstance(other, Position) and self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __repr__(self):
+        return f"Position({list(self.get_seeds())}, to_move={self.get_to_move()})"
+
+    # Public getters
+    def get_key(self):
+        """Returns the packed bytes key of the position."""
+        return self._key
+
+    def get_to_move(self):
+        """Returns the player id (1 or 2) to move."""
+        return self._key[0] & 0x7f
+
+    def get_seeds(self):
+        """Returns the seeds in every pit and store as a tuple, in the same order as
+        Board.get_seed_list."""
+        if self._key[0] & 0x80:
+            return struct.unpack(f"<{(len(self._key) - 1) // 2}H", self._key[1:])
+        return tuple(self._key[1:])
+
+    def get_num_pits(self):
+        """Returns the number of pits per player."""
+        size = len(self._key) - 1
+        if self._key[0] & 0x80:
+            size //= 2
+        return size // 2 - 1
+
+    def is_canonical(self):
+        """Returns whether the position is in canonical form (player 1 to move)."""
+        return self._key[0] & 0x7f == 1
+
+    # Public methods
+    def mirror(self):
+        """Returns the mirror of the position: the two sides (pits and store) swapped, and the
+        other player to move. The mirror of the mirror is the position itself."""
+        key = self._key
+        half = (len(key) - 1) // 2
+        return Position.from_key(bytes((key[0] ^ 3,)) + key[1 + half:] + key[1:1 + half])
+
+    def canonical(self):
+        """Returns the canonical form of the position: the position itself if player 1 is to
+        move, otherwise its mirror."""
+        return self if self._key[0] & 0x7f == 1 else self.mirror()
+
+    def from_canonical_score(self, score):
+        """Returns a score from player 1's point of view of the canonical form of the position
+        (e.g. player 1's margin) as the same score of this position: negated if player 2 is to
+        move. Applying it twice gives the score back."""
+        return score if self._key[0] & 0x7f == 1 else -score
+
+    def to_board(self, board_class=None):
+        """Returns a new board set to the position, with the player to move set.
+        Parameters:
+            board_class : Board class to create (defaults to Board). The initial number of
+                            seeds per pit is taken as the seeds in play divided by the pits.
+        """
+        if board_class is None:
+            board_class = Board
+        seeds = self.get_seeds()
+        num_pits = self.get_num_pits()
+        board = board_class(num_pits, sum(seeds) // (2 * num_pits))
+        board.set_position(self)
+        return board
+
+
+class ContainerBase:
+    """ContainerBase class holding what every pit or store of the circuit has, whether it stores
+    its own seeds (Container) or views a board's seed counts (ContainerView): its ids, type, and
+    pointers to the next and adjacent containers.
 
     Attributes:
         _id         : integer/string representing unique container id.
         _player     : integer/string representing unique player id.
         _type       : string representing container type ('pit' or 'store').
-        _seeds      : integer representing the number of seeds currently stored.
-        _next       : Container object representing the next container moving counter-clockwise.
-        _adjacent   : Container object representing adjacent (opposing players) pit.
+        _next       : container object representing the next container moving counter-clockwise.
+        _adjacent   : container object representing adjacent (opposing players) pit.
     """
+    __slots__ = ('_id', '_player', '_type', '_next', '_adjacent')
+
     def __init__(self, container_id, player_id, container_type):
         """Initializes a container."""
         self._id = container_id
         self._player = player_id
         self._type = container_type
-        self._seeds = 0
         self._next = None
         self._adjacent = None
 
@@ -601,10 +1469,6 @@ class Container:
         """Returns the container type."""
         return self._type
 
-    def get_seeds(self):
-        """Returns the number of seeds."""
-        return self._seeds
-
     def get_next(self):
         """Returns the next container."""
         return self._next
@@ -614,14 +1478,6 @@ class Container:
         return self._adjacent
 
     # Public setters
-    def set_seeds(self, num):
-        """Sets the number of seeds."""
-        self._seeds = num
-
-    def add_seeds(self, num):
-        """Adds the number of seeds to existing."""
-        self._seeds = self._seeds + num
-
     def set_next(self, nxt):
         """Sets the next node."""
         self._next = nxt
@@ -630,6 +1486,45 @@ class Container:
         """Sets the adjacent node."""
         self._adjacent = adj
 
+
+class Container(ContainerBase):
+    """Container Class that can be used to represent a 'pit' or a 'store' for a given player.
+
+    We can chain several such containers to form a closed circuit to make a Mancala board,
+    such that given any one of the containers forming the board, one can traverse the
+    game board recursively.
+
+    Each container has a player number/id, type (pit or store), number of seeds, and pointers
+    to the next or adjacent containers (if pit) in the circuit.
+
+    Collect the access pointers for the pits/stores in one place to provide easy access
+    and updating.
+
+    Attributes:
+        _seeds      : integer representing the number of seeds currently stored.
+        (and the ids, type and pointers of ContainerBase)
+    """
+    __slots__ = ('_seeds',)
+
+    def __init__(self, container_id, player_id, container_type):
+        """Initializes a container."""
+        super().__init__(container_id, player_id, container_type)
+        self._seeds = 0
+
+    # Public getters
+    def get_seeds(self):
+        """Returns the number of seeds."""
+        return self._seeds
+
+    # Public setters
+    def set_seeds(self, num):
+        """Sets the number of seeds."""
+        self._seeds = num
+
+    def add_seeds(self, num):
+        """Adds the number of seeds to existing."""
+        self._seeds = self._seeds + num
+
     # Public methods
     def clear_seeds(self):
         """Removes all the seeds currently stored."""
@@ -640,6 +1535,57 @@ class Container:
         self._seeds += 1
 
 
+class ContainerView(ContainerBase):
+    """ContainerView class representing a pit or store of a Board, as returned by
+    Board.get_board. Rather than storing seeds of its own, a view reads and writes the count
+    at its index in the board's flat list of seed counts, so it always shows the board's seeds.
+    Changing the seeds of a pit also updates the board's running pit totals, so game over and
+    winner checks see the change.
+
+    Attributes:
+        _counts : list of integers representing the seeds of the board (flat layout).
+        _totals : list of the board's running pit totals [0, player 1, player 2].
+        _index  : integer representing the flat index of the container.
+    """
+    __slots__ = ('_counts', '_totals', '_index')
+
+    def __init__(self, container_id, player_id, container_type, counts, totals, index):
+        """Initializes a container view."""
+        super().__init__(container_id, player_id, container_type)
+        self._counts = counts
+        self._totals = totals
+        self._index = index
+
+    # Public getters
+    def get_index(self):
+        """Returns the flat index of the container."""
+        return self._index
+
+    def get_seeds(self):
+        """Returns the number of seeds."""
+        return self._counts[self._index]
+
+    # Public setters
+    def set_seeds(self, num):
+        """Sets the number of seeds."""
+        self.add_seeds(num - self._counts[self._index])
+
+    def add_seeds(self, num):
+        """Adds the number of seeds to existing."""
+        self._counts[self._index] += num
+        if self._type == 'pit':
+            self._totals[self._player] += num
+
+    # Public methods
+    def clear_seeds(self):
+        """Removes all the seeds currently stored."""
+        self.add_seeds(-self._counts[self._index])
+
+    def increment_seeds(self):
+        """Increments the number of seeds stored in the container by 1."""
+        self.add_seeds(1)
+
+
 def demo_1():
     """Example 1 from README.md.
     Expected Output:
@@ -0,0 +1,348 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 20:15
+# Description: Implements a streaming statistics aggregator over archives of recorded Mancala games.
+#
+# The module implements the following classes:
+#   HeavyHitters - HeavyHitters class representing a bounded-memory summary of the most frequent keys.
+#   ArchiveStats - ArchiveStats class that aggregates per-configuration, per-pit and per-position statistics.
+#
+# Games are read one at a time from game record files (see MancalaRecord), and replayed through the board rules, so
+# archives never need to fit in memory. The statistics are broken down by board configuration (num_pits, num_seeds):
+#   games       - games, games with an invalid move (left out of every other statistic), unfinished games, wins of
+#                   each player and ties, moves, extra turns and captures.
+#   pits        - for each pit number (counted for the player moving): how often it is chosen as the opening move
+#                   and player 1's win rate after it, and the moves, captures and extra turns played from it.
+#   positions   - the most frequent positions reached, in canonical form (see Mancala.Position.canonical).
+# Records that cannot be read at all (such as a malformed text line) are skipped, and only counted as unreadable.
+#
+# The counters take memory in proportion to the configurations and pits only. The frequent positions are kept by a
+# Misra-Gries summary of a fixed number of positions per configuration: any position seen more than
+# 1 / (capacity + 1) of the time is kept, and its count is low by at most get_error(). Statistics of separate shards
+# of an archive can be merged (ArchiveStats.merge), and the summaries stay within the same bounds when merged.
+#
+# To aggregate an archive of record files, one shard per worker process, simply call:
+#       python MancalaAggregator.py games-*.bin --processes 4 --top 10
+
+import argparse
+import multiprocessing
+
+import Mancala
+import MancalaRecord
+
+
+class HeavyHitters:
+    """HeavyHitters class representing a Misra-Gries summary of the most frequent keys of a
+    stream, in memory bounded by a fixed number of counters.
+
+    Each key is counted while there is room; when a new key arrives with every counter taken,
+    every counter is decremented instead (and those reaching zero dropped). A key seen more than
+    total / (capacity + 1) times is always kept, and each kept count is at most get_error() below
+    the true count.
+
+    Attributes:
+        _capacity : integer representing the maximum number of counters.
+        _counts   : dictionary mapping keys to their (lower bound) counts.
+        _total    : integer representing the number of keys added.
+        _error    : integer representing the most any count can be below the true count.
+    """
+    __slots__ = ('_capacity', '_counts', '_total', '_error')
+
+    def __init__(self, capacity=1000):
+        """Initializes an empty summary with a number of counters."""
+        self._capacity = capacity
+        self._counts = {}
+        self._total = 0
+        self._error = 0
+
+    # Public getters
+    def get_capacity(self):
+        """Returns the maximum number of counters."""
+        return self._capacity
+
+    def get_total(self):
+        """Returns the number of keys added."""
+        return self._total
+
+    def get_error(self):
+        """Returns the most any count can be below the true count of its key."""
+        return self._error
+
+    def get_top(self, n=10):
+        """Returns the n keys with the highest counts, as a list of (key, count) tuples, highest
+        first. The counts are lower bounds (see get_error)."""
+        return sorted(self._counts.items(), key=lambda item: -item[1])[:n]
+
+    # Public methods
+    def add(self, key):
+        """Counts one occurrence of a key."""
+        self._total += 1
+        counts = self._counts
+        if key in counts:
+            counts[key] += 1
+        elif len(counts) < self._capacity:
+            counts[key] = 1
+        else:
+            # Decrement every counter, dropping those reaching zero.
+            self._error += 1
+            for other in list(counts):
+                if counts[other] == 1:
+                    del counts[other]
+                else:
+                    counts[other] -= 1
+
+    def merge(self, other):
+        """Adds the counts of another summary with the same capacity (e.g. from another shard).
+        The counts are added, then, if there are too many, the (capacity + 1)-th highest count is
+        taken off every counter, which keeps the same guarantees as a single summary."""
+        counts = self._counts
+        for key, count in other._counts.items():
+            counts[key] = counts.get(key, 0) + count
+        self._total += other._total
+        self._error += other._error
+        if len(counts) > self._capacity:
+            cut = sorted(counts.values(), reverse=True)[self._capacity]
+            self._counts = {key: count - cut for key, count in counts.items() if count > cut}
+            self._error += cut
+
+
+class ArchiveStats:
+    """ArchiveStats class that aggregates statistics of recorded games one game at a time.
+
+    Attributes:
+        _capacity   : integer representing the number of positions kept per configuration.
+        _games      : integer representing the number of games added.
+        _unreadable : integer representing the number of records that could not be read.
+        _configs   : dictionary mapping (num_pits, num_seeds) to a list of totals [games,
+                      invalid, unfinished, player 1 wins, player 2 wins, ties, moves, extra turns,
+                      captures].
+        _pits      : dictionary mapping (num_pits, num_seeds, pit number) to a list of totals
+                      [openings, finished openings, player 1 wins after them, ties after them,
+                      moves, extra turns, captures].
+        _positions : dictionary mapping (num_pits, num_seeds) to a HeavyHitters summary of the
+                      canonical position keys reached.
+    """
+    def __init__(self, capacity=1000):
+        """Initializes empty statistics, keeping up to `capacity` positions per configuration."""
+        self._capacity = capacity
+        self._games = 0
+        self._unreadable = 0
+        self._configs = {}
+        self._pits = {}
+        self._positions = {}
+
+    def get_games(self):
+        """Returns the number of games added."""
+        return self._games
+
+    def get_unreadable(self):
+        """Returns the number of records that could not be read."""
+        return self._unreadable
+
+    def add_unreadable(self, count=1):
+        """Counts records that could not be read (see MancalaRecord.read_records)."""
+        self._unreadable += count
+
+    def add(self, record):
+        """Replays a MancalaRecord.GameRecord through the board rules, and adds its statistics.
+        A game with an invalid move (or a move out of turn) is only counted as invalid.
+        Returns:
+            Boolean representing whether the game was valid.
+        """
+        num_pits, num_seeds = record.get_num_pits(), record.get_num_seeds()
+        config = (num_pits, num_seeds)
+        totals = self._configs.setdefault(config, [0] * 9)
+        self._games += 1
+        totals[0] += 1
+
+        # Replay the moves, keeping what each move did until the game is known to be valid.
+        board = Mancala.Board(num_pits, num_seeds)
+        game = Mancala.Mancala(board)
+        to_move, moves, positions = 1, [], []
+        for player, pit in record.get_moves():
+            if player != to_move:
+                totals[1] += 1
+                return False
+            try:
+                result = game.apply_move(player, pit)
+            except ValueError:
+                totals[1] += 1
+                return False
+            to_move = player if result.is_extra_turn() else 3 - player
+            moves.append((pit, result.is_extra_turn(), result.is_capture()))
+            if not result.is_game_over():
+                positions.append(Mancala.Position(board.get_seed_tuple(), to_move).canonical().get_key())
+
+        # Add the outcome of the game.
+        winner = board.return_winner()
+        if winner is None:
+            totals[2] += 1
+        else:
+            totals[(5, 3, 4)[winner]] += 1
+        totals[6] += len(moves)
+
+        # Add the opening, and the moves played from each pit.
+        for number, (pit, extra_turn, capture) in enumerate(moves):
+            pit_totals = self._pits.setdefault((num_pits, num_seeds, pit), [0] * 7)
+            if number == 0:
+                pit_totals[0] += 1
+                if winner is not None:
+                    pit_totals[1] += 1
+                    pit_totals[2] += winner == 1
+                    pit_totals[3] += winner == 0
+            pit_totals[4] += 1
+            pit_totals[5] += extra_turn
+            pit_totals[6] += capture
+            totals[7] += extra_turn
+            totals[8] += capture
+
+        # Add the positions reached.
+        summary = self._positions.get(config)
+        if summary is None:
+            summary = self._positions[config] = HeavyHitters(self._capacity)
+        for key in positions:
+            summary.add(key)
+        return True
+
+    def merge(self, other):
+        """Adds the statistics of another ArchiveStats object (e.g. from another shard)."""
+        self._games += other._games
+        self._unreadable += other._unreadable
+        for table, other_table in ((self._configs, other._configs), (self._pits, other._pits)):
+            for key, totals in other_table.items():
+                mine = table.setdefault(key, [0] * len(totals))
+                for i, value in enumerate(totals):
+                    mine[i] += value
+        for config, summary in other._positions.items():
+            self._positions.setdefault(config, HeavyHitters(self._capacity)).merge(summary)
+
+    def get_table(self):
+        """Returns a list of dictionaries, one per configuration, sorted by configuration:
+            num_pits, num_seeds, games, invalid, unfinished, player_1_wins, player_2_wins, ties,
+            mean_length, extra_turn_rate, capture_rate.
+        Rates are per move, and the mean length is over the valid games."""
+        rows = []
+        for (num_pits, num_seeds), totals in sorted(self._configs.items()):
+            games, invalid, unfinished, wins_1, wins_2, ties, moves, extra_turns, captures = totals
+            rows.append({
+                'num_pits': num_pits, 'num_seeds': num_seeds, 'games': games, 'invalid': invalid,
+                'unfinished': unfinished, 'player_1_wins': wins_1, 'player_2_wins': wins_2, 'ties': ties,
+                'mean_length': moves / max(games - invalid, 1),
+                'extra_turn_rate': extra_turns / max(moves, 1),
+                'capture_rate': captures / max(moves, 1),
+            })
+        return rows
+
+    def get_pit_table(self):
+        """Returns a list of dictionaries, one per configuration and pit number, sorted:
+            num_pits, num_seeds, pit, openings, opening_rate, opening_win_rate, moves, move_rate,
+            extra_turn_rate, capture_rate.
+        The opening win rate is player 1's (ties counting half) over the finished games opened
+        from the pit, and the move rate is the share of the configuration's moves."""
+        rows = []
+        for (num_pits, num_seeds, pit), totals in sorted(self._pits.items()):
+            openings, finished, wins, ties, moves, extra_turns, captures = totals
+            config = self._configs[(num_pits, num_seeds)]
+            rows.append({
+                'num_pits': num_pits, 'num_seeds': num_seeds, 'pit': pit, 'openings': openings,
+                'opening_rate': openings / max(config[0] - config[1], 1),
+                'opening_win_rate': (wins + 0.5 * ties) / finished if finished else None,
+                'moves': moves, 'move_rate': moves / max(config[6], 1),
+                'extra_turn_rate': extra_turns / moves, 'capture_rate': captures / moves,
+            })
+        return rows
+
+    def get_positions(self, n=10):
+        """Returns a dictionary mapping (num_pits, num_seeds) to a list of up to n
+        (Mancala.Position, count) tuples of the most frequent canonical positions, where the
+        counts are lower bounds (see HeavyHitters)."""
+        return {config: [(Mancala.Position.from_key(key), count) for key, count in summary.get_top(n)]
+                for config, summary in sorted(self._positions.items())}
+
+    def format_table(self, top=10):
+        """Returns the statistics as text tables, with the `top` most frequent positions of each
+        configuration."""
+        lines = [f"{'config':>7} {'games':>8} {'invalid':>7} {'unfin':>6} {'p1 win%':>7} {'p2 win%':>7} "
+                 f"{'tie%':>5} {'length':>6} {'extra%':>6} {'capt%':>5}"]
+        for row in self.get_table():
+            finished = max(row['games'] - row['invalid'] - row['unfinished'], 1)
+            lines.append(f"{row['num_pits']:>4}x{row['num_seeds']:<2} {row['games']:>8} {row['invalid']:>7} "
+                         f"{row['unfinished']:>6} {100 * row['player_1_wins'] / finished:>7.1f} "
+                         f"{100 * row['player_2_wins'] / finished:>7.1f} {100 * row['ties'] / finished:>5.1f} "
+                         f"{row['mean_length']:>6.1f} {100 * row['extra_turn_rate']:>6.1f} "
+                         f"{100 * row['capture_rate']:>5.1f}")
+        if self._unreadable:
+            lines.append(f"{self._unreadable} unreadable records skipped")
+
+        lines += ["", f"{'config':>7} {'pit':>3} {'open%':>6} {'win%':>6} {'moves%':>6} {'extra%':>6} {'capt%':>5}"]
+        for row in self.get_pit_table():
+            win_rate = "-" if row['opening_win_rate'] is None else f"{100 * row['opening_win_rate']:.1f}"
+            lines.append(f"{row['num_pits']:>4}x{row['num_seeds']:<2} {row['pit']:>3} "
+                         f"{100 * row['opening_rate']:>6.1f} {win_rate:>6} {100 * row['move_rate']:>6.1f} "
+                         f"{100 * row['extra_turn_rate']:>6.1f} {100 * row['capture_rate']:>5.1f}")
+
+        for (num_pits, num_seeds), positions in self.get_positions(top).items():
+            error = self._positions[(num_pits, num_seeds)].get_error()
+            lines += ["", f"{num_pits}x{num_seeds} most frequent positions (player 1 to move, counts up to "
+                          f"{error} low):"]
+            for position, count in positions:
+                seeds = position.get_seeds()
+                lines.append(f"{count:>8}  {list(seeds[:num_pits])} {seeds[num_pits]} | "
+                             f"{list(seeds[num_pits + 1:-1])} {seeds[-1]}")
+        return "\n".join(lines)
+
+
+def aggregate(records, capacity=1000):
+    """Returns the ArchiveStats of an iterable of GameRecord objects (e.g. read_records)."""
+    stats = ArchiveStats(capacity)
+    for record in records:
+        stats.add(record)
+    return stats
+
+
+def _aggregate_task(task):
+    """Pool task: aggregates one record file (shard)."""
+    path, capacity = task
+    errors = []
+    stats = aggregate(MancalaRecord.read_records(path, errors), capacity)
+    stats.add_unreadable(len(errors))
+    return stats
+
+
+def aggregate_files(paths, capacity=1000, processes=None):
+    """Aggregates record files, one file (shard) per task, and returns the merged ArchiveStats.
+    Parameters:
+        paths     : list of paths of binary or text game record files.
+        capacity  : integer representing the number of positions kept per configuration.
+        processes : integer representing the number of worker processes (1 to aggregate
+                     in-process, None for one per CPU core).
+    """
+    tasks = [(path, capacity) for path in paths]
+    stats = ArchiveStats(capacity)
+    if processes == 1:
+        for task in tasks:
+            stats.merge(_aggregate_task(task))
+        return stats
+
+    with multiprocessing.Pool(processes) as pool:
+        for shard in pool.imap_unordered(_aggregate_task, tasks):
+            stats.merge(shard)
+    return stats
+
+
+def main():
+    """Aggregates game record files from the command line, and prints the summary tables."""
+    parser = argparse.ArgumentParser(description="Aggregates statistics over Mancala game record files.")
+    parser.add_argument("paths", nargs="+", help="binary or text game record files, one shard each")
+    parser.add_argument("--capacity", type=int, default=1000, help="positions kept per configuration")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: CPU cores)")
+    parser.add_argument("--top", type=int, default=10, help="most frequent positions shown per configuration")
+    args = parser.parse_args()
+
+    stats = aggregate_files(args.paths, args.capacity, args.processes)
+    print(stats.format_table(args.top))
+
+
+if __name__ == "__main__":
+    main()
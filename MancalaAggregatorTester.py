@@ -0,0 +1,120 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 20:15
+# Description: Unit tests for MancalaAggregator.py.
+
+import collections
+import os
+import random
+import tempfile
+import unittest
+import Mancala
+import MancalaAggregator
+import MancalaRecord
+
+
+def random_records(count, seed, configs=((6, 4), (3, 2))):
+    """Returns a list of GameRecord objects of random games."""
+    rng = random.Random(seed)
+    records = []
+    for index in range(count):
+        num_pits, num_seeds = configs[index % len(configs)]
+        board = Mancala.Board(num_pits, num_seeds)
+        player, moves = 1, []
+        while not board.is_game_over():
+            pit = rng.choice(board.get_legal_moves(player))
+            moves.append((player, pit))
+            if not board.apply_move(player, pit).is_extra_turn():
+                player = 3 - player
+        records.append(MancalaRecord.GameRecord(num_pits, num_seeds, ("a", "b"), moves))
+    return records
+
+
+class HeavyHittersTester(unittest.TestCase):
+    """Unit tests for HeavyHitters class."""
+
+    def test_bounds(self):
+        """Should keep every frequent key, with counts at most get_error() low, alone or merged."""
+        rng = random.Random(1)
+        stream = [rng.choice("abc") if rng.random() < 0.5 else rng.randrange(1000) for _ in range(5000)]
+        true_counts = collections.Counter(stream)
+        whole, first, second = (MancalaAggregator.HeavyHitters(20) for _ in range(3))
+        for i, key in enumerate(stream):
+            whole.add(key)
+            (first if i % 2 else second).add(key)
+        first.merge(second)
+        for summary in (whole, first):
+            self.assertEqual(summary.get_total(), 5000)
+            self.assertLessEqual(summary.get_error(), 5000 // 21)
+            top = dict(summary.get_top(3))
+            self.assertEqual(set(top), {"a", "b", "c"})
+            for key, count in top.items():
+                self.assertLessEqual(count, true_counts[key])
+                self.assertGreaterEqual(count, true_counts[key] - summary.get_error())
+            self.assertLessEqual(len(summary.get_top(100)), 20)
+
+
+class ArchiveStatsTester(unittest.TestCase):
+    """Unit tests for ArchiveStats class."""
+
+    def test_counts(self):
+        """Should count the games, moves, openings, extra turns and captures of each configuration."""
+        stats = MancalaAggregator.ArchiveStats()
+        # 2 pits, 1 seed: 1:2 sows into the store (extra turn), then 1:1 captures and ends the game.
+        self.assertTrue(stats.add(MancalaRecord.GameRecord(2, 1, ("a", "b"), [(1, 2), (1, 1)])))
+        self.assertFalse(stats.add(MancalaRecord.GameRecord(2, 1, ("a", "b"), [(1, 2), (2, 1)])))
+        self.assertFalse(stats.add(MancalaRecord.GameRecord(2, 1, ("a", "b"), [(1, 2), (1, 1), (2, 1)])))
+        self.assertTrue(stats.add(MancalaRecord.GameRecord(2, 1, ("a", "b"), [(1, 1)])))
+        row, = stats.get_table()
+        self.assertEqual((row['games'], row['invalid'], row['unfinished']), (4, 2, 1))
+        self.assertEqual((row['player_1_wins'], row['player_2_wins'], row['ties']), (1, 0, 0))
+        self.assertEqual(row['mean_length'], 1.5)
+        self.assertEqual((row['extra_turn_rate'], row['capture_rate']), (1 / 3, 1 / 3))
+        pits = {row['pit']: row for row in stats.get_pit_table()}
+        self.assertEqual((pits[1]['openings'], pits[1]['opening_win_rate']), (1, None))
+        self.assertEqual((pits[2]['openings'], pits[2]['opening_win_rate']), (1, 1.0))
+        self.assertEqual((pits[1]['moves'], pits[1]['capture_rate']), (2, 0.5))
+        self.assertEqual((pits[2]['moves'], pits[2]['extra_turn_rate']), (1, 1.0))
+        self.assertEqual(stats.get_games(), 4)
+
+    def test_shards_same_as_whole(self):
+        """Should give the same tables when shards are merged, across worker processes, as for
+        the whole archive at once."""
+        records = random_records(60, 3)
+        whole = MancalaAggregator.aggregate(records, capacity=50)
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, f"shard{i}.bin") for i in range(3)]
+            for i, path in enumerate(paths):
+                MancalaRecord.write_records(path, records[i::3])
+            merged = MancalaAggregator.aggregate_files(paths, capacity=50, processes=1)
+            parallel = MancalaAggregator.aggregate_files(paths, capacity=50, processes=2)
+        for stats in (merged, parallel):
+            self.assertEqual(stats.get_games(), 60)
+            self.assertEqual(stats.get_table(), whole.get_table())
+            self.assertEqual(stats.get_pit_table(), whole.get_pit_table())
+        self.assertEqual(sum(row['openings'] for row in whole.get_pit_table()), 60)
+
+        # The most frequent positions are kept per configuration, in canonical form.
+        positions = whole.get_positions(3)
+        self.assertEqual(sorted(positions), [(3, 2), (6, 4)])
+        for config, top in positions.items():
+            self.assertTrue(all(position.is_canonical() for position, _ in top))
+        self.assertIn("most frequent positions", whole.format_table(3))
+
+    def test_unreadable_records(self):
+        """Should skip and count the records of a shard that cannot be read, and keep the rest."""
+        records = random_records(4, 5)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "shard.txt")
+            MancalaRecord.write_records(path, records, text=True)
+            with open(path, "a", encoding="utf-8") as file:
+                file.write("6\t4\tbroken\n")
+            for processes in (1, 2):
+                stats = MancalaAggregator.aggregate_files([path, path], processes=processes)
+                self.assertEqual((stats.get_games(), stats.get_unreadable()), (8, 2))
+                self.assertIn("2 unreadable records skipped", stats.format_table())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,257 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 15:40
+# Description: Implements a benchmark suite for the Mancala move engine, full games and search.
+#
+# The suite measures, for every board class and board configuration (num_pits, num_seeds):
+#   construct     - Board() construction time (microseconds per board).
+#   play_turn     - Board.play_turn latency (microseconds per move), over pre-recorded random games.
+#   play_game     - full random games played through Mancala.play_game (games per second).
+#   is_game_over  - Board.is_game_over overhead (nanoseconds per call).
+#   get_pit_seeds - Board.get_pit_seeds overhead (nanoseconds per call).
+#   search        - MancalaSearch.SearchEngine speed from the starting board (nodes per second).
+#
+# Every measurement is repeated, and the best repeat is kept, as the best repeat is the least disturbed by other
+# work on the machine. The games are generated from a fixed seed, so every run plays the same moves.
+#
+# Results are written as JSON, one entry per metric with its unit and whether lower or higher is better. Given a
+# saved baseline (the JSON of an earlier run), every metric is compared with it, and any metric worse by more than
+# the tolerance is reported as a regression (and the command exits with status 1).
+#
+# To run the benchmarks and save a baseline, then compare a later run against it:
+#       python MancalaBenchmark.py --output baseline.json
+#       python MancalaBenchmark.py --baseline baseline.json --tolerance 0.10
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sys
+import time
+
+import Mancala
+import MancalaSearch
+
+BOARD_CLASSES = {'Board': Mancala.Board}
+
+# Unit and direction ('lower' or 'higher' is better) of each metric.
+METRICS = {
+    'construct': ('us', 'lower'),
+    'play_turn': ('us', 'lower'),
+    'play_game': ('games/s', 'higher'),
+    'is_game_over': ('ns', 'lower'),
+    'get_pit_seeds': ('ns', 'lower'),
+    'search': ('nodes/s', 'higher'),
+}
+
+
+def random_games(count, num_pits, num_seeds, seed=0):
+    """Returns a list of `count` random games, each a list of (player, pit) moves in turn order."""
+    rng = random.Random(seed)
+    games = []
+    for _ in range(count):
+        board = Mancala.Board(num_pits, num_seeds)
+        player, moves = 1, []
+        while not board.is_game_over():
+            pit = rng.choice(board.get_legal_moves(player))
+            moves.append((player, pit))
+            if not board.apply_move(player, pit).is_extra_turn():
+                player = 3 - player
+        games.append(moves)
+    return games
+
+
+def best_time(function, repeat):
+    """Returns the shortest time, in seconds, of `repeat` calls of a function."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_construct(board_class, num_pits, num_seeds, repeat, scale):
+    """Returns the microseconds to construct one board."""
+    count = 1000 * scale
+
+    def run():
+        for _ in range(count):
+            board_class(num_pits, num_seeds)
+    return best_time(run, repeat) / count * 1e6
+
+
+def bench_play_turn(board_class, num_pits, num_seeds, games, repeat):
+    """Returns the microseconds per Board.play_turn move, over pre-recorded games (the boards
+    are built before the clock starts)."""
+    moves = sum(len(game) for game in games)
+    best = float('inf')
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            boards = [board_class(num_pits, num_seeds) for _ in games]
+            start = time.perf_counter()
+            for board, game in zip(boards, games):
+                for player, pit in game:
+                    board.play_turn(player, pit)
+            best = min(best, time.perf_counter() - start)
+    return best / moves * 1e6
+
+
+def bench_play_game(board_class, num_pits, num_seeds, games, repeat):
+    """Returns the full games per second played through Mancala.play_game, including building
+    the game and its board."""
+    def run():
+        for game in games:
+            mancala = Mancala.Mancala(board_class(num_pits, num_seeds))
+            for player, pit in game:
+                mancala.play_game(player, pit)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        return len(games) / best_time(run, repeat)
+
+
+def bench_queries(board_class, num_pits, num_seeds, games, repeat, scale):
+    """Returns the nanoseconds per is_game_over and per get_pit_seeds call, on boards taken
+    from the middle of pre-recorded games."""
+    boards = []
+    for game in games:
+        board = board_class(num_pits, num_seeds)
+        for player, pit in game[:len(game) // 2]:
+            board.apply_move(player, pit)
+        boards.append(board)
+    rounds = 50 * scale
+
+    def run_game_over():
+        for _ in range(rounds):
+            for board in boards:
+                board.is_game_over()
+
+    def run_pit_seeds():
+        for _ in range(rounds):
+            for board in boards:
+                board.get_pit_seeds(1)
+                board.get_pit_seeds(2)
+
+    calls = rounds * len(boards)
+    return (best_time(run_game_over, repeat) / calls * 1e9,
+            best_time(run_pit_seeds, repeat) / (2 * calls) * 1e9)
+
+
+def bench_search(board_class, num_pits, num_seeds, repeat, scale):
+    """Returns the nodes per second of a fixed-node search from the starting board."""
+    best = 0.0
+    for _ in range(repeat):
+        engine = MancalaSearch.SearchEngine(time_limit=None, node_limit=10000 * scale)
+        engine.search(board_class(num_pits, num_seeds), 1)
+        best = max(best, engine.get_info()['nps'])
+    return best
+
+
+def run_benchmarks(configs=((6, 4),), boards=('Board',), repeat=5, scale=1, search=True):
+    """Runs the benchmark suite, and returns the results as a JSON-ready dictionary.
+
+    Parameters:
+        configs : sequence of (num_pits, num_seeds) board configurations.
+        boards  : sequence of board class names (see BOARD_CLASSES).
+        repeat  : integer representing the number of repeats of each measurement (best kept).
+        scale   : integer multiplying the amount of work per measurement.
+        search  : boolean representing whether to benchmark the search.
+    Returns:
+        Dictionary with 'meta' (machine and settings) and 'results', mapping metric names
+        '<board>/<pits>x<seeds>/<metric>' to dictionaries of value, unit and better.
+    """
+    results = {}
+    for num_pits, num_seeds in configs:
+        games = random_games(20 * scale, num_pits, num_seeds)
+        for name in boards:
+            board_class = BOARD_CLASSES[name]
+            values = {
+                'construct': bench_construct(board_class, num_pits, num_seeds, repeat, scale),
+                'play_turn': bench_play_turn(board_class, num_pits, num_seeds, games, repeat),
+                'play_game': bench_play_game(board_class, num_pits, num_seeds, games, repeat),
+            }
+            values['is_game_over'], values['get_pit_seeds'] = bench_queries(board_class, num_pits, num_seeds,
+                                                                            games, repeat, scale)
+            if search:
+                values['search'] = bench_search(board_class, num_pits, num_seeds, repeat, scale)
+            for metric, value in values.items():
+                unit, better = METRICS[metric]
+                results[f"{name}/{num_pits}x{num_seeds}/{metric}"] = {'value': value, 'unit': unit,
+                                                                       'better': better}
+    meta = {'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'machine': platform.machine(), 'platform': platform.platform(),
+            'time': time.strftime("%Y-%m-%dT%H:%M:%S"), 'repeat': repeat, 'scale': scale}
+    return {'meta': meta, 'results': results}
+
+
+def compare(results, baseline, tolerance=0.10):
+    """Compares benchmark results with a baseline.
+
+    Parameters:
+        results   : dictionary returned by run_benchmarks.
+        baseline  : dictionary returned by an earlier run_benchmarks (e.g. loaded from JSON).
+        tolerance : float representing the relative slowdown allowed before a regression.
+    Returns:
+        List of dictionaries, one per metric in both: name, baseline, value, change (relative
+        change, positive when better) and regression (boolean).
+    """
+    rows = []
+    for name, result in results['results'].items():
+        old = baseline['results'].get(name)
+        if old is None or not old['value']:
+            continue
+        change = result['value'] / old['value'] - 1
+        if result['better'] == 'lower':
+            change = old['value'] / result['value'] - 1 if result['value'] else float('inf')
+        rows.append({'name': name, 'baseline': old['value'], 'value': result['value'], 'change': change,
+                     'regression': change < -tolerance})
+    return rows
+
+
+def format_results(results, rows=None):
+    """Returns the results (and the comparison rows, if any) as a plain text table."""
+    changes = {row['name']: row for row in rows or []}
+    lines = [f"{'benchmark':<36} {'value':>12} {'unit':<8} {'change':>8}"]
+    for name, result in results['results'].items():
+        row = changes.get(name)
+        change = "" if row is None else f"{row['change']:+.1%}" + (" !" if row['regression'] else "")
+        lines.append(f"{name:<36} {result['value']:>12.2f} {result['unit']:<8} {change:>8}")
+    return "\n".join(lines)
+
+
+def main():
+    """Runs the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmarks the Mancala move engine, games and search.")
+    parser.add_argument("--configs", nargs="+", default=["6x4", "4x3", "8x6"], help="board configurations")
+    parser.add_argument("--boards", nargs="+", default=sorted(BOARD_CLASSES), choices=sorted(BOARD_CLASSES))
+    parser.add_argument("--repeat", type=int, default=5, help="repeats per measurement (best kept)")
+    parser.add_argument("--scale", type=int, default=1, help="work multiplier per measurement")
+    parser.add_argument("--no-search", action="store_true", help="skip the search benchmark")
+    parser.add_argument("--output", help="write the results as JSON to this file (e.g. to save a baseline)")
+    parser.add_argument("--baseline", help="compare against the JSON results of an earlier run")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="relative slowdown allowed")
+    args = parser.parse_args()
+
+    configs = [tuple(int(n) for n in config.split("x")) for config in args.configs]
+    results = run_benchmarks(configs, args.boards, args.repeat, args.scale, not args.no_search)
+    rows = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            rows = compare(results, json.load(file), args.tolerance)
+        results['comparison'] = rows
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    print(format_results(results, rows))
+
+    regressions = [row['name'] for row in rows or [] if row['regression']]
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
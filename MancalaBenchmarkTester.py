@@ -0,0 +1,52 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 15:40
+# Description: Unit tests for MancalaBenchmark.py.
+
+import json
+import unittest
+import Mancala
+import MancalaBenchmark
+
+
+class BenchmarkTester(unittest.TestCase):
+    """Unit tests for the benchmark suite."""
+
+    def test_random_games(self):
+        """Should record complete games, in turn order, reproducibly."""
+        games = MancalaBenchmark.random_games(5, 4, 3, seed=1)
+        self.assertEqual(games, MancalaBenchmark.random_games(5, 4, 3, seed=1))
+        for game in games:
+            board = Mancala.Board(4, 3)
+            player = 1
+            for move_player, pit in game:
+                self.assertEqual(move_player, player)
+                if not board.apply_move(move_player, pit).is_extra_turn():
+                    player = 3 - player
+            self.assertTrue(board.is_game_over())
+
+    def test_run_benchmarks(self):
+        """Should report every metric, for every board class and configuration, as JSON."""
+        results = MancalaBenchmark.run_benchmarks([(3, 2)], repeat=1, search=False)
+        names = {f"Board/3x2/{metric}" for metric in MancalaBenchmark.METRICS if metric != 'search'}
+        self.assertEqual(set(results['results']), names)
+        for result in results['results'].values():
+            self.assertGreater(result['value'], 0)
+        self.assertEqual(json.loads(json.dumps(results)), results)
+
+    def test_compare(self):
+        """Should flag metrics worse than the baseline by more than the tolerance."""
+        def results(latency, throughput):
+            return {'results': {'a/play_turn': {'value': latency, 'unit': 'us', 'better': 'lower'},
+                                'a/play_game': {'value': throughput, 'unit': 'games/s', 'better': 'higher'}}}
+        rows = MancalaBenchmark.compare(results(2.0, 100.0), results(1.0, 105.0), tolerance=0.10)
+        self.assertEqual([(row['name'], row['regression']) for row in rows],
+                         [('a/play_turn', True), ('a/play_game', False)])
+        self.assertAlmostEqual(rows[0]['change'], -0.5)
+        rows = MancalaBenchmark.compare(results(0.5, 50.0), results(1.0, 100.0))
+        self.assertEqual([row['regression'] for row in rows], [False, True])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,290 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 13:50
+# Description: Implements an on-disk opening book for the Mancala board game, built from precomputed searches.
+#
+# The module implements the following class:
+#   OpeningBook - OpeningBook class representing a memory-mapped, sorted opening book file.
+#
+# The builder enumerates every position (with the game not over) reachable within the first N plies from the
+# starting board, searches each one with a MancalaSearch.SearchEngine to a fixed depth, and writes the best move and
+# score of each position to a file. Every position is keyed by the packed Position key of its canonical form (see
+# Mancala.Position.canonical), so the positions reached by different move orders, and the mirrored positions with
+# player 2 to move, share one entry.
+#
+# Book file layout:
+#       header  : magic, num_pits, num_seeds, plies, search depth, number of records.
+#       records : (position key, best pit number, score) records of a fixed size, sorted by key.
+#
+# The book is read through a read-only memory map and looked up by binary search over the records, so opening a
+# book is instant whatever its size, and worker processes share one copy of it through the page cache.
+#
+# The searches are run across a process pool. Each result is appended to a journal file as it arrives, and a
+# build that is interrupted picks up from the journal when it is run again, only searching the positions left.
+#
+# To build a book, simply call:
+#       build_opening_book("opening.book", plies=6, depth=10)
+# or from the command line:
+#       python MancalaBook.py opening.book --plies 6 --depth 10
+# and to use it:
+#       Mancala().new_game(engines={2: SearchEngine(book=OpeningBook("opening.book"))})
+
+import argparse
+import mmap
+import multiprocessing
+import os
+import struct
+
+import Mancala
+import MancalaSearch
+
+MAGIC = b"MNCLBOOK"
+HEADER = struct.Struct("<8sHHHHI")    # Magic, num_pits, num_seeds, plies, depth, number of records.
+
+
+def record_struct(num_pits):
+    """Returns the struct of a book record (position key, best pit number, score) for a number of
+    pits per player. The keys of a book all have the same size (one byte per count)."""
+    return struct.Struct(f"<{2 * num_pits + 3}sBh")
+
+
+def enumerate_positions(plies, num_pits=6, num_seeds=4):
+    """Returns the sorted list of the canonical Position keys of every position, with the game
+    not over, reachable within `plies` moves (each move counts, including extra turns) of the
+    start."""
+    board = Mancala.Board(num_pits, num_seeds)
+    start = Mancala.Position.from_board(board, 1)
+    seen = {start.get_key()}
+    frontier = [start]
+    for _ in range(plies):
+        next_frontier = []
+        for position in frontier:
+            board.set_position(position)
+            player = position.get_to_move()
+            for pit in board.get_legal_moves(player):
+                board.make_move(player, pit)
+                if not board.is_game_over():
+                    child = Mancala.Position.from_board(board).canonical()
+                    if child.get_key() not in seen:
+                        seen.add(child.get_key())
+                        next_frontier.append(child)
+                board.unmake_move()
+        frontier = next_frontier
+    return sorted(seen)
+
+
+def search_position(key, depth):
+    """Searches a position to a fixed depth, with a fresh engine so the result does not depend
+    on which positions were searched before. Returns the (key, best pit number, score)."""
+    position = Mancala.Position.from_key(key)
+    engine = MancalaSearch.SearchEngine(max_depth=depth, time_limit=None)
+    move, score = engine.search(position.to_board(), position.get_to_move())
+    return key, move, score
+
+
+def _search_task(task):
+    """Runs search_position in a worker process."""
+    return search_position(*task)
+
+
+def read_journal(path, header):
+    """Returns the dictionary mapping position keys to (move, score) results recorded in a
+    journal file, or an empty dictionary if there is no journal. A torn last line (from an
+    interrupted build) is ignored.
+    Raises:
+        ValueError if the journal was written for a different book configuration.
+    """
+    results = {}
+    if not os.path.exists(path):
+        return results
+    with open(path) as file:
+        first = file.readline().rstrip("\n")
+        if first != header:
+            raise ValueError(f"{path} is the journal of a different book ({first}).")
+        for line in file:
+            parts = line.split()
+            if len(parts) != 3 or not line.endswith("\n"):
+                continue
+            try:
+                results[bytes.fromhex(parts[0])] = (int(parts[1]), int(parts[2]))
+            except ValueError:
+                continue
+    return results
+
+
+def build_opening_book(path, plies=6, depth=10, num_pits=6, num_seeds=4, processes=None, progress=False):
+    """Builds an opening book of every position within `plies` moves of the start, searched to
+    a fixed depth, and writes it to a file. The search results are journaled to path + ".journal"
+    as they arrive, so an interrupted build resumes where it stopped.
+
+    Parameters:
+        path      : string representing the path of the book file to write.
+        plies     : integer representing the number of moves from the start to cover.
+        depth     : integer representing the search depth of every position.
+        num_pits  : integer representing the number of pits per player.
+        num_seeds : integer representing the initial number of seeds per pit.
+        processes : integer representing the number of worker processes (1 to search in-process,
+                     None for one per CPU core).
+        progress  : boolean representing whether to print the progress of the build.
+    Returns:
+        OpeningBook object reading the file.
+    """
+    if 2 * num_pits * num_seeds > 255:
+        raise ValueError("The book only supports boards with at most 255 seeds.")
+    keys = enumerate_positions(plies, num_pits, num_seeds)
+
+    # Pick up the results of an interrupted build, and search the remaining positions.
+    journal = path + ".journal"
+    header = f"# num_pits={num_pits} num_seeds={num_seeds} plies={plies} depth={depth}"
+    results = read_journal(journal, header)
+    tasks = [(key, depth) for key in keys if key not in results]
+    if progress:
+        print(f"{len(keys)} positions, {len(keys) - len(tasks)} already searched")
+
+    with open(journal, "a") as file:
+        if file.tell() == 0:
+            file.write(header + "\n")
+        if processes == 1:
+            found = map(_search_task, tasks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(processes)
+            found = pool.imap_unordered(_search_task, tasks, chunksize=8)
+        try:
+            for count, (key, move, score) in enumerate(found, 1):
+                results[key] = (move, score)
+                file.write(f"{key.hex()} {move} {score}\n")
+                if count % 256 == 0:
+                    file.flush()
+                    if progress:
+                        print(f"{count}/{len(tasks)} positions searched")
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+    # Write the sorted book next to the final path, and move it into place.
+    record = record_struct(num_pits)
+    with open(path + ".tmp", "wb") as file:
+        file.write(HEADER.pack(MAGIC, num_pits, num_seeds, plies, depth, len(keys)))
+        for key in keys:
+            file.write(record.pack(key, *results[key]))
+    os.replace(path + ".tmp", path)
+    os.remove(journal)
+    return OpeningBook(path)
+
+
+class OpeningBook:
+    """OpeningBook class representing an opening book file, read through a read-only memory map
+    and looked up by binary search.
+
+    Attributes:
+        _num_pits  : integer representing the number of pits per player.
+        _num_seeds : integer representing the initial number of seeds per pit.
+        _plies     : integer representing the number of moves from the start covered.
+        _depth     : integer representing the search depth of every position.
+        _size      : integer representing the number of positions in the book.
+        _record    : struct.Struct object of a record.
+        _file      : file object of the book.
+        _table     : mmap object of the book.
+    """
+    def __init__(self, path):
+        """Opens an opening book file."""
+        self._file = open(path, "rb")
+        self._table = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._num_pits, self._num_seeds, self._plies, self._depth, self._size = HEADER.unpack_from(self._table)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an opening book.")
+        self._record = record_struct(self._num_pits)
+
+    def __getstate__(self):
+        """Pickles the book by its path, so it can be sent to worker processes."""
+        return {'path': self._file.name}
+
+    def __setstate__(self, state):
+        """Reopens the book in a worker process."""
+        self.__init__(state['path'])
+
+    # Public getters
+    def get_num_pits(self):
+        """Returns the number of pits per player."""
+        return self._num_pits
+
+    def get_num_seeds(self):
+        """Returns the initial number of seeds per pit."""
+        return self._num_seeds
+
+    def get_plies(self):
+        """Returns the number of moves from the start covered by the book."""
+        return self._plies
+
+    def get_depth(self):
+        """Returns the search depth of every position in the book."""
+        return self._depth
+
+    def get_size(self):
+        """Returns the number of positions in the book."""
+        return self._size
+
+    # Public methods
+    def lookup(self, key):
+        """Returns the (best pit number, score) of a position, or None if it is not in the book.
+        Parameters:
+            key : bytes representing the packed canonical position (see Mancala.Position).
+        """
+        record = self._record
+        key_size = record.size - 3
+        if len(key) != key_size:
+            return None
+        table = self._table
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            offset = HEADER.size + middle * record.size
+            middle_key = table[offset:offset + key_size]
+            if middle_key < key:
+                low = middle + 1
+            elif middle_key > key:
+                high = middle
+            else:
+                return record.unpack_from(table, offset)[1:]
+        return None
+
+    def probe(self, board, player_id=None):
+        """Returns the (best pit number, score) of a board, or None if it is not in the book.
+        Parameters:
+            board     : Board object.
+            player_id : integer representing the player id (1 or 2) to move. Defaults to the
+                          board's player to move.
+        """
+        if player_id is None:
+            player_id = board.get_to_move()
+        if board.get_num_pits() != self._num_pits:
+            return None
+        return self.lookup(Mancala.Position(board.get_seed_tuple(), player_id).canonical().get_key())
+
+    def close(self):
+        """Closes the book file."""
+        self._table.close()
+        self._file.close()
+
+
+def main():
+    """Builds an opening book from the command line."""
+    parser = argparse.ArgumentParser(description="Builds a Mancala opening book.")
+    parser.add_argument("path", help="file to write")
+    parser.add_argument("--plies", type=int, default=6, help="moves from the start to cover")
+    parser.add_argument("--depth", type=int, default=10, help="search depth of every position")
+    parser.add_argument("--num-pits", type=int, default=6)
+    parser.add_argument("--num-seeds", type=int, default=4)
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: CPU cores)")
+    args = parser.parse_args()
+    book = build_opening_book(args.path, args.plies, args.depth, args.num_pits, args.num_seeds,
+                              args.processes, progress=True)
+    print(f"{book.get_size()} positions written to {args.path}")
+    book.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 13:50
+# Description: Unit tests for MancalaBook.py.
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import Mancala
+import MancalaBook
+import MancalaSearch
+
+
+class OpeningBookTester(unittest.TestCase):
+    """Unit tests for OpeningBook class and build_opening_book."""
+
+    def setUp(self):
+        """Creates a temporary directory for the book files."""
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "opening.book")
+
+    def tearDown(self):
+        """Removes the temporary directory."""
+        self._directory.cleanup()
+
+    def test_enumerate_positions(self):
+        """Should count the distinct positions within a few plies of the start."""
+        self.assertEqual(len(MancalaBook.enumerate_positions(0)), 1)
+        self.assertEqual(len(MancalaBook.enumerate_positions(2)), 42)
+        self.assertEqual(len(MancalaBook.enumerate_positions(3)), 227)
+
+    def test_same_as_search(self):
+        """Should store the result of a fixed-depth search for every position, and nothing else."""
+        book = MancalaBook.build_opening_book(self._path, plies=2, depth=4, processes=1)
+        self.assertEqual(book.get_size(), 42)
+        self.assertFalse(os.path.exists(self._path + ".journal"))
+        for key in MancalaBook.enumerate_positions(2):
+            position = Mancala.Position.from_key(key)
+            engine = MancalaSearch.SearchEngine(max_depth=4, time_limit=None)
+            expected = engine.search(position.to_board(Mancala.Board), position.get_to_move())
+            self.assertEqual(book.probe(position.to_board(Mancala.Board)), expected)
+        board = Mancala.Board()
+        board.apply_move(1, 1)
+        board.apply_move(2, 1)
+        board.apply_move(1, 2)
+        self.assertIsNone(book.probe(board, 2))
+        self.assertIsNone(book.probe(Mancala.Board(num_pits=4), 1))
+        book.close()
+
+    def test_resume_from_journal(self):
+        """Should keep the journaled results of an interrupted build, and ignore a torn line."""
+        keys = MancalaBook.enumerate_positions(1)
+        header = "# num_pits=6 num_seeds=4 plies=1 depth=3"
+        with open(self._path + ".journal", "w") as file:
+            file.write(f"{header}\n{keys[0].hex()} 6 99\n{keys[1].hex()} 2")
+        book = MancalaBook.build_opening_book(self._path, plies=1, depth=3, processes=1)
+        self.assertEqual(book.lookup(keys[0]), (6, 99))
+        self.assertEqual(book.lookup(keys[1]), MancalaBook.search_position(keys[1], 3)[1:])
+        book.close()
+
+        with open(self._path + ".journal", "w") as file:
+            file.write("# num_pits=6 num_seeds=4 plies=1 depth=5\n")
+        with self.assertRaises(ValueError):
+            MancalaBook.build_opening_book(self._path, plies=1, depth=3, processes=1)
+
+    def test_parallel_build(self):
+        """Should write the same book across a process pool as in-process."""
+        MancalaBook.build_opening_book(self._path, plies=2, depth=3, processes=1).close()
+        with open(self._path, "rb") as file:
+            expected = file.read()
+        MancalaBook.build_opening_book(self._path, plies=2, depth=3, processes=2).close()
+        with open(self._path, "rb") as file:
+            self.assertEqual(file.read(), expected)
+
+    def test_engine_and_new_game_use_book(self):
+        """Should play the book move without searching, in the engine and in new_game."""
+        book = MancalaBook.build_opening_book(self._path, plies=1, depth=3, processes=1)
+        engine = MancalaSearch.SearchEngine(time_limit=None, max_depth=2, book=book)
+        self.assertEqual(engine.search(Mancala.Board(), 1), book.probe(Mancala.Board(), 1))
+        self.assertTrue(engine.get_info()['book'])
+        self.assertEqual(engine.get_info()['nodes'], 0)
+
+        class Engine:
+            """Computer player that records the positions it is asked to search."""
+            def __init__(self, name):
+                self.name, self.calls = name, 0
+
+            def get_name(self):
+                return self.name
+
+            def choose_move(self, board, player_id):
+                self.calls += 1
+                return board.get_legal_moves(player_id)[0]
+
+        engines = {1: Engine("Ann"), 2: Engine("Bob")}
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            Mancala.Mancala().new_game(engines=engines, book=book)
+        self.assertIn(f"Player 1 (Ann) chooses pit {book.probe(Mancala.Board(), 1)[0]}.", output.getvalue())
+        self.assertGreater(engines[1].calls + engines[2].calls, 0)
+        book.close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
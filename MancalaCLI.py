@@ -0,0 +1,235 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 19:30
+# Description: Implements a headless command line mode that plays streams of Mancala games, one game per line.
+#
+# Unlike Mancala.main, which runs one interactive game with input() prompts, this mode reads games from stdin (or a
+# file) and writes one result line per game to stdout, so it can sit in a shell pipeline.
+#
+# Each input line holds a board configuration and a move list, in any of these forms:
+#       text   : the MancalaRecord text format, tab-separated:
+#                   num_pits <TAB> num_seeds <TAB> name 1 <TAB> name 2 <TAB> player:pit player:pit ...
+#       short  : the same without the names, separated by spaces:
+#                   num_pits num_seeds player:pit player:pit ...
+#       JSON   : an object such as
+#                   {"id": "g1", "pits": 6, "seeds": 4, "names": ["Ann", "Bob"], "moves": [[1, 3], [1, 6], [2, 1]]}
+#                 where "id" and "names" are optional, and moves may also be "player:pit" strings. The counts
+#                 must be integers, and "names" a list of 2 strings.
+# Blank lines and lines starting with '#' are ignored. Boards are limited to MAX_PITS pits per player, as the size of a
+# board's sowing tables grows with the square of its pits.
+#
+# The moves of a game are played in order, as with Mancala.play_game: a move that is invalid (an empty pit, a pit out
+# of range, or a move after the game has ended) is recorded as an error, and the following moves are still played.
+# Turn order is not enforced, as with play_game, unless --check-turns is given. Each result line is a JSON object:
+#       {"line": 3, "id": "g1", "seeds": [...], "winner": "Winner is player 1: Ann", "errors": []}
+# where "line" is the input line number, "id" is only present when given, "seeds" is the final seed list as returned
+# by play_game, and "winner" is the string reported by Mancala.return_winner. A line that cannot be read gives null
+# seeds and winner, and the reason in "errors".
+#
+# Lines are read lazily and played in batches. The results of each batch are written, and the output flushed, in one
+# go. With --processes, the batches are played across a pool of worker processes. The results are still written in
+# input order.
+#
+# To play a file of games, simply call:
+#       python MancalaCLI.py games.txt > results.jsonl
+# or from a pipeline:
+#       generate_games | python MancalaCLI.py --processes 4 | analyse_results
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import sys
+
+import Mancala
+
+DEFAULT_NAMES = ("player 1", "player 2")
+MAX_PITS = 100
+
+
+def parse_count(value):
+    """Returns a count given as an integer or a string of digits. Raises ValueError for any other
+    value, such as 6.7, true or "x"."""
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"expected an integer, not {value!r}")
+    return int(value)
+
+
+def parse_move(move):
+    """Returns the (player, pit) of a move given as a "player:pit" string or a [player, pit] pair."""
+    if isinstance(move, str):
+        move = move.split(":")
+    player, pit = move
+    return parse_count(player), parse_count(pit)
+
+
+def parse_names(names):
+    """Returns the player names given as a list of 2 strings."""
+    if not isinstance(names, list) or len(names) != 2 or not all(isinstance(name, str) for name in names):
+        raise ValueError("expected a list of 2 names")
+    return tuple(names)
+
+
+def parse_game(line):
+    """Returns the game on one input line (see the module description) as a dictionary with the
+    keys id (None if not given), num_pits, num_seeds, names and moves (a list of (player, pit)).
+    Raises:
+        ValueError if the line is not a valid game.
+    """
+    line = line.strip()
+    try:
+        if line.startswith("{"):
+            fields = json.loads(line)
+            game = {'id': fields.get('id'), 'num_pits': parse_count(fields['pits']),
+                    'num_seeds': parse_count(fields['seeds']),
+                    'names': parse_names(fields.get('names', list(DEFAULT_NAMES))),
+                    'moves': [parse_move(move) for move in fields.get('moves', ())]}
+        elif "\t" in line:
+            fields = line.split("\t")
+            if len(fields) != 5:
+                raise ValueError("expected 5 tab-separated fields")
+            game = {'id': None, 'num_pits': int(fields[0]), 'num_seeds': int(fields[1]), 'names': tuple(fields[2:4]),
+                    'moves': [parse_move(move) for move in fields[4].split()]}
+        else:
+            fields = line.split()
+            game = {'id': None, 'num_pits': int(fields[0]), 'num_seeds': int(fields[1]), 'names': DEFAULT_NAMES,
+                    'moves': [parse_move(move) for move in fields[2:]]}
+    except (ValueError, OverflowError, KeyError, IndexError, TypeError, AttributeError) as error:
+        raise ValueError(f"invalid game: {error}") from None
+    if not 1 <= game['num_pits'] <= MAX_PITS or game['num_seeds'] < 0 or len(game['names']) != 2:
+        raise ValueError(f"invalid game: needs 1 to {MAX_PITS} pits, no negative seeds and 2 names")
+    return game
+
+
+def play(game, check_turns=False):
+    """Plays the moves of a game (see parse_game) on a new board.
+    Parameters:
+        game        : dictionary describing the game, as returned by parse_game.
+        check_turns : boolean representing whether each move must be played by the player to
+                       move (player 1 first, switching unless a move earns another turn); moves
+                       out of turn are recorded as errors and skipped.
+    Returns:
+        Tuple (seeds, winner, errors) of the final seed list as returned by Mancala.play_game,
+        the winner as reported by Mancala.return_winner, and the list of move error strings.
+    """
+    # Set up the game and its players.
+    board = Mancala.Board(game['num_pits'], game['num_seeds'])
+    mancala = Mancala.Mancala(board)
+    for name in game['names']:
+        mancala.create_player(name)
+
+    # Play every move, recording the invalid ones.
+    errors = []
+    to_move = 1
+    for number, (player, pit) in enumerate(game['moves'], 1):
+        if check_turns and player != to_move:
+            errors.append(f"move {number}: player {player} played out of turn")
+            continue
+        try:
+            result = mancala.apply_move(player, pit)
+        except ValueError as error:
+            errors.append(f"move {number}: {error}")
+            continue
+        to_move = player if result.is_extra_turn() else 3 - player
+    return board.get_seed_list(), mancala.return_winner(), errors
+
+
+def process_line(number, line, check_turns=False):
+    """Returns the result line (without the newline) of input line number `number`."""
+    result = {'line': number}
+    try:
+        game = parse_game(line)
+    except ValueError as error:
+        result.update(seeds=None, winner=None, errors=[str(error)])
+    else:
+        if game['id'] is not None:
+            result['id'] = game['id']
+        seeds, winner, errors = play(game, check_turns)
+        result.update(seeds=seeds, winner=winner, errors=errors)
+    return json.dumps(result, separators=(",", ":"))
+
+
+def process_batch(batch, check_turns=False):
+    """Returns the result lines of a batch of (line number, line) tuples, as one string."""
+    return "".join(process_line(number, line, check_turns) + "\n" for number, line in batch)
+
+
+def batches(source, batch_size):
+    """Yields the game lines of a text stream in lists of up to batch_size (line number, line)
+    tuples, skipping blank lines and lines starting with '#'. The stream is read lazily."""
+    lines = ((number, line) for number, line in enumerate(source, 1)
+             if line.strip() and not line.startswith("#"))
+    while True:
+        batch = list(itertools.islice(lines, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+# Whether the worker processes check the turn order, set by the pool initializer.
+_worker_check_turns = False
+
+
+def _init_worker(check_turns):
+    """Pool initializer: keeps the turn order option in the worker process."""
+    global _worker_check_turns
+    _worker_check_turns = check_turns
+
+
+def _batch_task(batch):
+    """Pool task: plays a batch of game lines with the worker options."""
+    return process_batch(batch, _worker_check_turns)
+
+
+def run(source, output, batch_size=1000, processes=1, check_turns=False):
+    """Plays every game of a text stream, and writes one result line per game.
+
+    Parameters:
+        source      : iterable of input lines (e.g. sys.stdin or an open file).
+        output      : text stream to write the result lines to (e.g. sys.stdout).
+        batch_size  : integer representing the number of games played, written and flushed at
+                       a time.
+        processes   : integer representing the number of worker processes (1 to play
+                       in-process, None for one per CPU core).
+        check_turns : boolean representing whether the turn order is enforced (see play).
+    Returns:
+        Integer representing the number of games (result lines) written.
+    """
+    count = 0
+    if processes == 1:
+        results = (process_batch(batch, check_turns) for batch in batches(source, batch_size))
+        for text in results:
+            output.write(text)
+            output.flush()
+            count += text.count("\n")
+        return count
+
+    with multiprocessing.Pool(processes, _init_worker, (check_turns,)) as pool:
+        for text in pool.imap(_batch_task, batches(source, batch_size)):
+            output.write(text)
+            output.flush()
+            count += text.count("\n")
+    return count
+
+
+def main():
+    """Plays a stream of games from the command line, writing the results to stdout."""
+    parser = argparse.ArgumentParser(description="Plays Mancala games read one per line, and writes one JSON "
+                                                 "result line per game.")
+    parser.add_argument("path", nargs="?", default="-", help="file of games (default: read stdin)")
+    parser.add_argument("--batch", type=int, default=1000, help="games played and flushed at a time")
+    parser.add_argument("--processes", type=int, default=1, help="worker processes (0 for one per CPU core)")
+    parser.add_argument("--check-turns", action="store_true", help="record moves out of turn as errors")
+    args = parser.parse_args()
+
+    processes = args.processes or None
+    if args.path == "-":
+        run(sys.stdin, sys.stdout, args.batch, processes, args.check_turns)
+    else:
+        with open(args.path, encoding="utf-8") as source:
+            run(source, sys.stdout, args.batch, processes, args.check_turns)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 19:30
+# Description: Unit tests for MancalaCLI.py.
+
+import io
+import json
+import unittest
+import Mancala
+import MancalaCLI
+
+
+class CLITester(unittest.TestCase):
+    """Unit tests for the headless command line mode."""
+
+    def test_formats(self):
+        """Should read the text, short and JSON forms of a game, and give the same results as
+        play_game and return_winner."""
+        game = Mancala.Mancala()
+        game.create_player("Ann")
+        game.create_player("Bob")
+        moves = [(1, 3), (1, 1), (2, 3), (2, 4), (1, 2), (2, 2), (1, 1)]
+        for player, pit in moves:
+            seeds = game.play_game(player, pit)
+        lines = ["6\t4\tAnn\tBob\t" + " ".join(f"{player}:{pit}" for player, pit in moves),
+                 "# comment", "",
+                 "6 4 " + " ".join(f"{player}:{pit}" for player, pit in moves),
+                 json.dumps({'id': 7, 'pits': 6, 'seeds': 4, 'names': ["Ann", "Bob"], 'moves': moves})]
+        output = io.StringIO()
+        self.assertEqual(MancalaCLI.run(lines, output), 3)
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([result['line'] for result in results], [1, 4, 5])
+        self.assertEqual(results[2]['id'], 7)
+        self.assertNotIn('id', results[0])
+        for result in results:
+            self.assertEqual(result['seeds'], seeds)
+            self.assertEqual(result['errors'], [])
+        self.assertEqual(results[0]['winner'], game.return_winner())
+
+    def test_errors(self):
+        """Should record invalid moves and lines as errors, and keep playing."""
+        output = io.StringIO()
+        MancalaCLI.run(["2 1 1:1 1:1 1:3 2:2 2:1 1:2", "2 x", "{\"pits\": 2}",
+                        f"{MancalaCLI.MAX_PITS + 1} 4 1:1", "0 4", '{"pits": 1e400, "seeds": 4}',
+                        '{"pits": 6.7, "seeds": 4}', '{"pits": 6, "seeds": 4, "names": "AB"}'], output)
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(results[0]['errors'], ["move 2: Invalid selection. Player must choose a non-empty pit.",
+                                                "move 3: Invalid pit number selection. Pick a number between 1 and 2",
+                                                "move 6: Game is ended"])
+        self.assertEqual(results[0]['seeds'], [0, 0, 2, 0, 0, 2])
+        self.assertEqual(results[0]['winner'], "It's a tie")
+        for result in results[1:]:
+            self.assertIsNone(result['seeds'])
+            self.assertTrue(result['errors'][0].startswith("invalid game"))
+        self.assertEqual(len(results), 8)
+
+        # Moves out of turn are only errors when the turn order is checked.
+        output = io.StringIO()
+        MancalaCLI.run(["2 1 2:1"], output, check_turns=True)
+        result = json.loads(output.getvalue())
+        self.assertEqual(result['errors'], ["move 1: player 2 played out of turn"])
+        self.assertEqual(result['winner'], "Game has not ended")
+
+    def test_parallel_same_as_serial(self):
+        """Should write the same results, in input order, across worker processes."""
+        lines = [f"{3 + i % 3} {1 + i % 4} 1:{1 + i % 3} 2:1 1:2 2:3 1:1" for i in range(40)]
+        serial, parallel = io.StringIO(), io.StringIO()
+        MancalaCLI.run(lines, serial, batch_size=7)
+        self.assertEqual(MancalaCLI.run(iter(lines), parallel, batch_size=7, processes=2), 40)
+        self.assertEqual(parallel.getvalue(), serial.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
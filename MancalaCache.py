@@ -0,0 +1,232 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 15:05
+# Description: Implements a memory-capped, position-keyed LRU cache of analysis results for the Mancala board game.
+#
+# The module implements the following classes:
+#   PositionCache - PositionCache class representing an LRU cache of results, keyed by position.
+#   CachedEvaluator - CachedEvaluator class that memoizes any evaluator applied to a board.
+#   CachedEngine - CachedEngine class that memoizes the searches of a computer player.
+#
+# Results are keyed by the packed Position key (see Mancala.Position), so the same position reached in different
+# games, or by different move orders, shares one entry. Results that are the same for a position and its mirror
+# (scores and pit numbers of the player to move, such as search results) are keyed by canonical position, so both
+# share one entry as well. The cache is bounded by an approximate memory cap: the size
+# of each entry (key, value and bookkeeping) is estimated when it is stored, and the least recently used entries are
+# evicted once the total goes over the cap. Hits, misses and evictions are counted for monitoring.
+#
+# One cache can be shared by several evaluators and sessions (it is guarded by a lock), and it can be saved to a
+# local file and loaded again, so a restarted worker does not start cold.
+#
+# To memoize an evaluator, simply call:
+#       evaluate = CachedEvaluator(my_evaluator, PositionCache(max_bytes=64 * 2 ** 20))
+#       score = evaluate(board, player_id)
+
+import collections
+import os
+import pickle
+import sys
+import threading
+
+import Mancala
+
+# Approximate bytes of bookkeeping per entry (the ordered dictionary's hash slot and link).
+ENTRY_OVERHEAD = 100
+
+# Marker for a missing entry, since None can be a cached result.
+_MISSING = object()
+
+
+def estimate_size(value):
+    """Returns the approximate memory used by a cached key or value, in bytes: the object itself,
+    plus the items of a tuple or list (one level deep)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list)):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
+class PositionCache:
+    """PositionCache class representing a least recently used (LRU) cache of results, bounded by
+    an approximate memory cap.
+
+    Attributes:
+        _max_bytes : integer representing the memory cap in bytes.
+        _entries   : OrderedDict mapping keys to (value, size) tuples, least recently used first.
+        _bytes     : integer representing the estimated memory used by the entries.
+        _hits      : integer representing the number of lookups that found an entry.
+        _misses    : integer representing the number of lookups that did not.
+        _evictions : integer representing the number of entries evicted to stay under the cap.
+        _lock      : threading.Lock object guarding the entries and counters.
+    """
+    def __init__(self, max_bytes=64 * 2 ** 20):
+        """Initializes an empty cache.
+        Parameters:
+            max_bytes : integer representing the memory cap in bytes.
+        """
+        self._max_bytes = max_bytes
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    # Public getters
+    def get_max_bytes(self):
+        """Returns the memory cap in bytes."""
+        return self._max_bytes
+
+    def get_bytes(self):
+        """Returns the estimated memory used by the entries, in bytes."""
+        return self._bytes
+
+    def get_stats(self):
+        """Returns a dictionary of the cache counters:
+            entries, bytes, max_bytes, hits, misses, evictions and hit_rate.
+        """
+        lookups = self._hits + self._misses
+        return {'entries': len(self._entries), 'bytes': self._bytes, 'max_bytes': self._max_bytes,
+                'hits': self._hits, 'misses': self._misses, 'evictions': self._evictions,
+                'hit_rate': self._hits / lookups if lookups else 0.0}
+
+    # Public methods
+    def get(self, key, default=None):
+        """Returns the value cached for a key, and marks it as the most recently used, or the
+        default if there is none."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        """Caches a value for a key, as the most recently used entry, and evicts the least
+        recently used entries while the cache is over its memory cap."""
+        size = estimate_size(key) + estimate_size(value) + ENTRY_OVERHEAD
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self):
+        """Removes all entries, and resets the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = self._hits = self._misses = self._evictions = 0
+
+    def save(self, path):
+        """Saves the entries to a file (written to a temporary file and moved into place), in
+        least recently used order, so loading them keeps the same order."""
+        with self._lock:
+            items = [(key, entry[0]) for key, entry in self._entries.items()]
+        with open(path + ".tmp", "wb") as file:
+            pickle.dump(items, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + ".tmp", path)
+
+    def load(self, path):
+        """Loads the entries saved to a file by save, if it exists, on top of the current entries
+        (evicting as needed to stay under the cap). Returns the number of entries loaded."""
+        if not os.path.exists(path):
+            return 0
+        with open(path, "rb") as file:
+            items = pickle.load(file)
+        for key, value in items:
+            self.put(key, value)
+        return len(items)
+
+
+class CachedEvaluator:
+    """CachedEvaluator class that memoizes an evaluator applied to a board: any function called
+    as evaluator(board, player_id). Results are cached by position and player to move.
+
+    Attributes:
+        _evaluator : function being memoized.
+        _cache     : PositionCache object holding the results.
+        _namespace : optional key prefix, so several evaluators can share one cache.
+        _canonical : boolean representing whether results are keyed by canonical position.
+    """
+    def __init__(self, evaluator, cache=None, namespace=None, canonical=False):
+        """Initializes a memoized evaluator.
+        Parameters:
+            evaluator : function called as evaluator(board, player_id).
+            cache     : PositionCache object (defaults to a new cache with the default cap).
+            namespace : optional hashable key prefix, needed when several evaluators share a cache.
+            canonical : boolean; if True, a position and its mirror share one entry, which is only
+                        correct if the evaluator's result is from the point of view of the player
+                        to move (see Mancala.Position.canonical).
+        """
+        self._evaluator = evaluator
+        self._cache = PositionCache() if cache is None else cache
+        self._namespace = namespace
+        self._canonical = canonical
+
+    def __call__(self, board, player_id=None):
+        """Returns the (cached) result of the evaluator for a board and player to move."""
+        if player_id is None:
+            player_id = board.get_to_move()
+        key = self.get_key(board, player_id)
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._evaluator(board, player_id)
+            self._cache.put(key, value)
+        return value
+
+    def get_cache(self):
+        """Returns the PositionCache object holding the results."""
+        return self._cache
+
+    def get_key(self, board, player_id):
+        """Returns the cache key of a board and player to move."""
+        position = Mancala.Position(board.get_seed_tuple(), player_id)
+        key = (position.canonical() if self._canonical else position).get_key()
+        return key if self._namespace is None else (self._namespace, key)
+
+
+class CachedEngine:
+    """CachedEngine class that memoizes the searches of a computer player (e.g. a
+    MancalaSearch.SearchEngine, or any object with get_name() and search(board, player_id)
+    methods), so a position searched in one game is not searched again in the next. Has the same
+    choose_move interface, so it can be passed to Mancala.new_game. Search results (a pit number
+    and score of the player to move) are keyed by canonical position.
+
+    Attributes:
+        _engine : computer player being memoized.
+        _search : CachedEvaluator object memoizing the engine's search method.
+    """
+    def __init__(self, engine, cache=None, namespace=None):
+        """Initializes a memoized computer player (see CachedEvaluator for the parameters)."""
+        self._engine = engine
+        self._search = CachedEvaluator(engine.search, cache, namespace, canonical=True)
+
+    def get_name(self):
+        """Returns the name of the computer player."""
+        return self._engine.get_name()
+
+    def get_cache(self):
+        """Returns the PositionCache object holding the results."""
+        return self._search.get_cache()
+
+    def search(self, board, player_id=None):
+        """Returns the (cached) (pit number, score) of the engine's search."""
+        return self._search(board, player_id)
+
+    def choose_move(self, board, player_id=None):
+        """Returns the (cached) best pit number of the engine's search."""
+        return self._search(board, player_id)[0]
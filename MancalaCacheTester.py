@@ -0,0 +1,88 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 15:05
+# Description: Unit tests for MancalaCache.py.
+
+import os
+import tempfile
+import unittest
+import Mancala
+import MancalaCache
+import MancalaSearch
+
+
+class PositionCacheTester(unittest.TestCase):
+    """Unit tests for PositionCache class."""
+
+    def test_lru_eviction(self):
+        """Should evict the least recently used entries once over the memory cap."""
+        entry_size = MancalaCache.estimate_size(b"k0") + MancalaCache.estimate_size(0) + MancalaCache.ENTRY_OVERHEAD
+        cache = MancalaCache.PositionCache(max_bytes=3 * entry_size)
+        for i in range(3):
+            cache.put(f"k{i}".encode(), i)
+        self.assertEqual(cache.get(b"k0"), 0)
+        cache.put(b"k3", 3)
+        self.assertNotIn(b"k1", cache)
+        self.assertEqual([key in cache for key in (b"k0", b"k2", b"k3")], [True, True, True])
+        self.assertIsNone(cache.get(b"k1"))
+        stats = cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions'], stats['entries']), (1, 1, 1, 3))
+        self.assertLessEqual(cache.get_bytes(), cache.get_max_bytes())
+
+    def test_save_and_load(self):
+        """Should load the saved entries, in the same recency order."""
+        cache = MancalaCache.PositionCache()
+        for i in range(5):
+            cache.put(i, (i, -i))
+        cache.get(0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.pickle")
+            cache.save(path)
+            loaded = MancalaCache.PositionCache()
+            self.assertEqual(loaded.load(path), 5)
+            self.assertEqual(loaded.load(os.path.join(directory, "missing.pickle")), 0)
+        self.assertEqual(list(loaded._entries), [1, 2, 3, 4, 0])
+        self.assertEqual(loaded.get(3), (3, -3))
+
+
+class CachedEvaluatorTester(unittest.TestCase):
+    """Unit tests for CachedEvaluator and CachedEngine classes."""
+
+    def test_evaluates_each_position_once(self):
+        """Should call the evaluator once per position and player to move, across boards."""
+        calls = []
+
+        def evaluator(board, player_id):
+            calls.append(player_id)
+            return board.get_store_seeds(player_id) - board.get_store_seeds(3 - player_id)
+
+        evaluate = MancalaCache.CachedEvaluator(evaluator)
+        for board in (Mancala.Board(), Mancala.Board(), Mancala.Board()):
+            board.apply_move(1, 3)
+            self.assertEqual(evaluate(board, 1), 1)
+            self.assertEqual(evaluate(board, 2), -1)
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(evaluate.get_cache().get_stats()['hits'], 4)
+
+    def test_cached_engine(self):
+        """Should play the same moves as the engine, and search repeated positions only once."""
+        cache = MancalaCache.PositionCache()
+        engine = MancalaSearch.SearchEngine(max_depth=4, time_limit=None)
+        cached = MancalaCache.CachedEngine(engine, cache, namespace="search")
+        board = Mancala.Board()
+        self.assertEqual(cached.choose_move(board, 1), engine.choose_move(board, 1))
+        self.assertEqual(cached.search(Mancala.Board(), 1), engine.search(board, 1))
+        self.assertEqual(cache.get_stats()['hits'], 1)
+        self.assertEqual(cached.get_name(), "Computer")
+
+        # The mirror of a searched position, with the other player to move, shares its entry.
+        board.make_move(1, 1)
+        mirror = board.get_position().mirror().to_board()
+        self.assertEqual(cached.search(mirror, 1), cached.search(board, 2))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get_stats()['hits'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,350 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 12:30
+# Description: Implements an endgame database for the Mancala board game, solved by retrograde analysis.
+#
+# The module implements the following class:
+#   EndgameTable - EndgameTable class representing a memory-mapped, solved endgame database file.
+#
+# An endgame position is described by the seeds left in the pits only, from the point of view of the player to move:
+# the player's own pits 1..num_pits, followed by the opponent's pits 1..num_pits. The stores do not matter for the
+# rest of the game, so the value of a position is the best achievable margin of the seeds still to be collected:
+# (seeds the player to move will still collect) - (seeds the opponent will still collect), with perfect play by both.
+# The exact final margin of a board is then the store difference plus this value.
+#
+# Positions are grouped into levels by the number of seeds left in the pits. A move can never add seeds to the pits,
+# so a position only depends on positions of the same or a lower level, and the levels are solved from 0 seeds up.
+# Within a level, a move that keeps every seed in the pits moves seeds strictly closer to the mover's store, so the
+# potential sum(seeds * distance to the store of their side) strictly decreases. Solving each level in increasing
+# order of potential therefore solves every position after all of the positions it depends on.
+#
+# Every position with up to max_seeds seeds is indexed by a perfect combinatorial ranking (stars and bars), so the
+# table is a dense array of signed bytes with one value per position, and a lookup is O(num_pits). The table is
+# built directly into the file through a memory map, and read through a memory map, so several worker processes
+# can share one copy of it through the page cache.
+#
+# To build a table, simply call:
+#       build_endgame_table("endgame.db", max_seeds=10)
+# or from the command line:
+#       python MancalaEndgame.py endgame.db --max-seeds 10
+
+import argparse
+import mmap
+import struct
+
+import Mancala
+
+MAGIC = b"MNCLEGDB"
+HEADER = struct.Struct("<8sHHI")    # Magic, num_pits, max_seeds, number of positions.
+
+
+def binomial_table(size):
+    """Returns a table of binomial coefficients, where table[n][k] is n choose k, for n < size."""
+    table = [[0] * size for _ in range(size)]
+    for n in range(size):
+        table[n][0] = 1
+        for k in range(1, n + 1):
+            table[n][k] = table[n - 1][k - 1] + table[n - 1][k]
+    return table
+
+
+def count_positions(max_seeds, num_parts, binomials=None):
+    """Returns the number of ways to put up to max_seeds seeds into num_parts pits."""
+    if binomials is None:
+        binomials = binomial_table(max_seeds + num_parts + 1)
+    return binomials[max_seeds + num_parts][num_parts]
+
+
+def rank(pits, binomials):
+    """Returns the index of a position among all positions with up to sum(pits) seeds: the
+    positions with fewer seeds come first, then the positions with the same number of seeds in
+    lexicographic order.
+
+    Parameters:
+        pits      : sequence of seed counts.
+        binomials : binomial table (see binomial_table), with at least sum(pits) + len(pits) + 1 rows.
+    """
+    parts = len(pits)
+    remaining = sum(pits)
+    # Positions with fewer seeds.
+    index = binomials[remaining - 1 + parts][parts] if remaining else 0
+    # Positions with the same number of seeds, and the same prefix, but a smaller count at pit i:
+    # sum over v < pits[i] of the ways to put (remaining - v) seeds in the (parts - i - 1) later pits.
+    for i in range(parts - 1):
+        later = parts - i - 1
+        count = pits[i]
+        if count:
+            index += binomials[remaining + later][later] - binomials[remaining - count + later][later]
+            remaining -= count
+    return index
+
+
+def unrank(index, total, parts, binomials):
+    """Returns the position of a given index among the positions with `total` seeds in `parts`
+    pits: the inverse of rank, less the positions with fewer seeds.
+
+    Parameters:
+        index     : integer representing the index of the position within its level.
+        total     : integer representing the number of seeds of the position.
+        parts     : integer representing the number of pits.
+        binomials : binomial table (see binomial_table), with at least total + parts + 1 rows.
+    """
+    pits = []
+    remaining = total
+    for i in range(parts - 1):
+        later = parts - i - 1
+        whole = binomials[remaining + later][later]
+        # Skip the positions with fewer seeds in pit i, as counted by rank.
+        count = 0
+        while whole - binomials[remaining - count - 1 + later][later] <= index:
+            count += 1
+        index -= whole - binomials[remaining - count + later][later]
+        remaining -= count
+        pits.append(count)
+    pits.append(remaining)
+    return pits
+
+
+def compositions(total, parts):
+    """Yields every way to put `total` seeds into `parts` pits, as lists, in lexicographic order
+    (the same order as rank)."""
+    if parts == 1:
+        yield [total]
+        return
+    for first in range(total + 1):
+        for rest in compositions(total - first, parts - 1):
+            yield [first] + rest
+
+
+def play_relative(pits, pit, num_pits):
+    """Plays a move on an endgame position, following the same rules as Board.apply_move.
+
+    Parameters:
+        pits     : list of 2 * num_pits seed counts, the player's pits then the opponent's pits.
+        pit      : integer representing the player's pit index (0 to num_pits - 1).
+        num_pits : integer representing the number of pits per player.
+    Returns:
+        Tuple (pits after the move, seeds added to the player's store, extra turn).
+    """
+    # Play it as player 1 on a flat board, with the player's store between the two sides, and the
+    # (skipped) opponent's store at the end.
+    board = pits[:num_pits] + [0] + pits[num_pits:] + [0]
+    _, kind, _, _, _ = Mancala.sowing_table(num_pits).play(board, 1, pit + 1)
+    return board[:num_pits] + board[num_pits + 1:-1], board[num_pits], kind == Mancala.LANDS_STORE
+
+
+def potential(pits, num_pits):
+    """Returns the sum over every seed of its distance to the store of its side."""
+    return sum((num_pits - i % num_pits) * count for i, count in enumerate(pits))
+
+
+def solve_position(pits, num_pits, value_of):
+    """Returns the value of an endgame position, given the values of the positions it can move to.
+
+    Parameters:
+        pits     : list of 2 * num_pits seed counts, the player's pits then the opponent's pits.
+        num_pits : integer representing the number of pits per player.
+        value_of : function returning the value of a (solved) position.
+    """
+    own, opponent = sum(pits[:num_pits]), sum(pits[num_pits:])
+    # The game is over: the remaining seeds go to each player's store.
+    if own == 0 or opponent == 0:
+        return own - opponent
+
+    best = None
+    for pit in range(num_pits):
+        if pits[pit] == 0:
+            continue
+        child, gain, extra_turn = play_relative(pits, pit, num_pits)
+        if extra_turn:
+            value = gain + value_of(child)
+        else:
+            value = gain - value_of(child[num_pits:] + child[:num_pits])
+        if best is None or value > best:
+            best = value
+    return best
+
+
+def level_order(level, num_pits):
+    """Returns the positions with `level` seeds, as (rank within the level, pits) tuples, in an
+    order where every position comes after the positions of the same level it can move to."""
+    buckets = {}
+    for index, pits in enumerate(compositions(level, 2 * num_pits)):
+        buckets.setdefault(potential(pits, num_pits), []).append((index, pits))
+    return [item for key in sorted(buckets) for item in buckets[key]]
+
+
+def build_endgame_table(path, max_seeds, num_pits=6, progress=False):
+    """Builds an endgame table of every position with up to max_seeds seeds in the pits, and
+    writes it to a file. The values are written straight into the memory-mapped file, so the
+    table does not need to fit in memory.
+
+    Parameters:
+        path      : string representing the path of the file to write.
+        max_seeds : integer representing the most seeds in the pits (at most 127).
+        num_pits  : integer representing the number of pits per player.
+        progress  : boolean representing whether to print a line per solved level.
+    Returns:
+        EndgameTable object reading the file.
+    """
+    if not 0 <= max_seeds <= 127:
+        raise ValueError("max_seeds must be between 0 and 127.")
+    parts = 2 * num_pits
+    binomials = binomial_table(max_seeds + parts + 1)
+    size = count_positions(max_seeds, parts, binomials)
+
+    # Create the file, and map it for writing. The header only covers level 0 (a single position
+    # worth 0, solved by the zeroed file) until more levels are solved.
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, num_pits, 0, 1))
+        file.truncate(HEADER.size + size)
+    with open(path, "r+b") as file:
+        table = mmap.mmap(file.fileno(), 0)
+        try:
+            def value_of(pits):
+                value = table[HEADER.size + rank(pits, binomials)]
+                return value - 256 if value > 127 else value
+
+            for level in range(max_seeds + 1):
+                offset = HEADER.size + (binomials[level - 1 + parts][parts] if level else 0)
+                for index, pits in level_order(level, num_pits):
+                    table[offset + index] = solve_position(pits, num_pits, value_of) & 0xff
+
+                # Record the solved level in the header, so an interrupted build is still a valid table.
+                HEADER.pack_into(table, 0, MAGIC, num_pits, level, count_positions(level, parts, binomials))
+                table.flush()
+                if progress:
+                    print(f"level {level}: {binomials[level + parts - 1][parts - 1]} positions")
+        finally:
+            table.close()
+    return EndgameTable(path)
+
+
+class EndgameTable:
+    """EndgameTable class representing a solved endgame database file, read through a read-only
+    memory map so that several processes can share one copy.
+
+    Attributes:
+        _num_pits  : integer representing the number of pits per player.
+        _max_seeds : integer representing the most seeds in the pits of a position in the table.
+        _size      : integer representing the number of positions in the table.
+        _binomials : binomial table used to rank positions.
+        _file      : file object of the table.
+        _table     : mmap object of the table.
+    """
+    def __init__(self, path):
+        """Opens an endgame table file."""
+        self._file = open(path, "rb")
+        self._table = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._num_pits, self._max_seeds, self._size = HEADER.unpack_from(self._table)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an endgame table.")
+        self._binomials = binomial_table(self._max_seeds + 2 * self._num_pits + 1)
+
+    def __getstate__(self):
+        """Pickles the table by its path, so it can be sent to worker processes."""
+        return {'path': self._file.name}
+
+    def __setstate__(self, state):
+        """Reopens the table in a worker process."""
+        self.__init__(state['path'])
+
+    # Public getters
+    def get_num_pits(self):
+        """Returns the number of pits per player."""
+        return self._num_pits
+
+    def get_max_seeds(self):
+        """Returns the most seeds in the pits of a position in the table."""
+        return self._max_seeds
+
+    def get_size(self):
+        """Returns the number of positions in the table."""
+        return self._size
+
+    # Public methods
+    def lookup(self, pits):
+        """Returns the value of an endgame position (see the module description), or None if
+        it has more than max_seeds seeds.
+        Parameters:
+            pits : sequence of 2 * num_pits seed counts, the player to move's pits then the
+                    opponent's pits.
+        Raises:
+            ValueError if the position does not have 2 * num_pits pits.
+        """
+        if len(pits) != 2 * self._num_pits:
+            raise ValueError(f"The position has {len(pits)} pits, but the table is for {2 * self._num_pits}.")
+        if sum(pits) > self._max_seeds:
+            return None
+        value = self._table[HEADER.size + rank(pits, self._binomials)]
+        return value - 256 if value > 127 else value
+
+    def probe(self, board, player_id=None):
+        """Returns the exact final margin (player's final total - opponent's final total) of a
+        board with perfect play, or None if the board has too many seeds left in the pits.
+        Parameters:
+            board     : Board object with num_pits pits.
+            player_id : integer representing the player id (1 or 2) to move. Defaults to the
+                          board's player to move.
+        """
+        if player_id is None:
+            player_id = board.get_to_move()
+        value = self.lookup(board.get_pit_seeds(player_id) + board.get_pit_seeds(3 - player_id))
+        if value is None:
+            return None
+        return board.get_store_seeds(player_id) - board.get_store_seeds(3 - player_id) + value
+
+    def get_move_values(self, board, player_id=None):
+        """Returns a dictionary mapping each legal pit number of a board to the exact final margin
+        after playing it, or None if the board has too many seeds left in the pits or the game is
+        over."""
+        if player_id is None:
+            player_id = board.get_to_move()
+        pits = board.get_pit_seeds(player_id) + board.get_pit_seeds(3 - player_id)
+        if sum(pits) > self._max_seeds or board.is_game_over():
+            return None
+        num_pits = self._num_pits
+        stores = board.get_store_seeds(player_id) - board.get_store_seeds(3 - player_id)
+        values = {}
+        for pit in range(num_pits):
+            if pits[pit] == 0:
+                continue
+            child, gain, extra_turn = play_relative(pits, pit, num_pits)
+            if extra_turn:
+                value = gain + self.lookup(child)
+            else:
+                value = gain - self.lookup(child[num_pits:] + child[:num_pits])
+            values[pit + 1] = stores + value
+        return values
+
+    def best_move(self, board, player_id=None):
+        """Returns the (pit number, final margin) of the best move on a board, or None if the
+        board has too many seeds left in the pits or the game is over."""
+        values = self.get_move_values(board, player_id)
+        if values is None:
+            return None
+        pit = max(values, key=values.get)
+        return pit, values[pit]
+
+    def close(self):
+        """Closes the table file."""
+        self._table.close()
+        self._file.close()
+
+
+def main():
+    """Builds an endgame table from the command line."""
+    parser = argparse.ArgumentParser(description="Builds a Mancala endgame table.")
+    parser.add_argument("path", help="file to write")
+    parser.add_argument("--max-seeds", type=int, default=10, help="most seeds left in the pits")
+    parser.add_argument("--num-pits", type=int, default=6)
+    args = parser.parse_args()
+    table = build_endgame_table(args.path, args.max_seeds, args.num_pits, progress=True)
+    print(f"{table.get_size()} positions written to {args.path}")
+    table.close()
+
+
+if __name__ == "__main__":
+    main()
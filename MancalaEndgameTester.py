@@ -0,0 +1,123 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 12:30
+# Description: Unit tests for MancalaEndgame.py.
+
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+import Mancala
+import MancalaEndgame
+import MancalaSearch
+
+
+def solve(board):
+    """Reference exhaustive search of the final margin for the player to move."""
+    player = board.get_to_move()
+    if board.is_game_over():
+        return (board.get_store_seeds(player) + sum(board.get_pit_seeds(player))
+                - board.get_store_seeds(3 - player) - sum(board.get_pit_seeds(3 - player)))
+    best = None
+    for pit in range(1, board.get_num_pits() + 1):
+        if board.get_seeds(player, pit) == 0:
+            continue
+        board.make_move(player, pit)
+        score = solve(board)
+        if board.get_to_move() != player:
+            score = -score
+        board.unmake_move()
+        best = score if best is None else max(best, score)
+    return best
+
+
+class EndgameTableTester(unittest.TestCase):
+    """Unit tests for EndgameTable class."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.table = MancalaEndgame.build_endgame_table(os.path.join(cls.directory.name, "endgame.db"), 6)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.table.close()
+        cls.directory.cleanup()
+
+    def test_rank_is_dense(self):
+        """Should rank every position with up to 4 seeds in 3 pits to a distinct index, in order."""
+        binomials = MancalaEndgame.binomial_table(10)
+        indices = [MancalaEndgame.rank(pits, binomials)
+                   for total in range(5) for pits in MancalaEndgame.compositions(total, 3)]
+        self.assertEqual(indices, list(range(MancalaEndgame.count_positions(4, 3))))
+        for total in range(5):
+            for index, pits in enumerate(MancalaEndgame.compositions(total, 3)):
+                self.assertEqual(MancalaEndgame.unrank(index, total, 3, binomials), pits)
+
+    def test_same_as_exhaustive_search(self):
+        """Should give the same final margin as an exhaustive search on random endgames."""
+        rng = random.Random(1)
+        self.assertEqual(self.table.get_size(), MancalaEndgame.count_positions(6, 12))
+        for _ in range(40):
+            seeds = [0] * 14
+            for _ in range(rng.randint(1, 6)):
+                seeds[rng.choice([i for i in range(14) if i not in (6, 13)])] += 1
+            seeds[6], seeds[13] = rng.randint(0, 20), rng.randint(0, 20)
+            board = Mancala.Board()
+            board.set_seed_list(seeds)
+            board.set_to_move(rng.randint(1, 2))
+            self.assertEqual(self.table.probe(board), solve(board))
+            if not board.is_game_over():
+                pit, margin = self.table.best_move(board)
+                self.assertEqual(margin, solve(board))
+                self.assertGreater(board.get_seeds(board.get_to_move(), pit), 0)
+
+    def test_too_many_seeds(self):
+        """Should not answer for positions with more seeds than the table holds."""
+        self.assertEqual(self.table.probe(Mancala.Board()), None)
+
+    def test_search_uses_table(self):
+        """Should let the search engine score endgames exactly at depth 1."""
+        board = Mancala.Board()
+        board.set_seed_list([0, 0, 0, 1, 1, 1, 20, 1, 0, 0, 2, 0, 0, 22])
+        engine = MancalaSearch.SearchEngine(max_depth=1, time_limit=None, endgame=self.table)
+        self.assertEqual(engine.search(board, 1)[1], solve(board))
+
+    def test_other_board_size(self):
+        """Should refuse positions of another board size, and not be probed by the search on
+        boards of another size."""
+        self.assertRaises(ValueError, self.table.lookup, [1, 0, 0, 0, 1, 0])
+        board = Mancala.Board(num_pits=3, num_seeds=0)
+        board.set_seed_list([0, 1, 0, 9, 1, 0, 0, 9])
+        self.assertRaises(ValueError, self.table.probe, board)
+        engine = MancalaSearch.SearchEngine(max_depth=1, time_limit=None, endgame=self.table)
+        plain = MancalaSearch.SearchEngine(max_depth=1, time_limit=None)
+        self.assertEqual(engine.search(board, 1), plain.search(board, 1))
+
+    def test_interrupted_build(self):
+        """Should leave a valid table of the levels solved when a build is interrupted."""
+        solve_position = MancalaEndgame.solve_position
+
+        def interrupt_at_level_3(pits, num_pits, value_of):
+            if sum(pits) == 3:
+                raise KeyboardInterrupt()
+            return solve_position(pits, num_pits, value_of)
+
+        path = os.path.join(self.directory.name, "interrupted.db")
+        with mock.patch.object(MancalaEndgame, "solve_position", interrupt_at_level_3):
+            self.assertRaises(KeyboardInterrupt, MancalaEndgame.build_endgame_table, path, 6)
+        table = MancalaEndgame.EndgameTable(path)
+        try:
+            self.assertEqual((table.get_max_seeds(), table.get_size()), (2, MancalaEndgame.count_positions(2, 12)))
+            for total in range(4):
+                for pits in MancalaEndgame.compositions(total, 12):
+                    expected = self.table.lookup(pits) if total <= 2 else None
+                    self.assertEqual(table.lookup(pits), expected)
+        finally:
+            table.close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
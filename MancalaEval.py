@@ -0,0 +1,181 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 18:20
+# Description: Implements a static evaluation function for Mancala positions, vectorized over batches with NumPy.
+#
+# The module implements the following class:
+#   Evaluator - Evaluator class that scores positions from a weighted sum of features.
+#
+# Positions are given as seed counts in the same flat layout as Board.get_seed_list (and BatchSimulator):
+#   | p1 pits 1..num_pits | p1 store | p2 pits 1..num_pits | p2 store |
+# and are scored from the point of view of the player to move. Each feature is the player's value minus the
+# opponent's value, so the score of a position is the negation of its score for the other player (as negamax needs):
+#   store       - seeds in the store.
+#   seeds       - seeds in the pits of the side.
+#   captures    - best capture available: seeds taken by a move whose last seed lands in an empty pit of the side
+#                   (the seeds of the opposing pit, the pit's _adjacent, plus the sowing seed).
+#   extra_turns - number of moves whose last seed lands in the store.
+#   overflow    - seeds that moving every pit of the side would sow into the other side's pits.
+#
+# Where each move lands, and how many seeds it sows into the other side, is read from the board's precomputed sowing
+# table (see Mancala.SowingTable) rather than simulated.
+#
+# Evaluator.evaluate_batch scores a whole (N, 2 * num_pits + 2) array of positions with a few NumPy array operations.
+# Evaluator.evaluate is the scalar fast path for a single position, in plain Python, since the fixed cost of NumPy
+# calls outweighs the work for one position; both give the same scores.
+#
+# To score the leaves of a search with the evaluator, simply call:
+#       SearchEngine(evaluator=Evaluator(num_pits=6))
+#
+# Requires NumPy.
+
+import numpy as np
+
+import Mancala
+
+FEATURES = ('store', 'seeds', 'captures', 'extra_turns', 'overflow')
+
+DEFAULT_WEIGHTS = {'store': 1.0, 'seeds': 0.25, 'captures': 0.5, 'extra_turns': 0.75, 'overflow': -0.25}
+
+
+class Evaluator:
+    """Evaluator class that scores positions, from the point of view of the player to move, as
+    a weighted sum of features (see the module description).
+
+    Attributes:
+        _num_pits : integer representing the number of pits per player.
+        _weights  : (len(FEATURES),) float array of the feature weights, in FEATURES order.
+        _scalar   : tuple of the same weights as Python floats, for the scalar path.
+        _orders   : (3, 2 * num_pits + 2) integer array, where _orders[player] lists the flat
+                      indices of the player's pits, store, then the opponent's pits and store.
+        _sowing   : Mancala.SowingTable object of the board size.
+        _kinds    : (num_pits, 2 * num_pits + 2) integer array of the sowing table's landing kinds.
+        _landings : (num_pits, 2 * num_pits + 2) integer array of the sowing table's landings.
+        _overflow : (num_pits, 2 * num_pits + 2) integer array of the seeds the sowing table's
+                      remainders sow into the other side.
+    """
+    def __init__(self, num_pits=6, weights=None):
+        """Initializes an evaluator.
+        Parameters:
+            num_pits : integer representing the number of pits per player.
+            weights  : dictionary mapping feature names to weights; features left out keep
+                        their DEFAULT_WEIGHTS weight.
+        """
+        unknown = set(weights or ()) - set(FEATURES)
+        if unknown:
+            raise ValueError(f"Unknown features: {', '.join(sorted(unknown))}.")
+        merged = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self._num_pits = num_pits
+        self._weights = np.array([merged[name] for name in FEATURES], dtype=np.float64)
+        self._scalar = tuple(self._weights.tolist())
+        size = 2 * num_pits + 2
+        self._orders = np.zeros((3, size), dtype=np.intp)
+        self._orders[1] = np.arange(size)
+        self._orders[2] = np.roll(np.arange(size), -(num_pits + 1))
+        self._sowing = Mancala.sowing_table(num_pits)
+        self._kinds = np.array(self._sowing.get_kinds())
+        self._landings = np.array(self._sowing.get_landings())
+        self._overflow = np.array(self._sowing.get_opponent_gains())
+
+    # Public getters
+    def get_num_pits(self):
+        """Returns the number of pits per player."""
+        return self._num_pits
+
+    def get_weights(self):
+        """Returns a dictionary mapping feature names to weights."""
+        return dict(zip(FEATURES, self._weights.tolist()))
+
+    # Public methods
+    def __call__(self, board, player_id=None):
+        """Returns the score of a board for a player (defaults to the board's player to move)."""
+        if player_id is None:
+            player_id = board.get_to_move()
+        return self.evaluate(board.get_seed_tuple(), player_id)
+
+    def features(self, seeds, to_move):
+        """Returns the features of a batch of positions.
+        Parameters:
+            seeds   : (N, 2 * num_pits + 2) integer array of positions in the flat layout.
+            to_move : player id (1 or 2) to move, or (N,) integer array of one per position.
+        Returns:
+            (N, len(FEATURES)) integer array of the features, in FEATURES order.
+        """
+        n = self._num_pits
+        seeds = np.asarray(seeds)
+        to_move = np.broadcast_to(np.asarray(to_move), seeds.shape[:1])
+        # Orient every position so the player to move comes first.
+        oriented = np.take_along_axis(seeds, self._orders[to_move], axis=1)
+        own, opponent = oriented[:, :n], oriented[:, n + 1:2 * n + 1]
+        store = oriented[:, n] - oriented[:, 2 * n + 1]
+        return np.column_stack([store] + [a - b for a, b in zip(self._side_features(own, opponent),
+                                                                 self._side_features(opponent, own))])
+
+    def evaluate_batch(self, seeds, to_move):
+        """Returns the (N,) float array of the scores of a batch of positions (see features for
+        the parameters)."""
+        return self.features(seeds, to_move) @ self._weights
+
+    def evaluate(self, seeds, player_id):
+        """Returns the score of one position, in plain Python.
+        Parameters:
+            seeds     : sequence of seed counts in the flat layout (e.g. Board.get_seed_tuple).
+            player_id : integer representing the player id (1 or 2) to move.
+        """
+        n = self._num_pits
+        if player_id == 1:
+            own, opponent, store = seeds[:n], seeds[n + 1:2 * n + 1], seeds[n] - seeds[2 * n + 1]
+        else:
+            own, opponent, store = seeds[n + 1:2 * n + 1], seeds[:n], seeds[2 * n + 1] - seeds[n]
+        weights = self._scalar
+        score = weights[0] * store
+        for weight, a, b in zip(weights[1:], self._side_scalar(own, opponent), self._side_scalar(opponent, own)):
+            score += weight * (a - b)
+        return score
+
+    # Private methods
+    def _side_features(self, own, opponent):
+        """Returns the (seeds, captures, extra_turns, overflow) (N,) arrays of one side, given
+        the (N, num_pits) pit arrays of the side and of the other side."""
+        n = self._num_pits
+        pits = np.arange(n)
+        moves = own > 0
+        laps, remainder = np.divmod(np.maximum(own - 1, 0), 2 * n + 1)
+        remainder += 1
+        kinds = self._kinds[pits, remainder]
+        landings = self._landings[pits, remainder]
+
+        # Moves ending in the store, and the seeds sown into the other side (n per full lap).
+        extra_turns = (moves & (kinds == Mancala.LANDS_STORE)).sum(axis=1)
+        overflow = np.where(moves, laps * n + self._overflow[pits, remainder], 0).sum(axis=1)
+
+        # Moves without a full lap ending in an empty pit of the side (or the emptied pit played).
+        reachable = moves & (laps == 0) & (kinds == Mancala.LANDS_OWN_PIT)
+        target = np.where(reachable, landings, 0)
+        empty = (np.take_along_axis(own, target, axis=1) == 0) | (target == pits)
+        taken = np.take_along_axis(opponent, n - 1 - target, axis=1) + 1
+        captures = np.where(reachable & empty, taken, 0).max(axis=1)
+        return own.sum(axis=1), captures, extra_turns, overflow
+
+    def _side_scalar(self, own, opponent):
+        """Returns the (seeds, captures, extra_turns, overflow) of one side of one position."""
+        n = self._num_pits
+        cycle = 2 * n + 1
+        kinds, landings = self._sowing.get_kinds(), self._sowing.get_landings()
+        overflows = self._sowing.get_opponent_gains()
+        captures = extra_turns = overflow = 0
+        for pit, count in enumerate(own):
+            if count == 0:
+                continue
+            laps, remainder = divmod(count - 1, cycle)
+            remainder += 1
+            kind = kinds[pit][remainder]
+            if kind == Mancala.LANDS_STORE:
+                extra_turns += 1
+            overflow += laps * n + overflows[pit][remainder]
+            if kind == Mancala.LANDS_OWN_PIT and not laps:
+                landing = landings[pit][remainder]
+                if own[landing] == 0 or landing == pit:
+                    captures = max(captures, opponent[n - 1 - landing] + 1)
+        return sum(own), captures, extra_turns, overflow
@@ -0,0 +1,75 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 18:20
+# Description: Unit tests for MancalaEval.py.
+
+import random
+import unittest
+import Mancala
+import MancalaSearch
+
+try:
+    import numpy as np
+    import MancalaEval
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class EvaluatorTester(unittest.TestCase):
+    """Unit tests for Evaluator class."""
+
+    def test_features(self):
+        """Should compute each feature from the point of view of the player to move."""
+        evaluator = MancalaEval.Evaluator(6)
+        seeds = [0, 0, 0, 1, 1, 1, 20, 1, 0, 0, 2, 0, 0, 22]
+        self.assertEqual(evaluator.features([seeds], 1).tolist(), [[-2, 0, -2, 1, 0]])
+        self.assertEqual(evaluator.features([seeds], 2).tolist(), [[2, 0, 2, -1, 0]])
+        seeds = [0, 0, 0, 0, 0, 15, 0, 0, 0, 0, 0, 0, 0, 33]
+        self.assertEqual(evaluator.features([seeds], 1).tolist(), [[-33, 15, 0, 0, 7]])
+
+    def test_batch_same_as_scalar(self):
+        """Should give the same scores one position at a time as in a batch, negated for the
+        other player."""
+        rng = random.Random(2)
+        for num_pits, num_seeds in ((6, 4), (4, 12), (3, 1)):
+            evaluator = MancalaEval.Evaluator(num_pits, {'overflow': -0.5})
+            positions, players = [], []
+            for _ in range(50):
+                board = Mancala.Board(num_pits, num_seeds)
+                player = rng.randint(1, 2)
+                for _ in range(rng.randint(0, 12)):
+                    if board.is_game_over():
+                        break
+                    if not board.apply_move(player, rng.choice(board.get_legal_moves(player))).is_extra_turn():
+                        player = 3 - player
+                positions.append(board.get_seed_list())
+                players.append(player)
+            scores = evaluator.evaluate_batch(np.array(positions), np.array(players))
+            for seeds, player, score in zip(positions, players, scores.tolist()):
+                self.assertAlmostEqual(evaluator.evaluate(tuple(seeds), player), score)
+                self.assertAlmostEqual(evaluator.evaluate(tuple(seeds), 3 - player), -score)
+
+    def test_weights(self):
+        """Should apply the configured weights, and reject unknown features."""
+        evaluator = MancalaEval.Evaluator(6, {'store': 2.0, 'seeds': 0, 'captures': 0, 'extra_turns': 0,
+                                              'overflow': 0})
+        board = Mancala.Board()
+        board.set_seed_list([0, 0, 0, 1, 1, 1, 20, 1, 0, 0, 2, 0, 0, 22])
+        self.assertEqual(evaluator(board, 1), -4.0)
+        self.assertEqual(evaluator.get_weights()['store'], 2.0)
+        self.assertEqual(MancalaEval.Evaluator().get_weights(), MancalaEval.DEFAULT_WEIGHTS)
+        self.assertRaises(ValueError, MancalaEval.Evaluator, 6, {'mobility': 1.0})
+
+    def test_search_leaves(self):
+        """Should let the search engine score its leaves with the evaluator."""
+        engine = MancalaSearch.SearchEngine(max_depth=3, time_limit=None, evaluator=MancalaEval.Evaluator(6))
+        board = Mancala.Board()
+        move, score = engine.search(board, 1)
+        self.assertIn(move, board.get_legal_moves(1))
+        self.assertIsInstance(score, float)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
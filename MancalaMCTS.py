@@ -0,0 +1,413 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 13:10
+# Description: Implements a Monte Carlo Tree Search (UCT) computer opponent for the Mancala board game.
+#
+# The module implements the following classes:
+#   TreeNode - TreeNode class representing one node of the search tree.
+#   MCTSEngine - MCTSEngine class that picks a move for the player to move by Monte Carlo Tree Search.
+#
+# Each iteration of the search selects a path down the tree with UCT (the child maximizing its mean reward plus an
+# exploration bonus), expands one untried move, plays the rest of the game out with uniformly random moves, and adds
+# the result (1 for a win, 0.5 for a tie, 0 for a loss) to every node on the path. The reward of a node is kept from
+# the point of view of the player who made the move into it, so a move that earns another turn (where the same
+# player moves again) needs no special handling: a node simply records who moved and who is to move next.
+#
+# Nodes are kept small (__slots__, no parent pointers or positions). The positions along a path are rebuilt from the
+# root's seeds by replaying the moves, and the tree descent and random playouts both run on a flat seed list (the
+# Board layout) with the sow function, rather than on Board objects or Mancala.play_game.
+#
+# The search runs until the time (time_limit) or playout (playout_limit) budget runs out, but always plays at least
+# one playout, so the root has a move to choose. With processes > 1, the search is root-parallel: every worker
+# process grows its own tree from the same root, and the visit counts of the root moves are summed. The worker pool
+# is kept between moves, and stopped by close() (or on leaving a with block). Between moves, the subtree of the
+# position actually reached is kept as the new root.
+#
+# To play a game against the computer, simply call:
+#       with MCTSEngine() as engine:
+#           Mancala().new_game(engines={2: engine})
+
+import math
+import multiprocessing
+import random
+import time
+
+import Mancala
+
+# The deepest (in plies) a later position is looked for in the previous tree, to reuse its subtree.
+REUSE_PLIES = 4
+
+
+def pit_totals(seeds, num_pits):
+    """Returns the running pit totals [0, player 1 pit seeds, player 2 pit seeds] of a flat seed
+    list, in the same form as Board._pit_totals."""
+    return [0, sum(seeds[:num_pits]), sum(seeds[num_pits + 1:2 * num_pits + 1])]
+
+
+def sow(seeds, totals, player, pit_number, sowing):
+    """Plays a move in place on a flat seed list, following the same rules as Board.apply_move
+    (without the final tally), with the sowing table's play. The move must be valid.
+
+    Parameters:
+        seeds      : list of seed counts in the Board.get_seed_list layout.
+        totals     : list of running pit totals (see pit_totals), updated in place.
+        player     : integer representing the player id (1 or 2) to move.
+        pit_number : integer representing the player pit number (1 to num_pits).
+        sowing     : Mancala.SowingTable object of the board size (see Mancala.sowing_table).
+    Returns:
+        Integer representing the player id to move next, or 0 if the game is over.
+    """
+    _, kind, _, own_change, opponent_change = sowing.play(seeds, player, pit_number)
+    totals[player] += own_change
+    totals[3 - player] += opponent_change
+    if not totals[1] or not totals[2]:
+        return 0
+    return player if kind == Mancala.LANDS_STORE else 3 - player
+
+
+def random_playout(seeds, totals, to_move, sowing, rng):
+    """Plays uniformly random moves in place on a flat seed list until the game is over.
+
+    Parameters:
+        seeds   : list of seed counts in the Board.get_seed_list layout.
+        totals  : list of running pit totals (see pit_totals), updated in place.
+        to_move : integer representing the player id to move (0 if the game is already over).
+        sowing  : Mancala.SowingTable object of the board size (see Mancala.sowing_table).
+        rng     : random.Random object.
+    Returns:
+        Integer representing player 1's final total minus player 2's.
+    """
+    num_pits = len(seeds) // 2 - 1
+    draw = rng.random
+    while to_move:
+        # Draw pits until a non-empty one comes up (uniform over the non-empty pits).
+        start = (to_move - 1) * (num_pits + 1)
+        pit = int(draw() * num_pits)
+        while not seeds[start + pit]:
+            pit = int(draw() * num_pits)
+        to_move = sow(seeds, totals, to_move, pit + 1, sowing)
+    return seeds[num_pits] + totals[1] - seeds[2 * num_pits + 1] - totals[2]
+
+
+class TreeNode:
+    """TreeNode class representing one node of the search tree, reached by a single move.
+
+    Attributes:
+        _move     : integer representing the pit number played to reach the node (None at the root).
+        _player   : integer representing the player id who played the move; the node's reward
+                     is from this player's point of view.
+        _to_move  : integer representing the player id to move at the node (0 if the game is over).
+        _untried  : list of the pit numbers not expanded yet.
+        _children : list of TreeNode objects of the expanded moves.
+        _visits   : integer representing the number of playouts through the node.
+        _value    : float representing the total reward of those playouts.
+    """
+    __slots__ = ('_move', '_player', '_to_move', '_untried', '_children', '_visits', '_value')
+
+    def __init__(self, move, player, to_move, untried):
+        """Initializes an unvisited node."""
+        self._move = move
+        self._player = player
+        self._to_move = to_move
+        self._untried = untried
+        self._children = []
+        self._visits = 0
+        self._value = 0.0
+
+    def __repr__(self):
+        return f"TreeNode(move={self._move}, player={self._player}, visits={self._visits}, value={self._value})"
+
+    # Public getters
+    def get_move(self):
+        """Returns the pit number played to reach the node."""
+        return self._move
+
+    def get_player(self):
+        """Returns the player id who played the move."""
+        return self._player
+
+    def get_to_move(self):
+        """Returns the player id to move at the node, or 0 if the game is over."""
+        return self._to_move
+
+    def get_children(self):
+        """Returns the list of expanded child nodes."""
+        return self._children
+
+    def get_visits(self):
+        """Returns the number of playouts through the node."""
+        return self._visits
+
+    def get_value(self):
+        """Returns the total reward of the playouts through the node."""
+        return self._value
+
+    def count_nodes(self):
+        """Returns the number of nodes in the subtree."""
+        count, stack = 0, [self]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node._children)
+        return count
+
+
+def _search_task(task):
+    """Runs one root-parallel search in a worker process. Returns the (move, visits, value) of
+    every root move, and the number of playouts."""
+    seeds, to_move, time_limit, playout_limit, exploration, seed = task
+    engine = MCTSEngine(time_limit=time_limit, playout_limit=playout_limit, exploration=exploration,
+                        seed=seed, reuse=False)
+    root, playouts = engine._grow(tuple(seeds), to_move)
+    return [(child._move, child._visits, child._value) for child in root._children], playouts
+
+
+class MCTSEngine:
+    """MCTSEngine class representing a computer player that picks moves by Monte Carlo Tree Search.
+
+    Attributes:
+        _name          : string representing the name of the computer player.
+        _time_limit    : float representing the seconds allowed per move (None for no limit).
+        _playout_limit : integer representing the playouts allowed per move and process (None
+                          for no limit).
+        _exploration   : float representing the UCT exploration constant.
+        _processes     : integer representing the number of processes searching in parallel.
+        _reuse         : boolean representing whether to keep the subtree between moves.
+        _verbose       : boolean representing whether to print the statistics of every search.
+        _rng           : random.Random object used for the playouts.
+        _pool          : multiprocessing.Pool of the extra worker processes, created on first use.
+        _root          : TreeNode object of the last search's root (None before any search).
+        _root_seeds    : tuple of the seeds at the last search's root.
+        _info          : dictionary of statistics about the last search (see get_info).
+    """
+    def __init__(self, name="MCTS", time_limit=1.0, playout_limit=None, exploration=1.4, processes=1,
+                 seed=None, reuse=True, verbose=False):
+        """Initializes the computer player.
+
+        Parameters:
+            name          : string representing the name of the computer player.
+            time_limit    : float representing the seconds allowed per move (None for no limit).
+            playout_limit : integer representing the playouts allowed per move and process (None
+                              for no limit). Use a playout budget for reproducible play.
+            exploration   : float representing the UCT exploration constant.
+            processes     : integer representing the number of processes searching in parallel
+                              (root parallelization); 1 searches in-process only.
+            seed          : seed of the random playouts.
+            reuse         : boolean representing whether to keep the subtree between moves.
+            verbose       : boolean representing whether to print the statistics of every search.
+        """
+        if time_limit is None and playout_limit is None:
+            raise ValueError("A time limit or a playout limit is required.")
+        self._name = name
+        self._time_limit = time_limit
+        self._playout_limit = playout_limit
+        self._exploration = exploration
+        self._processes = processes
+        self._reuse = reuse
+        self._verbose = verbose
+        self._rng = random.Random(seed)
+        self._pool = None
+        self._root = None
+        self._root_seeds = None
+        self._info = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Public getters
+    def get_name(self):
+        """Returns the name of the computer player."""
+        return self._name
+
+    def get_info(self):
+        """Returns a dictionary of statistics about the last search:
+            move      : integer representing the chosen pit number.
+            win_rate  : float representing the mean reward of the chosen move.
+            visits    : integer representing the playouts through the chosen move.
+            playouts  : integer representing the playouts of this search, over every process.
+            reused    : integer representing the playouts kept from the previous search.
+            nodes     : integer representing the size of the in-process tree.
+            seconds   : float representing the time taken.
+            pps       : float representing the playouts per second.
+        """
+        return self._info
+
+    def get_root(self):
+        """Returns the root TreeNode of the last search (None before any search)."""
+        return self._root
+
+    # Public methods
+    def choose_move(self, board, player_id=None):
+        """Returns the best pit number for a player on a board. The board is not modified.
+
+        Parameters:
+            board     : Board object, which must not be in a game over state.
+            player_id : integer representing the player id (1 or 2) to move. Defaults to the
+                          board's player to move.
+        """
+        return self.search(board, player_id)[0]
+
+    def search(self, board, player_id=None):
+        """Searches a board until the budget runs out, with at least one playout.
+
+        Parameters:
+            board     : Board object, which must not be in a game over state.
+            player_id : integer representing the player id (1 or 2) to move. Defaults to the
+                          board's player to move.
+        Returns:
+            Tuple (pit number, win rate) of the most visited root move.
+        """
+        if player_id is None:
+            player_id = board.get_to_move()
+        if not board.get_legal_moves(player_id):
+            raise ValueError("There is no move to search; the game is over.")
+        seeds = board.get_seed_tuple()
+        start = time.perf_counter()
+
+        # Start the worker searches, which run while this process grows its own tree.
+        pending = None
+        if self._processes > 1:
+            if self._pool is None:
+                self._pool = multiprocessing.Pool(self._processes - 1)
+            tasks = [(seeds, player_id, self._time_limit, self._playout_limit, self._exploration,
+                      self._rng.getrandbits(64)) for _ in range(self._processes - 1)]
+            pending = self._pool.map_async(_search_task, tasks)
+
+        # Keep the subtree of this position from the previous search, if there is one.
+        root = self._find_subtree(seeds, player_id) if self._reuse else None
+        reused = root._visits if root is not None else 0
+        root, playouts = self._grow(seeds, player_id, root)
+        self._root, self._root_seeds = root, seeds
+
+        # Sum the root move statistics over every process, and play the most visited move.
+        totals = {child._move: [child._visits, child._value] for child in root._children}
+        if pending is not None:
+            for stats, worker_playouts in pending.get():
+                playouts += worker_playouts
+                for move, visits, value in stats:
+                    total = totals.setdefault(move, [0, 0.0])
+                    total[0] += visits
+                    total[1] += value
+        move = max(totals, key=lambda pit: totals[pit][0])
+        visits, value = totals[move]
+
+        seconds = time.perf_counter() - start
+        self._info = {'move': move, 'win_rate': value / visits, 'visits': visits, 'playouts': playouts,
+                      'reused': reused, 'nodes': root.count_nodes(), 'seconds': seconds,
+                      'pps': playouts / seconds if seconds > 0 else 0.0}
+        if self._verbose:
+            print(self.format_info())
+        return move, value / visits
+
+    def format_info(self):
+        """Returns the statistics of the last search as a single line of text."""
+        info = self._info
+        return (f"move {info['move']} win rate {info['win_rate']:.3f} visits {info['visits']} "
+                f"playouts {info['playouts']} reused {info['reused']} nodes {info['nodes']} "
+                f"time {info['seconds']:.3f}s pps {info['pps']:.0f}")
+
+    def close(self):
+        """Stops the worker processes, if any."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    # Private methods
+    def _new_node(self, move, player, seeds, to_move):
+        """Returns a new node for the position reached, with its untried moves in random order."""
+        untried = []
+        if to_move:
+            start = (to_move - 1) * (len(seeds) // 2)
+            untried = [pit for pit in range(1, len(seeds) // 2) if seeds[start + pit - 1]]
+            self._rng.shuffle(untried)
+        return TreeNode(move, player, to_move, untried)
+
+    def _grow(self, root_seeds, player_id, root=None):
+        """Grows the tree of a root position until the budget runs out. Returns the (root node,
+        number of playouts)."""
+        num_pits = len(root_seeds) // 2 - 1
+        sowing = Mancala.sowing_table(num_pits)
+        if root is None:
+            root = self._new_node(None, 3 - player_id, root_seeds, player_id)
+        rng = self._rng
+        exploration = self._exploration
+        root_totals = pit_totals(root_seeds, num_pits)
+        deadline = None if self._time_limit is None else time.perf_counter() + self._time_limit
+        limit = self._playout_limit
+        playouts = 0
+
+        # Play at least one playout, so that the root always has an expanded move.
+        while playouts == 0 or ((limit is None or playouts < limit) and
+                                (deadline is None or time.perf_counter() < deadline)):
+            seeds, totals = list(root_seeds), list(root_totals)
+            node, path = root, [root]
+
+            # Select: descend through fully expanded nodes by UCT.
+            while not node._untried and node._children:
+                log_visits = math.log(node._visits)
+                best, best_score = None, -1.0
+                for child in node._children:
+                    score = child._value / child._visits + exploration * math.sqrt(log_visits / child._visits)
+                    if score > best_score:
+                        best, best_score = child, score
+                sow(seeds, totals, node._to_move, best._move, sowing)
+                node = best
+                path.append(node)
+
+            # Expand: add one untried move.
+            if node._untried:
+                pit = node._untried.pop()
+                to_move = sow(seeds, totals, node._to_move, pit, sowing)
+                child = self._new_node(pit, node._to_move, seeds, to_move)
+                node._children.append(child)
+                node = child
+                path.append(node)
+
+            # Simulate, and back the result up the path.
+            margin = random_playout(seeds, totals, node._to_move, sowing, rng)
+            reward = 1.0 if margin > 0 else 0.0 if margin < 0 else 0.5
+            for visited in path:
+                visited._visits += 1
+                visited._value += reward if visited._player == 1 else 1.0 - reward
+            playouts += 1
+        return root, playouts
+
+    def _find_subtree(self, seeds, player_id):
+        """Returns the node of the previous tree reached by the given position within
+        REUSE_PLIES moves of its root, or None."""
+        if self._root is None:
+            return None
+        key = Mancala.Position(seeds, player_id).get_key()
+        if Mancala.Position(self._root_seeds, self._root._to_move).get_key() == key:
+            return self._root
+        num_pits = len(seeds) // 2 - 1
+        sowing = Mancala.sowing_table(num_pits)
+        frontier = [(self._root, self._root_seeds)]
+        for _ in range(REUSE_PLIES):
+            next_frontier = []
+            for node, node_seeds in frontier:
+                for child in node._children:
+                    if not child._to_move:
+                        continue
+                    child_seeds = list(node_seeds)
+                    sow(child_seeds, pit_totals(child_seeds, num_pits), node._to_move, child._move, sowing)
+                    if Mancala.Position(child_seeds, child._to_move).get_key() == key:
+                        return child
+                    next_frontier.append((child, child_seeds))
+            frontier = next_frontier
+        return None
+
+
+def main():
+    """Runs a complete, new game against the computer (player 2)."""
+    with MCTSEngine(verbose=True) as engine:
+        Mancala.Mancala().new_game(engines={2: engine})
+
+
+if __name__ == "__main__":
+    main()
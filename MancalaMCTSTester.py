@@ -0,0 +1,92 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 13:10
+# Description: Unit tests for MancalaMCTS.py.
+
+import random
+import unittest
+import Mancala
+import MancalaMCTS
+
+
+class PlayoutTester(unittest.TestCase):
+    """Unit tests for the flat sowing and playout functions."""
+
+    def test_sow_same_as_board(self):
+        """Should play every move of random games exactly like Board.apply_move."""
+        rng = random.Random(4)
+        for num_pits, num_seeds in ((6, 4), (3, 9), (8, 6)):
+            sowing = Mancala.sowing_table(num_pits)
+            for _ in range(20):
+                board = Mancala.Board(num_pits, num_seeds)
+                seeds = board.get_seed_list()
+                totals = MancalaMCTS.pit_totals(seeds, num_pits)
+                player = 1
+                while player:
+                    pit = rng.choice(board.get_legal_moves(player))
+                    result = board.apply_move(player, pit)
+                    player = MancalaMCTS.sow(seeds, totals, player, pit, sowing)
+                    self.assertEqual(seeds, board.get_seed_list())
+                    self.assertEqual(totals[1:], [board.get_pit_total(1), board.get_pit_total(2)])
+                    if board.is_game_over():
+                        self.assertEqual(player, 0)
+                    else:
+                        self.assertEqual(player, result.get_player() if result.is_extra_turn()
+                                         else 3 - result.get_player())
+
+    def test_random_playout(self):
+        """Should play a game to the end and return the final margin."""
+        seeds = Mancala.Board().get_seed_list()
+        margin = MancalaMCTS.random_playout(seeds, MancalaMCTS.pit_totals(seeds, 6), 1,
+                                            Mancala.sowing_table(6), random.Random(1))
+        self.assertEqual(min(sum(seeds[:6]), sum(seeds[7:13])), 0)
+        self.assertEqual(sum(seeds), 48)
+        self.assertEqual(margin, sum(seeds[:7]) - sum(seeds[7:]))
+
+
+class MCTSEngineTester(unittest.TestCase):
+    """Unit tests for MCTSEngine class."""
+
+    def test_finds_only_winning_move(self):
+        """Should play the only winning move, as found by exhaustive search."""
+        board = Mancala.Board(num_pits=3, num_seeds=2)
+        board.set_seed_list([1, 1, 2, 1, 3, 0, 0, 1])
+        engine = MancalaMCTS.MCTSEngine(time_limit=None, playout_limit=2000, seed=0)
+        self.assertEqual(engine.choose_move(board, 1), 3)
+        info = engine.get_info()
+        self.assertEqual(info['playouts'], 2000)
+        self.assertEqual(engine.get_root().get_visits(), 2000)
+        self.assertEqual(board.get_seed_list(), [1, 1, 2, 1, 3, 0, 0, 1])
+
+    def test_reuses_subtree(self):
+        """Should keep the subtree of the position reached after both players move."""
+        board = Mancala.Board(num_pits=4, num_seeds=3)
+        engine = MancalaMCTS.MCTSEngine(time_limit=None, playout_limit=3000, seed=1)
+        while board.apply_move(1, engine.choose_move(board, 1)).is_extra_turn():
+            pass
+        while board.apply_move(2, board.get_legal_moves(2)[0]).is_extra_turn():
+            pass
+        engine.choose_move(board, 1)
+        self.assertGreater(engine.get_info()['reused'], 0)
+        self.assertEqual(engine.get_root().get_visits(), engine.get_info()['reused'] + 3000)
+
+    def test_root_parallel(self):
+        """Should sum the playouts of every process."""
+        with MancalaMCTS.MCTSEngine(time_limit=None, playout_limit=300, processes=2, seed=2) as engine:
+            move = engine.choose_move(Mancala.Board(), 1)
+        self.assertIn(move, range(1, 7))
+        self.assertEqual(engine.get_info()['playouts'], 600)
+
+    def test_tiny_budget(self):
+        """Should still play a legal move when the budget allows no playouts."""
+        for engine in (MancalaMCTS.MCTSEngine(time_limit=None, playout_limit=0),
+                       MancalaMCTS.MCTSEngine(time_limit=0.0, reuse=False)):
+            move, win_rate = engine.search(Mancala.Board(), 1)
+            self.assertIn(move, range(1, 7))
+            self.assertEqual(engine.get_info()['playouts'], 1)
+            self.assertIsNotNone(win_rate)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
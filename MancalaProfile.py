@@ -0,0 +1,117 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 16:20
+# Description: Implements profiling helpers for the Mancala board game: instrumented games, cProfile and tracemalloc.
+#
+# Boards count their own work once instrumentation is enabled (see Board.enable_stats and the BoardStats class).
+# This module plays instrumented games, and wraps any function (such as a batch of games) with cProfile and/or
+# tracemalloc, returning a report of where the time and memory went.
+#
+# To profile a batch of random games from the command line, e.g.:
+#       python MancalaProfile.py --games 200 --timing --cprofile --memory
+
+import argparse
+import cProfile
+import io
+import pstats
+import random
+import time
+import tracemalloc
+
+import Mancala
+
+
+def play_instrumented_games(games=1, num_pits=6, num_seeds=4, board_class=None, timing=False, seed=0):
+    """Plays random games through Mancala.apply_move with board instrumentation enabled, and
+    returns the combined BoardStats object.
+
+    Parameters:
+        games       : integer representing the number of games to play.
+        num_pits    : integer representing the number of pits per player.
+        num_seeds   : integer representing the initial number of seeds per pit.
+        board_class : Board class to play on (defaults to Board).
+        timing      : boolean representing whether to time the instrumented methods.
+        seed        : seed of the random moves.
+    """
+    board_class = Mancala.Board if board_class is None else board_class
+    rng = random.Random(seed)
+    total = Mancala.BoardStats(timing)
+    for _ in range(games):
+        board = board_class(num_pits, num_seeds)
+        stats = board.enable_stats(timing)
+        game = Mancala.Mancala(board)
+        player = 1
+        while not board.is_game_over():
+            result = game.apply_move(player, rng.choice(board.get_legal_moves(player)))
+            if not result.is_extra_turn():
+                player = 3 - player
+        total.merge(stats)
+    return total
+
+
+def profile_run(function, *args, cpu=True, memory=False, limit=20, **kwargs):
+    """Calls a function under cProfile and/or tracemalloc.
+
+    Parameters:
+        function : function to call with the remaining positional and keyword arguments.
+        cpu      : boolean representing whether to profile with cProfile.
+        memory   : boolean representing whether to trace allocations with tracemalloc.
+        limit    : integer representing the number of functions / allocation sites to report.
+    Returns:
+        Tuple (result of the function, report dictionary):
+            seconds     : float, wall time of the call.
+            profile     : string, the cProfile table sorted by cumulative time (if cpu).
+            peak_bytes  : integer, peak traced memory during the call (if memory).
+            allocations : list of strings, the allocation sites holding the most memory at the
+                            end of the call (if memory).
+    """
+    report = {}
+    profiler = cProfile.Profile() if cpu else None
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        if profiler is not None:
+            result = profiler.runcall(function, *args, **kwargs)
+        else:
+            result = function(*args, **kwargs)
+        report['seconds'] = time.perf_counter() - start
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            report['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+            report['allocations'] = [str(stat) for stat in snapshot.statistics('lineno')[:limit]]
+    finally:
+        if memory:
+            tracemalloc.stop()
+    if profiler is not None:
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(limit)
+        report['profile'] = text.getvalue()
+    return result, report
+
+
+def main():
+    """Profiles a batch of random games from the command line."""
+    parser = argparse.ArgumentParser(description="Profiles random Mancala games.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--num-pits", type=int, default=6)
+    parser.add_argument("--num-seeds", type=int, default=4)
+    parser.add_argument("--timing", action="store_true", help="time each instrumented board method")
+    parser.add_argument("--cprofile", action="store_true", help="profile with cProfile")
+    parser.add_argument("--memory", action="store_true", help="trace allocations with tracemalloc")
+    args = parser.parse_args()
+
+    stats, report = profile_run(play_instrumented_games, args.games, args.num_pits, args.num_seeds,
+                                timing=args.timing, cpu=args.cprofile, memory=args.memory)
+    print(f"{args.games} games in {report['seconds']:.3f}s")
+    print(stats.format_stats())
+    if args.cprofile:
+        print(report['profile'])
+    if args.memory:
+        print(f"peak traced memory: {report['peak_bytes']} bytes")
+        print("\n".join(report['allocations']))
+
+
+if __name__ == "__main__":
+    main()
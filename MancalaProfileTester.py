@@ -0,0 +1,48 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 16:20
+# Description: Unit tests for MancalaProfile.py.
+
+import random
+import unittest
+import MancalaProfile
+import MancalaTester
+
+
+class ProfileTester(unittest.TestCase):
+    """Unit tests for the profiling helpers."""
+
+    def test_instrumented_games(self):
+        """Should count the moves, seeds sown and extra turns of the same games played with
+        one-seed-at-a-time sowing."""
+        stats = MancalaProfile.play_instrumented_games(5, seed=3)
+        rng = random.Random(3)
+        expected = {'moves': 0, 'seeds_sown': 0, 'extra_turns': 0}
+        for _ in range(5):
+            seeds = [4] * 6 + [0] + [4] * 6 + [0]
+            player = 1
+            while any(seeds[:6]) and any(seeds[7:13]):
+                offset = 0 if player == 1 else 7
+                pit = rng.choice([i + 1 for i, n in enumerate(seeds[offset:offset + 6]) if n])
+                expected['moves'] += 1
+                expected['seeds_sown'] += seeds[offset + pit - 1]
+                if MancalaTester.sow_one_at_a_time(seeds, 6, player, pit) == 'skip':
+                    expected['extra_turns'] += 1
+                else:
+                    player = 3 - player
+        counters = stats.get_counters()
+        self.assertEqual({key: counters[key] for key in expected}, expected)
+        self.assertEqual(counters['final_tallies'], 5)
+
+    def test_profile_run(self):
+        """Should report the profile and the memory of a call, and return its result."""
+        stats, report = MancalaProfile.profile_run(MancalaProfile.play_instrumented_games, 2, memory=True)
+        self.assertEqual(stats.get_counters()['final_tallies'], 2)
+        self.assertIn("apply_move", report['profile'])
+        self.assertGreater(report['peak_bytes'], 0)
+        self.assertGreater(report['seconds'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
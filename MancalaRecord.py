@@ -0,0 +1,328 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 14:30
+# Description: Implements a compact game record format for the Mancala board game, with streaming replay.
+#
+# The module implements the following classes:
+#   GameRecord - GameRecord class representing one recorded game.
+#   RecordWriter - RecordWriter class that streams game records to a binary or text file.
+#
+# A game record holds the board configuration (num_pits, num_seeds), the two player names, and the moves played.
+# Each move is packed into a single byte: ((player - 1) << 7) | pit, so a pit number is at most 127.
+#
+# Binary file layout (little-endian):
+#       file header : the 8 byte magic b"MNCLGAME".
+#       record      : num_pits (1 byte), num_seeds (2 bytes), name 1 length (1 byte), name 2 length (1 byte),
+#                     number of moves (4 bytes), then the UTF-8 names, then one byte per move.
+#
+# Text file layout (the twin of the binary format), one game per line, tab-separated:
+#       num_pits <TAB> num_seeds <TAB> name 1 <TAB> name 2 <TAB> player:pit player:pit ...
+# Blank lines and lines starting with '#' are ignored.
+#
+# Both formats are read and written one record at a time (read_records is a generator), and replay is a generator
+# too, so files of millions of games can be converted or replayed in flat memory.
+#
+# To replay a file of games, simply call:
+#       for result in replay(read_records("games.bin")): ...
+# or from the command line:
+#       python MancalaRecord.py replay games.bin
+
+import argparse
+import struct
+
+import Mancala
+
+MAGIC = b"MNCLGAME"
+RECORD = struct.Struct("<BHBBI")    # num_pits, num_seeds, name 1 length, name 2 length, number of moves.
+
+
+def pack_move(player, pit):
+    """Returns the move of a player (1 or 2) from a pit number (1 to 127), packed into one byte."""
+    if player not in (1, 2) or not 1 <= pit <= 127:
+        raise ValueError(f"Cannot pack the move ({player}, {pit}).")
+    return (player - 1) << 7 | pit
+
+
+def unpack_move(byte):
+    """Returns the (player, pit) move packed into a byte by pack_move."""
+    return (byte >> 7) + 1, byte & 0x7f
+
+
+class GameRecord:
+    """GameRecord class representing one recorded game.
+
+    Attributes:
+        _num_pits  : integer representing the number of pits per player.
+        _num_seeds : integer representing the initial number of seeds per pit.
+        _names     : tuple of the player 1 and player 2 names.
+        _moves     : bytes representing the moves, one packed move per byte (see pack_move).
+    """
+    __slots__ = ('_num_pits', '_num_seeds', '_names', '_moves')
+
+    def __init__(self, num_pits, num_seeds, names, moves=()):
+        """Initializes a game record.
+        Parameters:
+            num_pits  : integer representing the number of pits per player (1 to 127).
+            num_seeds : integer representing the initial number of seeds per pit.
+            names     : sequence of the player 1 and player 2 names.
+            moves     : sequence of (player, pit) tuples, in the order played.
+        """
+        if not 1 <= num_pits <= 127:
+            raise ValueError("A record supports 1 to 127 pits.")
+        self._num_pits = num_pits
+        self._num_seeds = num_seeds
+        self._names = tuple(names)
+        self._moves = bytes(pack_move(player, pit) for player, pit in moves)
+
+    @classmethod
+    def from_packed(cls, num_pits, num_seeds, names, packed):
+        """Returns a record from moves already packed into bytes (see pack_move)."""
+        record = cls(num_pits, num_seeds, names)
+        record._moves = bytes(packed)
+        return record
+
+    @classmethod
+    def from_text(cls, line):
+        """Returns the record of a line in the text format (see to_text)."""
+        fields = line.rstrip("\n").split("\t")
+        if len(fields) != 5:
+            raise ValueError(f"Invalid game record line: {line!r}")
+        moves = [tuple(int(number) for number in move.split(":")) for move in fields[4].split()]
+        return cls(int(fields[0]), int(fields[1]), fields[2:4], moves)
+
+    def __eq__(self, other):
+        return (isinstance(other, GameRecord) and self._num_pits == other._num_pits
+                and self._num_seeds == other._num_seeds and self._names == other._names
+                and self._moves == other._moves)
+
+    def __repr__(self):
+        return f"GameRecord({self._num_pits}, {self._num_seeds}, {self._names}, {len(self._moves)} moves)"
+
+    # Public getters
+    def get_num_pits(self):
+        """Returns the number of pits per player."""
+        return self._num_pits
+
+    def get_num_seeds(self):
+        """Returns the initial number of seeds per pit."""
+        return self._num_seeds
+
+    def get_names(self):
+        """Returns the tuple of the player 1 and player 2 names."""
+        return self._names
+
+    def get_moves(self):
+        """Returns the moves as a list of (player, pit) tuples."""
+        return [unpack_move(byte) for byte in self._moves]
+
+    def get_packed_moves(self):
+        """Returns the moves packed into bytes, one byte per move."""
+        return self._moves
+
+    def get_num_moves(self):
+        """Returns the number of moves."""
+        return len(self._moves)
+
+    # Public methods
+    def to_bytes(self):
+        """Returns the record in the binary format."""
+        name_1, name_2 = (name.encode("utf-8") for name in self._names)
+        if len(name_1) > 255 or len(name_2) > 255:
+            raise ValueError("Player names are limited to 255 bytes.")
+        return (RECORD.pack(self._num_pits, self._num_seeds, len(name_1), len(name_2), len(self._moves))
+                + name_1 + name_2 + self._moves)
+
+    def to_text(self):
+        """Returns the record as one line (without the newline) in the text format."""
+        if any("\t" in name or "\n" in name for name in self._names):
+            raise ValueError("Player names cannot contain tabs or newlines.")
+        moves = " ".join(f"{player}:{pit}" for player, pit in self.get_moves())
+        return f"{self._num_pits}\t{self._num_seeds}\t{self._names[0]}\t{self._names[1]}\t{moves}"
+
+
+class RecordWriter:
+    """RecordWriter class that writes game records to a file one at a time. Can be used as a
+    context manager.
+
+    Attributes:
+        _file  : file object being written.
+        _text  : boolean representing whether the file is in the text format.
+        _count : integer representing the number of records written.
+    """
+    def __init__(self, path, text=False):
+        """Creates (or overwrites) a game record file.
+        Parameters:
+            path : string representing the path of the file.
+            text : boolean representing whether to write the text format instead of binary.
+        """
+        self._text = text
+        self._count = 0
+        if text:
+            self._file = open(path, "w", encoding="utf-8")
+        else:
+            self._file = open(path, "wb")
+            self._file.write(MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get_count(self):
+        """Returns the number of records written."""
+        return self._count
+
+    def write(self, record):
+        """Writes a GameRecord object to the file."""
+        if self._text:
+            self._file.write(record.to_text() + "\n")
+        else:
+            self._file.write(record.to_bytes())
+        self._count += 1
+
+    def close(self):
+        """Closes the file."""
+        self._file.close()
+
+
+def write_records(path, records, text=False):
+    """Writes an iterable of GameRecord objects to a file. Returns the number written."""
+    with RecordWriter(path, text) as writer:
+        for record in records:
+            writer.write(record)
+        return writer.get_count()
+
+
+def read_records(path, errors=None):
+    """Yields the GameRecord objects of a binary or text file one at a time, without loading
+    the file. The format is detected from the magic at the start of the file.
+    Parameters:
+        path   : string representing the path of the file to read.
+        errors : optional list. If given, each record that cannot be read is appended to it as a
+                  string describing the problem, and skipped, rather than raised. A truncated
+                  binary record ends the file.
+    Raises:
+        ValueError if a binary record is truncated or invalid, or a text line is invalid (unless
+        errors is given).
+    """
+    def report(message):
+        if errors is None:
+            raise ValueError(message)
+        errors.append(message)
+
+    with open(path, "rb") as file:
+        binary = file.read(len(MAGIC)) == MAGIC
+        if binary:
+            number = 0
+            while True:
+                header = file.read(RECORD.size)
+                if not header:
+                    return
+                number += 1
+                if len(header) < RECORD.size:
+                    report(f"{path}: record {number}: truncated game record.")
+                    return
+                num_pits, num_seeds, length_1, length_2, num_moves = RECORD.unpack(header)
+                body = file.read(length_1 + length_2 + num_moves)
+                if len(body) < length_1 + length_2 + num_moves:
+                    report(f"{path}: record {number}: truncated game record.")
+                    return
+                try:
+                    names = (body[:length_1].decode("utf-8"), body[length_1:length_1 + length_2].decode("utf-8"))
+                    record = GameRecord.from_packed(num_pits, num_seeds, names, body[length_1 + length_2:])
+                except ValueError as error:
+                    report(f"{path}: record {number}: {error}")
+                    continue
+                yield record
+
+        # Text lines are decoded one at a time, so that one undecodable line can be skipped.
+        file.seek(0)
+        for number, line in enumerate(file, 1):
+            try:
+                line = line.decode("utf-8").rstrip("\r\n")
+                if not line.strip() or line.startswith("#"):
+                    continue
+                record = GameRecord.from_text(line)
+            except ValueError as error:
+                report(f"{path}: line {number}: {error}")
+                continue
+            yield record
+
+
+def replay(records, board_class=None, check_turns=True):
+    """Replays game records one at a time, and yields the outcome of each game.
+
+    Parameters:
+        records     : iterable of GameRecord objects (e.g. read_records).
+        board_class : Board class to play on (defaults to Board).
+        check_turns : boolean representing whether each move must be played by the player to
+                       move (player 1 first, switching unless a move earns another turn).
+    Yields:
+        Dictionary describing the game:
+            index  : integer, position of the record in the input.
+            names  : tuple of the player names.
+            moves  : integer, number of moves played before the end (or before an error).
+            seeds  : list, final seeds in the same order as Mancala.play_game.
+            over   : boolean, whether the game is over (and tallied).
+            winner : integer following Board.return_winner, or None if the game is not over.
+            margin : integer, player 1's store minus player 2's.
+            error  : string describing the first invalid move, or None if every move is valid.
+    """
+    if board_class is None:
+        board_class = Mancala.Board
+    for index, record in enumerate(records):
+        board = board_class(record.get_num_pits(), record.get_num_seeds())
+        game = Mancala.Mancala(board)
+        to_move, played, error = 1, 0, None
+        for player, pit in record.get_moves():
+            if check_turns and player != to_move:
+                error = f"move {played + 1}: player {player} played out of turn"
+                break
+            try:
+                result = game.apply_move(player, pit)
+            except ValueError as exception:
+                error = f"move {played + 1}: {exception}"
+                break
+            played += 1
+            to_move = player if result.is_extra_turn() else 3 - player
+        over = board.is_game_over()
+        yield {'index': index, 'names': record.get_names(), 'moves': played, 'seeds': board.get_seed_list(),
+               'over': over, 'winner': board.return_winner() if over else None,
+               'margin': board.get_store_seeds(1) - board.get_store_seeds(2), 'error': error}
+
+
+def main():
+    """Converts or replays game record files from the command line."""
+    parser = argparse.ArgumentParser(description="Converts or replays Mancala game records.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser("convert", help="convert between the binary and text formats")
+    convert.add_argument("source")
+    convert.add_argument("target")
+    convert.add_argument("--text", action="store_true", help="write the text format")
+    check = commands.add_parser("replay", help="replay and check every game, and print a summary")
+    check.add_argument("path")
+    check.add_argument("--no-turn-check", action="store_true", help="allow moves out of turn")
+    args = parser.parse_args()
+
+    if args.command == "convert":
+        count = write_records(args.target, read_records(args.source), args.text)
+        print(f"{count} games written to {args.target}")
+        return
+
+    totals = {'games': 0, 'invalid': 0, 'unfinished': 0, 'player 1': 0, 'player 2': 0, 'ties': 0}
+    for result in replay(read_records(args.path), check_turns=not args.no_turn_check):
+        totals['games'] += 1
+        if result['error'] is not None:
+            totals['invalid'] += 1
+            print(f"game {result['index']}: {result['error']}")
+        elif not result['over']:
+            totals['unfinished'] += 1
+        else:
+            totals[('ties', 'player 1', 'player 2')[result['winner']]] += 1
+    print(" ".join(f"{name}: {count}" for name, count in totals.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 14:30
+# Description: Unit tests for MancalaRecord.py.
+
+import contextlib
+import io
+import os
+import tempfile
+import types
+import unittest
+import Mancala
+import MancalaRecord
+
+DEMO_MOVES = [(1, 4), (2, 4), (1, 3), (1, 1), (2, 1), (1, 2), (1, 4), (1, 5), (2, 1),
+              (1, 6), (2, 2), (1, 3), (1, 6), (1, 1), (2, 6), (1, 2), (2, 5), (1, 5),
+              (2, 3), (1, 6), (2, 1), (1, 1), (2, 4), (1, 2), (2, 3), (1, 4), (2, 3),
+              (1, 6), (1, 5)]
+
+
+class GameRecordTester(unittest.TestCase):
+    """Unit tests for GameRecord class and the record files."""
+
+    def setUp(self):
+        """Creates a temporary directory for the record files, and a few records."""
+        self._directory = tempfile.TemporaryDirectory()
+        self._records = [MancalaRecord.GameRecord(6, 4, ("Sandman", "Lucifer"), DEMO_MOVES),
+                         MancalaRecord.GameRecord(3, 2, ("Zoë", "Bob Smith"), []),
+                         MancalaRecord.GameRecord(8, 300, ("a", "b"), [(1, 8), (2, 1)])]
+
+    def tearDown(self):
+        """Removes the temporary directory."""
+        self._directory.cleanup()
+
+    def test_pack_move(self):
+        """Should pack a move into one byte, and back."""
+        self.assertEqual(MancalaRecord.pack_move(2, 6), 0x86)
+        self.assertEqual(MancalaRecord.unpack_move(0x86), (2, 6))
+        with self.assertRaises(ValueError):
+            MancalaRecord.pack_move(1, 128)
+        self.assertEqual(self._records[0].get_moves(), DEMO_MOVES)
+        self.assertEqual(len(self._records[0].get_packed_moves()), len(DEMO_MOVES))
+
+    def test_round_trip(self):
+        """Should read back the same records from the binary and the text files."""
+        for name, text in (("games.bin", False), ("games.txt", True)):
+            path = os.path.join(self._directory.name, name)
+            self.assertEqual(MancalaRecord.write_records(path, self._records, text), 3)
+            records = MancalaRecord.read_records(path)
+            self.assertIsInstance(records, types.GeneratorType)
+            self.assertEqual(list(records), self._records)
+
+    def test_truncated_file(self):
+        """Should raise an error on a truncated binary record."""
+        path = os.path.join(self._directory.name, "games.bin")
+        MancalaRecord.write_records(path, self._records)
+        with open(path, "r+b") as file:
+            file.truncate(os.path.getsize(path) - 1)
+        with self.assertRaises(ValueError):
+            list(MancalaRecord.read_records(path))
+        errors = []
+        self.assertEqual(list(MancalaRecord.read_records(path, errors)), self._records[:2])
+        self.assertEqual(errors, [f"{path}: record 3: truncated game record."])
+
+    def test_invalid_lines(self):
+        """Should raise an error on an invalid text line, or report it and read on."""
+        path = os.path.join(self._directory.name, "games.txt")
+        MancalaRecord.write_records(path, self._records, text=True)
+        with open(path, "ab") as file:
+            file.write(b"6\t4\ta\n0\t4\ta\tb\t\n6\t4\t\xff\tb\t\n6\t4\ta\tb\t1:1 1:x\n")
+            file.write(self._records[0].to_text().encode("utf-8") + b"\n")
+        with self.assertRaises(ValueError):
+            list(MancalaRecord.read_records(path))
+        errors = []
+        self.assertEqual(list(MancalaRecord.read_records(path, errors)), self._records + self._records[:1])
+        self.assertEqual([error.split(":")[1] for error in errors], [" line 4", " line 5", " line 6", " line 7"])
+
+
+class ReplayTester(unittest.TestCase):
+    """Unit tests for the replay function."""
+
+    def test_same_as_play_game(self):
+        """Should end with the same board and winner as playing the moves with play_game."""
+        game = Mancala.Mancala()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for move in DEMO_MOVES:
+                seeds = game.play_game(*move)
+        record = MancalaRecord.GameRecord(6, 4, ("Sandman", "Lucifer"), DEMO_MOVES)
+        result = next(MancalaRecord.replay([record], Mancala.Board))
+        self.assertIsNone(result['error'])
+        self.assertEqual(result['seeds'], seeds)
+        self.assertEqual(result['moves'], len(DEMO_MOVES))
+        self.assertTrue(result['over'])
+        self.assertEqual(result['winner'], 1 if seeds[6] > seeds[13] else 2 if seeds[6] < seeds[13] else 0)
+
+    def test_invalid_games(self):
+        """Should report the first invalid move, out of turn move, or move after the end."""
+        records = [MancalaRecord.GameRecord(6, 4, ("a", "b"), [(1, 3), (2, 1)]),
+                   MancalaRecord.GameRecord(6, 4, ("a", "b"), [(1, 3), (1, 3)]),
+                   MancalaRecord.GameRecord(6, 4, ("a", "b"), DEMO_MOVES + [(2, 1)]),
+                   MancalaRecord.GameRecord(6, 4, ("a", "b"), [(1, 1)])]
+        results = list(MancalaRecord.replay(records))
+        self.assertEqual(results[0]['error'], "move 2: player 2 played out of turn")
+        self.assertEqual(results[1]['error'], "move 2: Invalid selection. Player must choose a non-empty pit.")
+        self.assertEqual(results[2]['error'], f"move {len(DEMO_MOVES) + 1}: Game is ended")
+        self.assertEqual((results[3]['error'], results[3]['over'], results[3]['winner']), (None, False, None))
+        self.assertIsNone(next(MancalaRecord.replay(records[:1], check_turns=False))['error'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,423 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 10:12
+# Description: Implements a computer opponent for the console-based Mancala board game.
+#
+# The module implements the following classes:
+#   SearchEngine - SearchEngine class that picks the best move for the player to move on a board.
+#   ZobristHasher - ZobristHasher class that hashes board positions into 64-bit integers.
+#   TranspositionTable - TranspositionTable class that caches search results by position hash.
+#
+# The engine searches with negamax and alpha-beta pruning, on a private Board copy of the board, using
+# make_move/unmake_move rather than copying the board at every node. A move that ends in the player's own store
+# gives the player another turn, so the same player moves again and the score of that child is NOT negated.
+#
+# The search is run with iterative deepening (depth 1, 2, 3, ...) until the time or node budget runs out, and the
+# best move of the deepest completed iteration is played. The node budget is exact, checked at every node, while
+# the clock is only read every 1024 nodes. Results are cached in a bounded transposition table,
+# which also supplies the best move of the previous iteration to search first. The table is keyed by canonical
+# position (see Mancala.Position.canonical), so a position and its mirror with the other player to move share one
+# entry.
+#
+# To play a game against the computer, simply call:
+#       Mancala().new_game(engines={2: SearchEngine()})
+
+import random
+import time
+
+import Mancala
+
+
+# Transposition table entry bound flags.
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time or node budget is exhausted."""
+    pass
+
+
+class ZobristHasher:
+    """ZobristHasher class for hashing positions. Each (flat index, seed count) pair is assigned
+    a random 64-bit key, and the hash of a position is the XOR of the keys of the counts of its
+    canonical form (see Mancala.Position.canonical). A position and its mirror hash the same, so
+    the transposition table stores each position once; its entries (scores and best pit numbers
+    of the player to move) are the same for both.
+
+    Attributes:
+        _keys       : tuple (None, player 1 keys, player 2 keys), where _keys[player][index][count]
+                        is the key of `count` seeds at the flat index with that player to move.
+                        Player 2's keys are player 1's rotated by a side, which hashes the
+                        mirror without building it.
+    """
+    def __init__(self, num_pits=6, total_seeds=48, seed=2022):
+        """Initializes the random keys for a board configuration.
+
+        Parameters:
+            num_pits    : integer representing the number of pits per player.
+            total_seeds : integer representing the number of seeds in play (the most any one
+                            pit or store can hold).
+            seed        : integer used to seed the random keys, so hashes are reproducible.
+        """
+        rng = random.Random(seed)
+        keys = [[rng.getrandbits(64) for _ in range(total_seeds + 1)] for _ in range(2 * num_pits + 2)]
+        self._keys = (None, keys, keys[num_pits + 1:] + keys[:num_pits + 1])
+
+    def hash(self, seeds, to_move):
+        """Returns the 64-bit hash of a position.
+        Parameters:
+            seeds   : sequence of seed counts, in the same order as Board.get_seed_list.
+            to_move : integer representing the player id (1 or 2) to move.
+        """
+        h = 0
+        keys = self._keys[to_move]
+        for i, count in enumerate(seeds):
+            h ^= keys[i][count]
+        return h
+
+
+class TranspositionTable:
+    """TranspositionTable class for caching search results. The table has a fixed number of
+    slots (a power of two), and a position is stored in the slot given by the low bits of its
+    hash, so the memory used is bounded.
+
+    Replacement policy: a slot is overwritten if it is empty, holds the same position, holds
+    an entry from an earlier search, or holds an entry searched no deeper than the new one.
+
+    Attributes:
+        _slots      : list of entries (hash, depth, score, flag, move, generation), or None.
+        _mask       : integer used to select the slot from the hash.
+        _generation : integer representing the current search, used to age out old entries.
+    """
+    def __init__(self, size=2 ** 16):
+        """Initializes an empty table.
+        Parameters:
+            size : integer representing the number of slots (rounded up to a power of two).
+        """
+        size = 1 << max(0, size - 1).bit_length()
+        self._slots = [None] * size
+        self._mask = size - 1
+        self._generation = 0
+
+    def get_size(self):
+        """Returns the number of slots."""
+        return len(self._slots)
+
+    def new_search(self):
+        """Starts a new search, so the entries of earlier searches can be replaced first."""
+        self._generation += 1
+
+    def clear(self):
+        """Removes all entries."""
+        self._slots = [None] * len(self._slots)
+
+    def lookup(self, key):
+        """Returns the (depth, score, flag, move) entry for the position hash, or None."""
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry[0] == key:
+            return entry[1:5]
+        return None
+
+    def store(self, key, depth, score, flag, move):
+        """Stores a search result for the position hash, following the replacement policy."""
+        index = key & self._mask
+        entry = self._slots[index]
+        if entry is None or entry[0] == key or entry[5] != self._generation or entry[1] <= depth:
+            self._slots[index] = (key, depth, score, flag, move, self._generation)
+
+
+class SearchEngine:
+    """SearchEngine class representing a computer player. Picks the best move for the player
+    to move with negamax, alpha-beta pruning and iterative deepening under a time and/or node
+    budget.
+
+    Scores are seed margins from the point of view of the player to move: the difference in
+    stores at the leaves (or the evaluator's score, if given), or the final tally difference if
+    the game is over.
+
+    Attributes:
+        _name       : string representing the name of the computer player.
+        _max_depth  : integer representing the deepest iteration to search.
+        _time_limit : float representing the time budget in seconds per move (None for no limit).
+        _node_limit : integer representing the node budget per move (None for no limit).
+        _table      : TranspositionTable object caching the search results.
+        _hashers    : dictionary of ZobristHasher objects, keyed by (num_pits, total seeds).
+        _info       : dictionary of statistics about the last search (see get_info).
+        _verbose    : boolean representing whether to print a line per completed iteration.
+        _endgame    : optional MancalaEndgame.EndgameTable object giving the exact value of
+                        positions with few seeds left. It is only probed on boards with its
+                        number of pits.
+        _book       : optional MancalaBook.OpeningBook object consulted before searching.
+        _evaluator  : optional MancalaEval.Evaluator object scoring the leaves, in place of the
+                        difference in stores.
+    """
+    def __init__(self, name="Computer", max_depth=20, time_limit=1.0, node_limit=None, table_size=2 ** 16,
+                 verbose=False, endgame=None, book=None, evaluator=None):
+        """Initializes a search engine."""
+        self._name = name
+        self._evaluator = evaluator
+        self._endgame = endgame
+        self._book = book
+        self._max_depth = max_depth
+        self._time_limit = time_limit
+        self._node_limit = node_limit
+        self._max_nodes = float('inf') if node_limit is None else node_limit
+        self._table = TranspositionTable(table_size)
+        self._hashers = {}
+        self._info = {}
+        self._verbose = verbose
+        self._hasher = None
+        self._nodes = 0
+        self._deadline = None
+        self._probe = None
+
+    # Public getters
+    def get_name(self):
+        """Returns the name of the computer player."""
+        return self._name
+
+    def get_info(self):
+        """Returns a dictionary of statistics about the last search:
+            depth   : integer representing the deepest completed iteration.
+            score   : integer representing the score of the best move.
+            move    : integer representing the best pit number.
+            nodes   : integer representing the number of nodes searched.
+            seconds : float representing the time taken.
+            nps     : float representing the nodes searched per second.
+            pv      : list of (player, pit) tuples representing the principal variation.
+            book    : boolean representing whether the move came from the opening book.
+        """
+        return self._info
+
+    # Public methods
+    def choose_move(self, board, player_id=None):
+        """Returns the best pit number for a player on a board. The board is not modified.
+
+        Parameters:
+            board     : Board object, which must not be in a game over state.
+            player_id : integer representing the player id (1 or 2) to move. Defaults to the
+                          board's player to move.
+        """
+        return self.search(board, player_id)[0]
+
+    def search(self, board, player_id=None):
+        """Searches a board with iterative deepening until the budget runs out.
+
+        Parameters:
+            board     : Board object, which must not be in a game over state.
+            player_id : integer representing the player id (1 or 2) to move. Defaults to the
+                          board's player to move.
+        Returns:
+            Tuple (pit number, score) for the best move of the deepest completed iteration.
+        """
+        if player_id is None:
+            player_id = board.get_to_move()
+        num_pits, num_seeds = board.get_num_pits(), board.get_num_seeds()
+        root = Mancala.Board(num_pits, num_seeds)
+        root.set_seed_list(board.get_seed_list())
+        root.set_to_move(player_id)
+        moves = root.get_legal_moves(player_id)
+        if not moves:
+            raise ValueError("There is no move to search; the game is over.")
+
+        # Play the opening book move, if the position is in the book.
+        if self._book is not None:
+            entry = self._book.probe(root, player_id)
+            if entry is not None:
+                self._info = {'depth': self._book.get_depth(), 'score': entry[1], 'move': entry[0], 'nodes': 0,
+                              'seconds': 0.0, 'nps': 0.0, 'pv': [(player_id, entry[0])], 'book': True}
+                return entry
+
+        # Reset the budget and statistics.
+        self._hasher = self.get_hasher(num_pits, sum(root.get_seed_list()))
+        self._table.new_search()
+        self._nodes = 0
+        # Only probe the endgame table on boards of its size.
+        self._probe = self._endgame
+        if self._probe is not None and self._probe.get_num_pits() != num_pits:
+            self._probe = None
+        start = time.perf_counter()
+        self._deadline = None if self._time_limit is None else start + self._time_limit
+        best_move, best_score, depth = moves[0], None, 0
+
+        # Deepen one ply at a time, keeping the result of the deepest completed iteration.
+        for iteration in range(1, self._max_depth + 1):
+            try:
+                move, score = self._search_root(root, iteration)
+            except SearchTimeout:
+                break
+            best_move, best_score, depth = move, score, iteration
+            if self._verbose:
+                self._update_info(root, best_move, best_score, depth, start)
+                print(self.format_info())
+            # The iteration used up the whole budget, so another one cannot complete.
+            if self._node_limit is not None and self._nodes >= self._node_limit:
+                break
+
+        self._update_info(root, best_move, best_score, depth, start)
+        return best_move, best_score
+
+    def clear(self):
+        """Empties the transposition table, so that later searches do not depend on the
+        positions searched before."""
+        self._table.clear()
+
+    def get_hasher(self, num_pits, total_seeds):
+        """Returns the (cached) ZobristHasher for a number of pits and seeds in play."""
+        key = (num_pits, total_seeds)
+        hasher = self._hashers.get(key)
+        if hasher is None:
+            hasher = self._hashers[key] = ZobristHasher(num_pits, total_seeds)
+        return hasher
+
+    def format_info(self):
+        """Returns the statistics of the last search as a single line of text."""
+        info = self._info
+        pv = " ".join(f"{player}:{pit}" for player, pit in info['pv'])
+        return (f"depth {info['depth']} score {info['score']} nodes {info['nodes']} "
+                f"time {info['seconds']:.3f}s nps {info['nps']:.0f} pv {pv}")
+
+    # Private methods
+    def _search_root(self, board, depth):
+        """Searches the root position to a fixed depth. Returns the (best pit, score)."""
+        player = board.get_to_move()
+        key = self._hasher.hash(board.get_seed_tuple(), player)
+        alpha, beta = -float('inf'), float('inf')
+        best_move, best_score = None, -float('inf')
+        for pit in self._ordered_moves(board, player, key):
+            score = self._child_score(board, player, pit, depth, alpha, beta)
+            if score > best_score:
+                best_move, best_score = pit, score
+            alpha = max(alpha, score)
+        self._table.store(key, depth, best_score, EXACT, best_move)
+        return best_move, best_score
+
+    def _child_score(self, board, player, pit, depth, alpha, beta):
+        """Plays a move, searches the child position, and takes the move back. Returns the
+        score from the point of view of the player that moved."""
+        board.make_move(player, pit)
+        try:
+            # The same player moves again after an extra turn, so the score is not negated.
+            if board.get_to_move() == player:
+                return self._negamax(board, depth - 1, alpha, beta)
+            return -self._negamax(board, depth - 1, -beta, -alpha)
+        finally:
+            board.unmake_move()
+
+    def _negamax(self, board, depth, alpha, beta):
+        """Returns the negamax score of a position from the point of view of the player to move."""
+        if self._nodes >= self._max_nodes:
+            raise SearchTimeout()
+        self._nodes += 1
+        if self._nodes & 1023 == 0:
+            self._check_clock()
+
+        player = board.get_to_move()
+        if board.is_game_over():
+            return self._final_margin(board, player)
+        if self._probe is not None:
+            score = self._probe.probe(board, player)
+            if score is not None:
+                return score
+        if depth <= 0:
+            if self._evaluator is not None:
+                return self._evaluator.evaluate(board.get_seed_tuple(), player)
+            return board.get_store_seeds(player) - board.get_store_seeds(3 - player)
+
+        # Use the cached result if it was searched deep enough.
+        key = self._hasher.hash(board.get_seed_tuple(), player)
+        entry = self._table.lookup(key)
+        if entry is not None and entry[0] >= depth:
+            entry_score, entry_flag = entry[1], entry[2]
+            if entry_flag == EXACT:
+                return entry_score
+            if entry_flag == LOWER:
+                alpha = max(alpha, entry_score)
+            else:
+                beta = min(beta, entry_score)
+            if alpha >= beta:
+                return entry_score
+
+        alpha_original = alpha
+        best_move, best_score = None, -float('inf')
+        for pit in self._ordered_moves(board, player, key, entry):
+            score = self._child_score(board, player, pit, depth, alpha, beta)
+            if score > best_score:
+                best_move, best_score = pit, score
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        # Store the result, and whether it is exact or only a bound.
+        if best_score <= alpha_original:
+            flag = UPPER
+        elif best_score >= beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self._table.store(key, depth, best_score, flag, best_move)
+        return best_score
+
+    def _ordered_moves(self, board, player, key, entry=None):
+        """Returns the legal pit numbers for a player, with the cached best move first, then
+        extra turns, captures and the rest (see Board.get_ordered_moves)."""
+        if entry is None:
+            entry = self._table.lookup(key)
+        moves = board.get_ordered_moves(player)
+        if entry is not None and entry[3] in moves and moves[0] != entry[3]:
+            moves = (entry[3],) + tuple(pit for pit in moves if pit != entry[3])
+        return moves
+
+    def _final_margin(self, board, player):
+        """Returns the final tally margin of a game over position for a player."""
+        own = board.get_store_seeds(player) + board.get_pit_total(player)
+        opponent = board.get_store_seeds(3 - player) + board.get_pit_total(3 - player)
+        return own - opponent
+
+    def _check_clock(self):
+        """Raises SearchTimeout if the time budget is exhausted."""
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchTimeout()
+
+    def _principal_variation(self, board, max_length):
+        """Returns the principal variation, by following the cached best moves from the root."""
+        pv = []
+        seen = set()
+        while len(pv) < max_length and not board.is_game_over():
+            player = board.get_to_move()
+            key = self._hasher.hash(board.get_seed_tuple(), player)
+            entry = self._table.lookup(key)
+            if entry is None or entry[3] is None or key in seen:
+                break
+            seen.add(key)
+            pv.append((player, entry[3]))
+            board.make_move(player, entry[3])
+        for _ in pv:
+            board.unmake_move()
+        return pv
+
+    def _update_info(self, board, move, score, depth, start):
+        """Updates the statistics of the search."""
+        seconds = time.perf_counter() - start
+        self._info = {
+            'depth': depth,
+            'score': score,
+            'move': move,
+            'nodes': self._nodes,
+            'seconds': seconds,
+            'nps': self._nodes / seconds if seconds > 0 else 0.0,
+            'pv': self._principal_variation(board, max(depth, 1)),
+            'book': False,
+        }
+
+
+def main():
+    """Runs a complete, new game against the computer (player 2)."""
+    Mancala.Mancala().new_game(engines={2: SearchEngine(verbose=True)})
+
+
+if __name__ == "__main__":
+    main()
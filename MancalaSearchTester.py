@@ -0,0 +1,116 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 10:12
+# Description: Unit tests for MancalaSearch.py.
+
+import contextlib
+import io
+import unittest
+import Mancala
+import MancalaSearch
+
+
+def minimax(board, depth):
+    """Reference plain minimax (no pruning, no table) score for the player to move."""
+    player = board.get_to_move()
+    if board.is_game_over():
+        return (board.get_store_seeds(player) + sum(board.get_pit_seeds(player))
+                - board.get_store_seeds(3 - player) - sum(board.get_pit_seeds(3 - player)))
+    if depth == 0:
+        return board.get_store_seeds(player) - board.get_store_seeds(3 - player)
+    best = None
+    for pit in range(1, board.get_num_pits() + 1):
+        if board.get_seeds(player, pit) == 0:
+            continue
+        board.make_move(player, pit)
+        score = minimax(board, depth - 1)
+        if board.get_to_move() != player:
+            score = -score
+        board.unmake_move()
+        best = score if best is None else max(best, score)
+    return best
+
+
+class SearchEngineTester(unittest.TestCase):
+    """Unit tests for SearchEngine class."""
+
+    def test_same_score_as_minimax(self):
+        """Should find the same score as plain minimax, at every depth, with extra turns."""
+        board = Mancala.Board(num_pits=3, num_seeds=3)
+        for depth in range(1, 7):
+            engine = MancalaSearch.SearchEngine(max_depth=depth, time_limit=None)
+            move, score = engine.search(board, 1)
+            self.assertEqual(score, minimax(board, depth))
+            self.assertEqual(engine.get_info()['depth'], depth)
+
+    def test_board_not_modified(self):
+        """Should leave the board and its player to move unchanged."""
+        board = Mancala.Board()
+        board.make_move(1, 1)
+        seeds = board.get_seed_list()
+        MancalaSearch.SearchEngine(max_depth=4, time_limit=None).choose_move(board)
+        self.assertEqual(board.get_seed_list(), seeds)
+        self.assertEqual(board.get_to_move(), 2)
+        self.assertEqual(board.get_undo_depth(), 1)
+
+    def test_node_budget(self):
+        """Should stop at the node budget, and still return a legal move and statistics."""
+        engine = MancalaSearch.SearchEngine(time_limit=None, node_limit=5000)
+        move = engine.choose_move(Mancala.Board(), 2)
+        info = engine.get_info()
+        self.assertIn(move, range(1, 7))
+        self.assertLessEqual(info['nodes'], 5000)
+        self.assertGreater(info['depth'], 0)
+        self.assertEqual(info['pv'][0], (2, move))
+
+        # A budget of exactly the 6 nodes of the first iteration completes it.
+        engine = MancalaSearch.SearchEngine(time_limit=None, node_limit=6)
+        self.assertIsNotNone(engine.search(Mancala.Board(), 1)[1])
+        self.assertEqual((engine.get_info()['nodes'], engine.get_info()['depth']), (6, 1))
+
+    def test_engines_play_new_game(self):
+        """Should play a complete game between two computer players in new_game."""
+        game = Mancala.Mancala()
+        engines = {1: MancalaSearch.SearchEngine("Alpha", max_depth=2, time_limit=None),
+                   2: MancalaSearch.SearchEngine("Beta", max_depth=3, time_limit=None)}
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.new_game(engines=engines)
+        self.assertNotEqual(game.return_winner(), "Game has not ended")
+
+
+class ZobristHasherTester(unittest.TestCase):
+    """Unit tests for ZobristHasher class."""
+
+    def test_mirrors_hash_the_same(self):
+        """Should hash a position and its mirror the same, and search them the same."""
+        hasher = MancalaSearch.ZobristHasher()
+        board = Mancala.Board()
+        board.make_move(1, 2)
+        position = board.get_position()
+        mirror = position.mirror()
+        self.assertEqual(hasher.hash(position.get_seeds(), 2), hasher.hash(mirror.get_seeds(), 1))
+        self.assertNotEqual(hasher.hash(position.get_seeds(), 2), hasher.hash(position.get_seeds(), 1))
+        engine = MancalaSearch.SearchEngine(max_depth=5, time_limit=None)
+        self.assertEqual(engine.search(board, 2), engine.search(mirror.to_board(), 1))
+
+
+class TranspositionTableTester(unittest.TestCase):
+    """Unit tests for TranspositionTable class."""
+
+    def test_replacement(self):
+        """Should keep the deeper entry of the current search, and replace older searches."""
+        table = MancalaSearch.TranspositionTable(size=4)
+        table.new_search()
+        table.store(1, 5, 10, MancalaSearch.EXACT, 3)
+        table.store(5, 2, 20, MancalaSearch.EXACT, 4)     # Same slot, shallower.
+        self.assertEqual(table.lookup(1), (5, 10, MancalaSearch.EXACT, 3))
+        self.assertEqual(table.lookup(5), None)
+        table.new_search()
+        table.store(5, 2, 20, MancalaSearch.EXACT, 4)     # Same slot, older entry.
+        self.assertEqual(table.lookup(5), (2, 20, MancalaSearch.EXACT, 4))
+        self.assertEqual(table.lookup(1), None)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
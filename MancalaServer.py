@@ -0,0 +1,462 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 17:00
+# Description: Implements an asyncio game server hosting many concurrent Mancala sessions, and a load-test client.
+#
+# The module implements the following classes:
+#   Connection - Connection class representing one connected client.
+#   Session - Session class representing one game hosted by the server.
+#   MancalaServer - MancalaServer class that hosts the sessions of every client in one event loop.
+#
+# Clients talk to the server over TCP with a line-based text protocol. Each request is one line, and each response
+# or event is one line. Game ids tag every game line, so one connection can play several games at once.
+#
+#   NAME <name>                      -> OK NAME <name>
+#   NEW [<pits> <seeds>] [BOT <bot>] -> OK NEW <id> 1, then BOARD <id> ...       (the client is player 1)
+#   JOIN <id>                        -> OK JOIN <id> 2, then BOARD <id> ... to both players
+#   MOVE <id> <pit>                  -> BOARD <id> ... to both players (after any bot replies)
+#   BOARD <id>                       -> BOARD <id> ...
+#   LEAVE <id>                       -> OK LEAVE <id>; the opponent receives LEFT <id>
+#   STATS                            -> STATS connections=<n> sessions=<n> games=<n> moves=<n>
+#   QUIT                             -> the server closes the connection
+# Errors are reported as ERR <message>. The bots are the tournament policies: random or greedy. A request line longer
+# than the stream limit (64 KiB) is answered with ERR line too long, and the connection is closed.
+#
+# The board line carries the same data as Mancala.print_board (each store and pits, and whether the game ended):
+#   BOARD <id> TURN <player> <p1 store> <p1 pits> <p2 store> <p2 pits>      while the game is played
+#   BOARD <id> OVER <winner> <p1 store> <p1 pits> <p2 store> <p2 pits>      once it ended (winner 0 for a tie)
+# where the pits are comma-separated, e.g. BOARD 7 TURN 2 1 4,4,0,5,5,5 0 4,4,4,4,4,4
+#
+# Moves are played with Mancala.apply_move (the non-printing core of play_game, with the same rules and final
+# tally), and turn order is kept with Mancala.next_player. Each session holds one Mancala game on a Board,
+# and finished sessions are dropped at once, so the memory per session stays small.
+#
+# To run the server, and a load test against it, e.g.:
+#       python MancalaServer.py serve --port 8765
+#       python MancalaServer.py loadtest --port 8765 --clients 100 --games 10
+
+import argparse
+import asyncio
+import itertools
+import random
+import time
+
+import Mancala
+import MancalaTournament
+
+BOTS = {'random': MancalaTournament.RandomPolicy, 'greedy': MancalaTournament.GreedyPolicy}
+
+# Largest board a session may be created with.
+MAX_PITS = 32
+MAX_SEEDS = 100
+
+
+def format_board(session_id, game):
+    """Returns the BOARD line of a game (see the module description)."""
+    board = game.get_board()
+    if board.is_game_over():
+        status = f"OVER {board.return_winner()}"
+    else:
+        status = f"TURN {game.get_current()}"
+    sides = " ".join(f"{board.get_store_seeds(player)} {','.join(map(str, board.get_pit_seeds(player)))}"
+                     for player in (1, 2))
+    return f"BOARD {session_id} {status} {sides}"
+
+
+def parse_board(line):
+    """Returns the dictionary described by a BOARD line: id, over (boolean), turn (player to
+    move, or None), winner (or None), stores (player 1 and 2), pits (player 1 and 2 lists)."""
+    fields = line.split()
+    if len(fields) != 8 or fields[0] != "BOARD":
+        raise ValueError(f"Not a board line: {line!r}")
+    over = fields[2] == "OVER"
+    value = int(fields[3])
+    return {'id': int(fields[1]), 'over': over, 'turn': None if over else value, 'winner': value if over else None,
+            'stores': (int(fields[4]), int(fields[6])),
+            'pits': ([int(n) for n in fields[5].split(",")], [int(n) for n in fields[7].split(",")])}
+
+
+class Connection:
+    """Connection class representing one connected client.
+
+    Attributes:
+        _writer   : asyncio.StreamWriter object of the connection.
+        _name     : string representing the client's player name.
+        _sessions : set of the ids of the sessions the client plays in.
+    """
+    __slots__ = ('_writer', '_name', '_sessions')
+
+    def __init__(self, writer, name):
+        """Initializes a connection."""
+        self._writer = writer
+        self._name = name
+        self._sessions = set()
+
+    def get_name(self):
+        """Returns the client's player name."""
+        return self._name
+
+    def set_name(self, name):
+        """Sets the client's player name."""
+        self._name = name
+
+    def get_sessions(self):
+        """Returns the set of the ids of the sessions the client plays in."""
+        return self._sessions
+
+    def send(self, line):
+        """Queues a line to the client (the server drains the writer after each request)."""
+        if not self._writer.is_closing():
+            self._writer.write(line.encode() + b"\n")
+
+
+class Session:
+    """Session class representing one game hosted by the server.
+
+    Attributes:
+        _id      : integer representing the session (game) id.
+        _game    : Mancala object of the game, on a Board.
+        _seats   : list [None, player 1, player 2], where each player is a Connection object,
+                    a bot policy, or None while the seat is open.
+    """
+    __slots__ = ('_id', '_game', '_seats')
+
+    def __init__(self, session_id, num_pits, num_seeds, player_1, player_2=None):
+        """Initializes a session, with the players' names taken from their seats."""
+        self._id = session_id
+        self._game = Mancala.Mancala(Mancala.Board(num_pits, num_seeds))
+        self._seats = [None, player_1, player_2]
+        self._game.create_player(player_1.get_name())
+        if player_2 is not None:
+            self._game.create_player(player_2.get_name())
+
+    def get_id(self):
+        """Returns the session id."""
+        return self._id
+
+    def get_game(self):
+        """Returns the Mancala object of the game."""
+        return self._game
+
+    def get_seat(self, player):
+        """Returns the player (Connection, bot policy, or None) of a seat."""
+        return self._seats[player]
+
+    def is_open(self):
+        """Returns whether the player 2 seat is open."""
+        return self._seats[2] is None
+
+    def join(self, connection):
+        """Seats a connection as player 2."""
+        self._seats[2] = connection
+        self._game.create_player(connection.get_name())
+
+    def get_connections(self):
+        """Returns the connected (non-bot) players of the session."""
+        return [seat for seat in self._seats[1:] if isinstance(seat, Connection)]
+
+    def play(self, player, pit):
+        """Plays a move for a player, then the moves of a bot opponent until it is a connected
+        player's turn again or the game is over.
+        Raises:
+            ValueError if it is not the player's turn, or the move is invalid.
+        """
+        game = self._game
+        if game.get_current() != player:
+            raise ValueError("Not your turn.")
+        self._apply(player, pit)
+        board = game.get_board()
+        while not board.is_game_over() and not isinstance(self._seats[game.get_current()], Connection):
+            current = game.get_current()
+            self._apply(current, self._seats[current].choose_move(board, current))
+
+    def _apply(self, player, pit):
+        """Plays one move with Mancala.apply_move, and passes the turn unless it earned another."""
+        if not self._game.apply_move(player, pit).is_extra_turn():
+            self._game.next_player()
+
+
+class MancalaServer:
+    """MancalaServer class that hosts the game sessions of every client in one asyncio event loop.
+
+    Attributes:
+        _host        : string representing the host to listen on.
+        _port        : integer representing the port to listen on (0 for any free port).
+        _bots        : dictionary mapping bot names to policy objects.
+        _sessions    : dictionary mapping session ids to Session objects.
+        _connections : set of the Connection objects of the connected clients.
+        _ids         : iterator of the next session ids.
+        _games       : integer representing the number of games started.
+        _moves       : integer representing the number of moves played by clients.
+        _server      : asyncio.Server object once started.
+    """
+    def __init__(self, host="127.0.0.1", port=8765, seed=0):
+        """Initializes a server (see start)."""
+        self._host = host
+        self._port = port
+        self._bots = {name: policy() for name, policy in BOTS.items()}
+        for i, bot in enumerate(self._bots.values()):
+            bot.seed(seed + i)
+        self._sessions = {}
+        self._connections = set()
+        self._ids = itertools.count(1)
+        self._games = 0
+        self._moves = 0
+        self._server = None
+
+    # Public getters
+    def get_port(self):
+        """Returns the port the server listens on (the actual port once started)."""
+        return self._port
+
+    def get_stats(self):
+        """Returns a dictionary of the numbers of connections, sessions, games and moves."""
+        return {'connections': len(self._connections), 'sessions': len(self._sessions), 'games': self._games,
+                'moves': self._moves}
+
+    # Public methods
+    async def start(self):
+        """Starts listening. Returns the port listened on."""
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+        self._port = self._server.sockets[0].getsockname()[1]
+        return self._port
+
+    async def serve_forever(self):
+        """Starts listening (if not started), and serves until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stops listening, and waits for the server to close."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def handle_line(self, connection, line):
+        """Handles one request line of a client. Returns False if the client quit."""
+        fields = line.split()
+        if not fields:
+            return True
+        command, arguments = fields[0].upper(), fields[1:]
+        if command == "QUIT":
+            return False
+        handler = getattr(self, f"_command_{command.lower()}", None)
+        if handler is None:
+            connection.send(f"ERR Unknown command {fields[0]}.")
+            return True
+        try:
+            handler(connection, arguments)
+        except (ValueError, IndexError) as error:
+            connection.send(f"ERR {error or 'Invalid request.'}")
+        return True
+
+    # Private methods
+    async def _handle(self, reader, writer):
+        """Serves one client connection until it quits or disconnects."""
+        connection = Connection(writer, "guest")
+        self._connections.add(connection)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    connection.send("ERR line too long")
+                    await writer.drain()
+                    break
+                if not line or not self.handle_line(connection, line.decode(errors="replace")):
+                    break
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._disconnect(connection)
+            writer.close()
+
+    def _disconnect(self, connection):
+        """Removes a client, and ends its sessions."""
+        self._connections.discard(connection)
+        for session_id in list(connection.get_sessions()):
+            self._end(self._sessions[session_id], connection)
+
+    def _end(self, session, leaver=None):
+        """Removes a session, telling the other connected player if a player left."""
+        self._sessions.pop(session.get_id(), None)
+        for player in session.get_connections():
+            player.get_sessions().discard(session.get_id())
+            if leaver is not None and player is not leaver:
+                player.send(f"LEFT {session.get_id()}")
+
+    def _session(self, connection, session_id):
+        """Returns the session of an id that the connection plays in."""
+        session = self._sessions.get(int(session_id))
+        if session is None or session.get_id() not in connection.get_sessions():
+            raise ValueError(f"No game {session_id}.")
+        return session
+
+    def _broadcast(self, session):
+        """Sends the board to the session's players, and drops the session once it ended."""
+        line = format_board(session.get_id(), session.get_game())
+        for player in session.get_connections():
+            player.send(line)
+        if session.get_game().get_board().is_game_over():
+            self._end(session)
+
+    def _command_name(self, connection, arguments):
+        connection.set_name(arguments[0])
+        connection.send(f"OK NAME {arguments[0]}")
+
+    def _command_new(self, connection, arguments):
+        if len(arguments) not in (0, 2, 4) or len(arguments) == 4 and arguments[2].upper() != "BOT":
+            raise ValueError("Usage: NEW [<pits> <seeds>] [BOT <bot>].")
+        num_pits, num_seeds, bot = 6, 4, None
+        if len(arguments) == 2 and arguments[0].upper() == "BOT":
+            bot = arguments[1]
+        elif arguments:
+            num_pits, num_seeds = int(arguments[0]), int(arguments[1])
+            if len(arguments) == 4:
+                bot = arguments[3]
+        if not 1 <= num_pits <= MAX_PITS or not 1 <= num_seeds <= MAX_SEEDS:
+            raise ValueError(f"Boards are limited to {MAX_PITS} pits and {MAX_SEEDS} seeds.")
+        if bot is not None and bot not in self._bots:
+            raise ValueError(f"Unknown bot {bot}; choose from {', '.join(sorted(self._bots))}.")
+
+        session = Session(next(self._ids), num_pits, num_seeds, connection, self._bots.get(bot))
+        self._sessions[session.get_id()] = session
+        connection.get_sessions().add(session.get_id())
+        self._games += 1
+        connection.send(f"OK NEW {session.get_id()} 1")
+        connection.send(format_board(session.get_id(), session.get_game()))
+
+    def _command_join(self, connection, arguments):
+        session = self._sessions.get(int(arguments[0]))
+        if session is None or not session.is_open() or session.get_seat(1) is connection:
+            raise ValueError(f"Game {arguments[0]} cannot be joined.")
+        session.join(connection)
+        connection.get_sessions().add(session.get_id())
+        connection.send(f"OK JOIN {session.get_id()} 2")
+        self._broadcast(session)
+
+    def _command_move(self, connection, arguments):
+        session = self._session(connection, arguments[0])
+        if session.is_open():
+            raise ValueError("Waiting for player 2 to join.")
+        player = 1 if session.get_seat(1) is connection else 2
+        session.play(player, int(arguments[1]))
+        self._moves += 1
+        self._broadcast(session)
+
+    def _command_board(self, connection, arguments):
+        session = self._session(connection, arguments[0])
+        connection.send(format_board(session.get_id(), session.get_game()))
+
+    def _command_leave(self, connection, arguments):
+        session = self._session(connection, arguments[0])
+        connection.send(f"OK LEAVE {session.get_id()}")
+        self._end(session, connection)
+
+    def _command_stats(self, connection, arguments):
+        connection.send("STATS " + " ".join(f"{name}={value}" for name, value in self.get_stats().items()))
+
+
+async def load_test(host, port, clients=50, games=10, num_pits=6, num_seeds=4, bot="random", seed=0):
+    """Plays games against server bots from many concurrent clients, choosing random moves, and
+    measures the server's move throughput and latency.
+
+    Parameters:
+        host, port : address of the server.
+        clients    : integer representing the number of concurrent connections.
+        games      : integer representing the number of games per connection.
+        num_pits   : integer representing the number of pits per player.
+        num_seeds  : integer representing the initial number of seeds per pit.
+        bot        : string representing the server bot to play against.
+        seed       : seed of the random moves.
+    Returns:
+        Dictionary of clients, games, moves, seconds, moves_per_second, and the p50, p95, p99 and
+        max move latencies in milliseconds (from sending a move to receiving the board).
+    """
+    latencies = []
+
+    async def play(index):
+        rng = random.Random(seed + index)
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for _ in range(games):
+                writer.write(f"NEW {num_pits} {num_seeds} BOT {bot}\n".encode())
+                await reader.readline()
+                board = parse_board((await reader.readline()).decode())
+                while not board['over']:
+                    pit = rng.choice([pit for pit, seeds in enumerate(board['pits'][0], 1) if seeds])
+                    start = time.perf_counter()
+                    writer.write(f"MOVE {board['id']} {pit}\n".encode())
+                    await writer.drain()
+                    line = (await reader.readline()).decode()
+                    latencies.append(time.perf_counter() - start)
+                    board = parse_board(line)
+            writer.write(b"QUIT\n")
+            await writer.drain()
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(play(index) for index in range(clients)))
+    seconds = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {'clients': clients, 'games': clients * games, 'moves': len(latencies), 'seconds': seconds,
+            'moves_per_second': len(latencies) / seconds if seconds > 0 else 0.0, 'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95), 'p99_ms': percentile(0.99), 'max_ms': percentile(1.0)}
+
+
+async def _run_load_test(args):
+    """Runs a load test, against a server started in the same event loop if requested."""
+    server = None
+    port = args.port
+    if args.spawn:
+        server = MancalaServer(args.host, 0)
+        port = await server.start()
+    try:
+        return await load_test(args.host, port, args.clients, args.games, args.num_pits, args.num_seeds, args.bot)
+    finally:
+        if server is not None:
+            await server.close()
+
+
+def main():
+    """Runs the server, or a load test, from the command line."""
+    parser = argparse.ArgumentParser(description="Hosts Mancala games over TCP, or load-tests a server.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="run the server")
+    loadtest = commands.add_parser("loadtest", help="play many concurrent games against a server's bots")
+    for command in (serve, loadtest):
+        command.add_argument("--host", default="127.0.0.1")
+        command.add_argument("--port", type=int, default=8765)
+    loadtest.add_argument("--clients", type=int, default=50)
+    loadtest.add_argument("--games", type=int, default=10, help="games per client")
+    loadtest.add_argument("--num-pits", type=int, default=6)
+    loadtest.add_argument("--num-seeds", type=int, default=4)
+    loadtest.add_argument("--bot", default="random", choices=sorted(BOTS))
+    loadtest.add_argument("--spawn", action="store_true", help="start a server in-process on a free port")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        server = MancalaServer(args.host, args.port)
+        print(f"Serving Mancala on {args.host}:{args.port}")
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            pass
+        return
+
+    results = asyncio.run(_run_load_test(args))
+    print(" ".join(f"{name} {value:.2f}" if isinstance(value, float) else f"{name} {value}"
+                   for name, value in results.items()))
+
+
+if __name__ == "__main__":
+    main()
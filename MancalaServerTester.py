@@ -0,0 +1,132 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 17:00
+# Description: Unit tests for MancalaServer.py.
+
+import asyncio
+import unittest
+import Mancala
+import MancalaServer
+
+
+async def connect(port):
+    """Returns a (send, receive) pair of coroutine functions for a new client connection."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    async def send(line):
+        writer.write(line.encode() + b"\n")
+        await writer.drain()
+
+    async def receive():
+        return (await asyncio.wait_for(reader.readline(), 5)).decode().strip()
+
+    return send, receive
+
+
+def run_with_server(test):
+    """Runs a test coroutine, called with the server and its port, against a server on a free port."""
+    async def run():
+        server = MancalaServer.MancalaServer(port=0)
+        port = await server.start()
+        try:
+            await test(server, port)
+        finally:
+            await server.close()
+    asyncio.run(run())
+
+
+class ServerTester(unittest.TestCase):
+    """Unit tests for the game server."""
+
+    def test_format_board(self):
+        """Should describe the board as print_board does, and parse back."""
+        game = Mancala.Mancala(Mancala.Board())
+        game.create_player("a")
+        game.create_player("b")
+        game.apply_move(1, 3)
+        line = MancalaServer.format_board(7, game)
+        self.assertEqual(line, "BOARD 7 TURN 1 1 4,4,0,5,5,5 0 4,4,4,4,4,4")
+        board = MancalaServer.parse_board(line)
+        self.assertEqual((board['id'], board['over'], board['turn']), (7, False, 1))
+        self.assertEqual(board['pits'][0], [4, 4, 0, 5, 5, 5])
+
+    def test_two_players(self):
+        """Should enforce turn order and send the board to both players."""
+        async def test(server, port):
+            send_1, receive_1 = await connect(port)
+            send_2, receive_2 = await connect(port)
+            await send_1("NEW 6 4")
+            self.assertEqual(await receive_1(), "OK NEW 1 1")
+            await receive_1()
+            await send_1("MOVE 1 3")
+            self.assertEqual(await receive_1(), "ERR Waiting for player 2 to join.")
+            await send_2("JOIN 1")
+            self.assertEqual(await receive_2(), "OK JOIN 1 2")
+            self.assertEqual(await receive_1(), await receive_2())
+            await send_2("MOVE 1 1")
+            self.assertEqual(await receive_2(), "ERR Not your turn.")
+            await send_1("MOVE 1 3")
+            line = await receive_1()
+            self.assertEqual(line, await receive_2())
+            self.assertEqual(MancalaServer.parse_board(line)['turn'], 1)
+            await send_1("MOVE 1 1")
+            line = await receive_1()
+            self.assertEqual(line, await receive_2())
+            self.assertEqual(MancalaServer.parse_board(line)['turn'], 2)
+            await send_2("LEAVE 1")
+            self.assertEqual(await receive_2(), "OK LEAVE 1")
+            self.assertEqual(await receive_1(), "LEFT 1")
+            self.assertEqual(server.get_stats()['sessions'], 0)
+        run_with_server(test)
+
+    def test_bot_game(self):
+        """Should play the bot's replies, and drop the session once the game ends."""
+        async def test(server, port):
+            send, receive = await connect(port)
+            await send("NEW 3 2 BOT greedy")
+            self.assertEqual(await receive(), "OK NEW 1 1")
+            board = MancalaServer.parse_board(await receive())
+            while not board['over']:
+                self.assertEqual(board['turn'], 1)
+                pit = next(pit for pit, seeds in enumerate(board['pits'][0], 1) if seeds)
+                await send(f"MOVE 1 {pit}")
+                board = MancalaServer.parse_board(await receive())
+            self.assertEqual(sum(board['stores']), 12)
+            await send("BOARD 1")
+            self.assertEqual(await receive(), "ERR No game 1.")
+            await send("NEW 0 4")
+            self.assertTrue((await receive()).startswith("ERR Boards are limited"))
+            await send("FOO")
+            self.assertEqual(await receive(), "ERR Unknown command FOO.")
+            self.assertEqual(server.get_stats()['sessions'], 0)
+        run_with_server(test)
+
+    def test_malformed_requests(self):
+        """Should reject incomplete NEW requests, and close the connection on a line too long."""
+        async def test(server, port):
+            send, receive = await connect(port)
+            for line in ("NEW 6", "NEW 6 4 BOT", "NEW 6 4 FOO greedy"):
+                await send(line)
+                self.assertEqual(await receive(), "ERR Usage: NEW [<pits> <seeds>] [BOT <bot>].")
+            self.assertEqual(server.get_stats()['sessions'], 0)
+            await send("NAME " + "x" * 70000)
+            self.assertEqual(await receive(), "ERR line too long")
+            self.assertEqual(await receive(), "")
+        run_with_server(test)
+
+    def test_load_test(self):
+        """Should play every game, and report the throughput and latency."""
+        async def test(server, port):
+            results = await MancalaServer.load_test("127.0.0.1", port, clients=5, games=2, num_pits=4,
+                                                    num_seeds=3)
+            self.assertEqual(results['games'], 10)
+            self.assertEqual(results['moves'], server.get_stats()['moves'])
+            self.assertGreater(results['moves_per_second'], 0)
+            self.assertLessEqual(results['p50_ms'], results['p99_ms'])
+            self.assertEqual(server.get_stats()['games'], 10)
+        run_with_server(test)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
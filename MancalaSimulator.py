@@ -0,0 +1,276 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 11:05
+# Description: Implements a batched NumPy simulator that plays many Mancala games in lockstep.
+#
+# The module implements the following class:
+#   BatchSimulator - BatchSimulator class representing N independent games as one NumPy array.
+#
+# Each game is one row of an (N, 2 * num_pits + 2) integer array, in the same flat layout as Board.get_seed_list
+# (and the seed list returned by Mancala.play_game):
+#   | p1 pits 1..num_pits | p1 store | p2 pits 1..num_pits | p2 store |
+#
+# A step plays one move on every game at once. Sowing is done in closed form: the full laps around the board are
+# added to every container except the opposing player's store, and the remaining seeds (between 1 and a full lap)
+# are added through each player's sowing order, taken from the board's sowing table (see Mancala.SowingTable).
+# Captures, extra turns, game over detection and the final tally are applied with array operations as well,
+# following the same rules as Mancala.play_game.
+#
+# Requires NumPy.
+
+import numpy as np
+
+import Mancala
+
+
+class BatchSimulator:
+    """BatchSimulator class representing a batch of independent Mancala games played in lockstep.
+
+    Attributes:
+        _num_pits   : integer representing the number of pits per player.
+        _num_seeds  : integer representing the initial number of seeds per pit.
+        _seeds      : (N, 2 * num_pits + 2) integer array of the seeds in every pit and store.
+        _to_move    : (N,) integer array of the player id (1 or 2) to move in each game.
+        _over       : (N,) boolean array of whether each game is over (and has been tallied).
+        _moves      : (N,) integer array of the number of valid moves played in each game.
+        _cycle      : (3, 2 * num_pits + 1) integer array, where _cycle[player] lists the flat
+                        indices a player sows into, in order (skipping the opposing store).
+        _position   : (3, 2 * num_pits + 2) integer array, where _position[player][index] is
+                        the position of the flat index in _cycle[player].
+    """
+    def __init__(self, num_games, num_pits=6, num_seeds=4, dtype=np.int32):
+        """Initializes a batch of games, all at the starting position with player 1 to move.
+
+        Parameters:
+            num_games : integer representing the number of games (N).
+            num_pits  : integer representing the number of pits per player.
+            num_seeds : integer representing the initial number of seeds per pit.
+            dtype     : NumPy integer type used for the seeds.
+        """
+        self._num_pits = num_pits
+        self._num_seeds = num_seeds
+        size = 2 * num_pits + 2
+        self._seeds = np.full((num_games, size), num_seeds, dtype=dtype)
+        self._seeds[:, [num_pits, size - 1]] = 0
+        self._to_move = np.ones(num_games, dtype=np.int8)
+        self._over = np.zeros(num_games, dtype=bool)
+        self._moves = np.zeros(num_games, dtype=np.int32)
+
+        # Take the sowing order of each player, starting after the opponent's store, from the
+        # board's sowing table, so the sowing rules live in one place.
+        sowing = Mancala.sowing_table(num_pits)
+        self._cycle = np.zeros((3, size - 1), dtype=np.intp)
+        self._position = np.zeros((3, size), dtype=np.intp)
+        for player in (1, 2):
+            order = sowing.get_flat(player)
+            self._cycle[player] = order
+            self._position[player, order] = np.arange(size - 1)
+
+    # Public getters
+    def get_num_games(self):
+        """Returns the number of games in the batch."""
+        return self._seeds.shape[0]
+
+    def get_num_pits(self):
+        """Returns the number of pits per player."""
+        return self._num_pits
+
+    def get_seeds(self):
+        """Returns the (N, 2 * num_pits + 2) array of seeds, in the same order as Mancala.play_game."""
+        return self._seeds
+
+    def get_to_move(self):
+        """Returns the (N,) array of the player id (1 or 2) to move."""
+        return self._to_move
+
+    def get_game_over(self):
+        """Returns the (N,) boolean array of whether each game is over."""
+        return self._over
+
+    def get_move_counts(self):
+        """Returns the (N,) array of the number of valid moves played in each game."""
+        return self._moves
+
+    def get_store_index(self, player):
+        """Given the player id, returns the flat index of the player store."""
+        return player * (self._num_pits + 1) - 1
+
+    # Public methods
+    def set_game(self, index, seeds, to_move=1):
+        """Sets the seeds and player to move of one game, e.g. from Board.get_seed_list.
+        Parameters:
+            index   : integer representing the game in the batch.
+            seeds   : sequence of 2 * num_pits + 2 integers.
+            to_move : integer representing the player id (1 or 2) to move.
+        """
+        self._seeds[index] = seeds
+        self._to_move[index] = to_move
+        self._over[index] = False
+        if self._pit_totals(self._seeds[index:index + 1]).min() == 0:
+            self._final_tally(np.array([index]))
+
+    def legal_moves(self):
+        """Returns an (N, num_pits) boolean array of the non-empty pits of the player to move
+        (all False for games that are over)."""
+        num_pits = self._num_pits
+        start = np.where(self._to_move == 1, 0, num_pits + 1)
+        pits = self._seeds[np.arange(self.get_num_games())[:, None], start[:, None] + np.arange(num_pits)]
+        return (pits > 0) & ~self._over[:, None]
+
+    def random_moves(self, rng):
+        """Returns an (N,) array of uniformly random legal pit numbers for the player to move
+        (0 for games that are over).
+        Parameters:
+            rng : numpy.random.Generator object.
+        """
+        legal = self.legal_moves()
+        counts = legal.sum(axis=1)
+        choice = (rng.random(len(counts)) * counts).astype(np.intp)
+        # Pick the choice-th legal pit in each row.
+        rank = np.cumsum(legal, axis=1) - 1
+        pits = np.argmax(legal & (rank == choice[:, None]), axis=1) + 1
+        return np.where(counts > 0, pits, 0)
+
+    def step(self, pits, players=None):
+        """Plays one move on every game in the batch, following the same rules as
+        Mancala.play_game (including the final tally once a game is over). Games that are
+        over, and invalid moves (a pit number outside 1 to num_pits, or an empty pit), are
+        left unchanged.
+
+        Parameters:
+            pits    : (N,) integer array of the pit number to play in each game.
+            players : optional (N,) integer array of the player id (1 or 2) to move in each
+                        game. Defaults to the player to move.
+        Returns:
+            Dictionary of (N,) arrays describing the moves:
+                valid      : boolean, whether the move was played.
+                landing    : integer, flat index the last seed landed in (-1 if not played).
+                captured   : integer, seeds captured from the opposing pit (-1 if no capture).
+                extra_turn : boolean, whether the player gets another turn.
+                game_over  : boolean, whether the game is over after the move.
+        """
+        num_games = self.get_num_games()
+        num_pits = self._num_pits
+        cycle_length = 2 * num_pits + 1
+        seeds = self._seeds
+        pits = np.asarray(pits, dtype=np.intp)
+        players = self._to_move.astype(np.intp) if players is None else np.asarray(players, dtype=np.intp)
+
+        landing = np.full(num_games, -1, dtype=np.intp)
+        captured = np.full(num_games, -1, dtype=seeds.dtype)
+        extra_turn = np.zeros(num_games, dtype=bool)
+
+        # Select the games with a valid move.
+        valid = ~self._over & (pits >= 1) & (pits <= num_pits) & ((players == 1) | (players == 2))
+        start = np.where(valid, (players - 1) * (num_pits + 1) + pits - 1, 0)
+        valid &= seeds[np.arange(num_games), start] > 0
+        rows = np.nonzero(valid)[0]
+        if len(rows) == 0:
+            return {'valid': valid, 'landing': landing, 'captured': captured, 'extra_turn': extra_turn,
+                    'game_over': self._over.copy()}
+        player, start = players[rows], start[rows]
+
+        # Pick up the seeds, and split them into full laps and the remainder to walk.
+        count = seeds[rows, start].astype(np.intp)
+        seeds[rows, start] = 0
+        laps, remainder = np.divmod(count - 1, cycle_length)
+        remainder += 1
+
+        # Add the full laps to every container except the opposing player's store.
+        has_laps = laps > 0
+        if has_laps.any():
+            lap_rows = rows[has_laps]
+            seeds[lap_rows] += laps[has_laps, None].astype(seeds.dtype)
+            opponent_store = np.where(player[has_laps] == 1, 2 * num_pits + 1, num_pits)
+            seeds[lap_rows, opponent_store] -= laps[has_laps].astype(seeds.dtype)
+
+        # Walk the remainder along each player's sowing order. Each row touches a container at
+        # most once, so a plain fancy-indexed add is safe.
+        steps = np.arange(1, cycle_length + 1)
+        position = self._position[player, start]
+        walk = self._cycle[player[:, None], (position[:, None] + steps) % cycle_length]
+        seeds[rows[:, None], walk] += (steps <= remainder[:, None]).astype(seeds.dtype)
+        last = walk[np.arange(len(rows)), remainder - 1]
+        landing[rows] = last
+
+        # Last seed in the player store: another turn.
+        own_store = player * (num_pits + 1) - 1
+        extra = last == own_store
+        extra_turn[rows] = extra
+
+        # Last seed in an empty pit of the player: capture the seed and the opposing pit.
+        own_pit = (last >= own_store - num_pits) & (last < own_store)
+        capture = own_pit & (seeds[rows, last] == 1)
+        if capture.any():
+            capture_rows, capture_last = rows[capture], last[capture]
+            opposite = 2 * num_pits - capture_last
+            taken = seeds[capture_rows, opposite].copy()
+            seeds[capture_rows, own_store[capture]] += taken + 1
+            seeds[capture_rows, opposite] = 0
+            seeds[capture_rows, capture_last] = 0
+            captured[capture_rows] = taken
+
+        # Pass the turn, unless the player gets another turn.
+        self._to_move[rows] = np.where(extra, player, 3 - player)
+        self._moves[rows] += 1
+
+        # Games where a player has no seeds left in their pits are over: tally them.
+        totals = self._pit_totals(seeds[rows])
+        ended = rows[(totals == 0).any(axis=1)]
+        if len(ended):
+            self._final_tally(ended)
+        return {'valid': valid, 'landing': landing, 'captured': captured, 'extra_turn': extra_turn,
+                'game_over': self._over.copy()}
+
+    def play_random_games(self, rng, max_steps=10000):
+        """Plays uniformly random legal moves on every game until all games are over.
+        Parameters:
+            rng       : numpy.random.Generator object.
+            max_steps : integer representing the maximum number of steps to play.
+        Returns:
+            (N, steps) integer array of the pit numbers played at each step (0 where the game
+            was already over), with the player of each move in the second returned array.
+        """
+        pits, players = [], []
+        for _ in range(max_steps):
+            if self._over.all():
+                break
+            moves = self.random_moves(rng)
+            players.append(self._to_move.copy())
+            pits.append(moves)
+            self.step(moves)
+        if not pits:
+            empty = np.zeros((self.get_num_games(), 0), dtype=np.intp)
+            return empty, empty
+        return np.stack(pits, axis=1), np.stack(players, axis=1)
+
+    def final_scores(self):
+        """Returns an (N, 2) array of the player 1 and 2 totals (store plus remaining pit seeds)."""
+        totals = self._pit_totals(self._seeds)
+        num_pits = self._num_pits
+        return totals + self._seeds[:, [num_pits, 2 * num_pits + 1]]
+
+    def winners(self):
+        """Returns an (N,) integer array of the winner of each game, following Board.return_winner:
+        1 or 2 for the winner, 0 for a tie, and -1 if the game is not over."""
+        scores = self.final_scores()
+        winner = np.where(scores[:, 0] > scores[:, 1], 1, np.where(scores[:, 0] < scores[:, 1], 2, 0))
+        return np.where(self._over, winner, -1)
+
+    # Private methods
+    def _pit_totals(self, seeds):
+        """Returns an (M, 2) array of the seeds left in the pits of player 1 and 2."""
+        num_pits = self._num_pits
+        return np.stack([seeds[:, :num_pits].sum(axis=1), seeds[:, num_pits + 1:-1].sum(axis=1)], axis=1)
+
+    def _final_tally(self, rows):
+        """Moves the seeds remaining in the pits of the given games to their player stores, and
+        marks the games as over."""
+        num_pits = self._num_pits
+        seeds = self._seeds
+        totals = self._pit_totals(seeds[rows])
+        seeds[rows, num_pits] += totals[:, 0].astype(seeds.dtype)
+        seeds[rows, 2 * num_pits + 1] += totals[:, 1].astype(seeds.dtype)
+        seeds[rows[:, None], np.r_[0:num_pits, num_pits + 1:2 * num_pits + 1]] = 0
+        self._over[rows] = True
@@ -0,0 +1,56 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 11:05
+# Description: Unit tests for MancalaSimulator.py.
+
+import contextlib
+import io
+import unittest
+import Mancala
+
+try:
+    import numpy as np
+    import MancalaSimulator
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class BatchSimulatorTester(unittest.TestCase):
+    """Unit tests for BatchSimulator class."""
+
+    def test_same_as_play_game(self):
+        """Should match Mancala.play_game on every game of a batch of random games."""
+        for num_pits, num_seeds in ((6, 4), (4, 12), (3, 1)):
+            simulator = MancalaSimulator.BatchSimulator(200, num_pits, num_seeds)
+            pits, players = simulator.play_random_games(np.random.default_rng(5))
+            self.assertEqual(simulator.get_game_over().all(), True)
+            winners = simulator.winners()
+            for i in range(simulator.get_num_games()):
+                board = Mancala.Board(num_pits, num_seeds)
+                game = Mancala.Mancala(board)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for player, pit in zip(players[i], pits[i]):
+                        if pit:
+                            game.play_game(int(player), int(pit))
+                self.assertEqual(board.get_seed_list(), simulator.get_seeds()[i].tolist())
+                self.assertEqual(board.return_winner(), winners[i])
+
+    def test_step_results(self):
+        """Should report extra turns, captures and invalid moves like Board.apply_move."""
+        simulator = MancalaSimulator.BatchSimulator(3)
+        result = simulator.step([3, 0, 1])
+        self.assertEqual(result['valid'].tolist(), [True, False, True])
+        self.assertEqual(result['extra_turn'].tolist(), [True, False, False])
+        self.assertEqual(simulator.get_to_move().tolist(), [1, 1, 2])
+        simulator.set_game(2, Mancala.Board().get_seed_list())
+        simulator.step([0, 0, 5])
+        simulator.step([0, 0, 1], players=[1, 1, 2])
+        result = simulator.step([0, 0, 1], players=[1, 1, 1])
+        self.assertEqual(result['captured'].tolist(), [-1, -1, 6])
+        self.assertEqual(simulator.get_seeds()[2].tolist(), [0, 5, 5, 5, 0, 5, 8, 0, 0, 5, 5, 5, 5, 0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
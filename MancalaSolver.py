@@ -0,0 +1,246 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 17:40
+# Description: Implements an exhaustive (strong) solver of small Mancala board configurations.
+#
+# A board configuration (num_pits, num_seeds) starts with 2 * num_pits * num_seeds seeds in the pits, so the endgame
+# table of every position with up to that many seeds in the pits (see MancalaEndgame) holds the exact value of every
+# position of the game, including the starting board. The solver builds that table level by level (a level being
+# the positions with the same number of seeds left in the pits), and reads the game-theoretic result and the value
+# of every first move from it.
+#
+# The table uses the same compact encoding and file format as MancalaEndgame: one signed byte per position, indexed
+# by the combinatorial rank of the position, written straight into a memory-mapped file, so the table lives on disk
+# and in the page cache instead of the heap. Within a level, the positions are grouped by potential; the positions
+# of a group never move to each other, so each group is split into chunks (given by their ranks within the level)
+# that a process pool solves in parallel, every worker writing into its own shared map of the file. Only the ranks of
+# the level being solved are held in memory, at 4 bytes per position.
+#
+# The header of the file is updated after every solved level, so the file is a valid EndgameTable at all times. A
+# solve that is interrupted, or a larger configuration with the same number of pits, picks up from the levels
+# already in the file: solving 3x3 then 3x4 only solves the levels from 19 to 24 seeds the second time.
+#
+# To solve a configuration, simply call:
+#       report = solve("solved-3.db", num_pits=3, num_seeds=3)
+#       print(format_report(report))
+# or from the command line:
+#       python MancalaSolver.py 3x1 3x2 3x3 4x1 4x2 --directory tables
+
+import argparse
+import array
+import mmap
+import multiprocessing
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import Mancala
+import MancalaEndgame
+from MancalaEndgame import HEADER, MAGIC
+
+
+def level_groups(level, num_pits):
+    """Returns the positions with `level` seeds in the pits, grouped by potential in increasing
+    order: a list of arrays of the positions' ranks within the level."""
+    groups = {}
+    for index, pits in enumerate(MancalaEndgame.compositions(level, 2 * num_pits)):
+        groups.setdefault(MancalaEndgame.potential(pits, num_pits), array.array('I')).append(index)
+    return [groups[key] for key in sorted(groups)]
+
+
+def peak_memory():
+    """Returns the peak resident memory of this process and its finished worker processes, in
+    bytes, or None where the resource module is not available."""
+    if resource is None:
+        return None
+    peak = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            + resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _open_table(path, num_pits, max_seeds):
+    """Returns the (file, writable map, num_pits, binomial table) state used to solve positions."""
+    file = open(path, "r+b")
+    return file, mmap.mmap(file.fileno(), 0), num_pits, MancalaEndgame.binomial_table(max_seeds + 2 * num_pits + 1)
+
+
+def _solve_chunk(state, task):
+    """Solves a chunk of positions of one level, and writes their values into the table.
+    Parameters:
+        state : tuple returned by _open_table.
+        task  : tuple (level, file offset of the level, array of ranks within the level).
+    Returns:
+        Integer representing the number of positions solved.
+    """
+    level, offset, ranks = task
+    _, table, num_pits, binomials = state
+    parts = 2 * num_pits
+
+    def value_of(pits):
+        value = table[HEADER.size + MancalaEndgame.rank(pits, binomials)]
+        return value - 256 if value > 127 else value
+
+    for index in ranks:
+        pits = MancalaEndgame.unrank(index, level, parts, binomials)
+        table[offset + index] = MancalaEndgame.solve_position(pits, num_pits, value_of) & 0xff
+    return len(ranks)
+
+
+# Table state of the worker processes, set by the pool initializer.
+_worker_state = None
+
+
+def _init_worker(path, num_pits, max_seeds):
+    """Pool initializer: maps the table file in the worker process."""
+    global _worker_state
+    _worker_state = _open_table(path, num_pits, max_seeds)
+
+
+def _solve_task(task):
+    """Pool task: solves a chunk of positions with the worker's map of the table."""
+    return _solve_chunk(_worker_state, task)
+
+
+def _prepare_table(path, num_pits, max_seeds, size):
+    """Creates the table file, or reuses a table file of the same number of pits, and makes it
+    large enough for `size` positions. Returns the most seeds of the levels already solved."""
+    solved = 0
+    if os.path.exists(path):
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+        if len(header) == HEADER.size:
+            magic, table_pits, solved, _ = HEADER.unpack(header)
+            if magic != MAGIC or table_pits != num_pits:
+                raise ValueError(f"{path} is not an endgame table with {num_pits} pits.")
+    else:
+        # An empty table: level 0 (a single position worth 0) is solved by the zeroed file.
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, num_pits, 0, 1))
+    if os.path.getsize(path) < HEADER.size + size:
+        with open(path, "r+b") as file:
+            file.truncate(HEADER.size + size)
+    return solved
+
+
+def solve(path, num_pits=3, num_seeds=3, processes=None, chunk_size=4096, progress=False):
+    """Solves a board configuration exhaustively, reusing the levels already solved in the table
+    file, and returns a report of the solution and of the run.
+
+    Parameters:
+        path       : string representing the path of the table file (created if missing).
+        num_pits   : integer representing the number of pits per player.
+        num_seeds  : integer representing the initial number of seeds per pit.
+        processes  : integer representing the number of worker processes (1 to solve in-process,
+                        None for one per CPU core).
+        chunk_size : integer representing the number of positions per pool task.
+        progress   : boolean representing whether to print a line per solved level.
+    Returns:
+        Dictionary of:
+            num_pits, num_seeds : the configuration.
+            positions           : integer, number of positions in the table.
+            solved              : integer, number of positions solved by this run.
+            seconds             : float, wall time of the run.
+            positions_per_second: float, positions solved per second.
+            peak_memory         : integer, peak resident memory in bytes (None if unknown).
+            value               : integer, player 1's final margin from the start with perfect play.
+            winner              : integer, the winner with perfect play (1 or 2, 0 for a tie).
+            best_move           : integer, player 1's best first pit number.
+            move_values         : dictionary mapping player 1's first pit numbers to their margins.
+            levels              : list of (level, positions, seconds) tuples of the solved levels.
+    """
+    max_seeds = 2 * num_pits * num_seeds
+    if not 0 < max_seeds <= 127:
+        raise ValueError("The board must start with between 1 and 127 seeds in the pits.")
+    parts = 2 * num_pits
+    binomials = MancalaEndgame.binomial_table(max_seeds + parts + 1)
+    size = MancalaEndgame.count_positions(max_seeds, parts, binomials)
+    solved = _prepare_table(path, num_pits, max_seeds, size)
+
+    start = time.perf_counter()
+    levels = []
+    state = _open_table(path, num_pits, max_seeds)
+    pool = None
+    if processes != 1 and solved < max_seeds:
+        pool = multiprocessing.Pool(processes, _init_worker, (path, num_pits, max_seeds))
+    try:
+        table = state[1]
+        for level in range(solved + 1, max_seeds + 1):
+            level_start = time.perf_counter()
+            offset = HEADER.size + binomials[level - 1 + parts][parts]
+            count = 0
+            for group in level_groups(level, num_pits):
+                tasks = [(level, offset, group[i:i + chunk_size]) for i in range(0, len(group), chunk_size)]
+                # Small groups are not worth sending to the workers.
+                if pool is None or len(tasks) == 1:
+                    count += sum(_solve_chunk(state, task) for task in tasks)
+                else:
+                    count += sum(pool.map(_solve_task, tasks))
+
+            # Record the solved level in the header, so the file is a valid table.
+            HEADER.pack_into(table, 0, MAGIC, num_pits, level, MancalaEndgame.count_positions(level, parts,
+                                                                                            binomials))
+            table.flush()
+            levels.append((level, count, time.perf_counter() - level_start))
+            if progress:
+                print(f"level {level}: {count} positions in {levels[-1][2]:.2f}s")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        state[1].close()
+        state[0].close()
+    seconds = time.perf_counter() - start
+
+    # Read the solution of the starting board.
+    endgame = MancalaEndgame.EndgameTable(path)
+    try:
+        board = Mancala.Board(num_pits, num_seeds)
+        value = endgame.probe(board, 1)
+        move_values = endgame.get_move_values(board, 1)
+    finally:
+        endgame.close()
+    solved_count = sum(level[1] for level in levels)
+    return {'num_pits': num_pits, 'num_seeds': num_seeds, 'positions': size, 'solved': solved_count,
+            'seconds': seconds, 'positions_per_second': solved_count / seconds if seconds > 0 else 0.0,
+            'peak_memory': peak_memory(), 'value': value, 'winner': 1 if value > 0 else 2 if value < 0 else 0,
+            'best_move': max(move_values, key=move_values.get), 'move_values': move_values, 'levels': levels}
+
+
+def format_report(report):
+    """Returns a solver report as plain text."""
+    results = {0: "a tie", 1: "a win for player 1", 2: "a win for player 2"}
+    moves = " ".join(f"{pit}:{value:+d}" for pit, value in sorted(report['move_values'].items()))
+    memory = "unknown" if report['peak_memory'] is None else f"{report['peak_memory'] / 2 ** 20:.1f} MiB"
+    return (f"{report['num_pits']}x{report['num_seeds']}: {results[report['winner']]} by {abs(report['value'])}, "
+            f"best first move pit {report['best_move']} (first moves {moves})\n"
+            f"    {report['positions']} positions in the table, {report['solved']} solved in "
+            f"{report['seconds']:.2f}s ({report['positions_per_second']:.0f} positions/s), peak memory {memory}")
+
+
+def main():
+    """Solves board configurations from the command line."""
+    parser = argparse.ArgumentParser(description="Solves small Mancala board configurations exhaustively.")
+    parser.add_argument("configs", nargs="+", help="board configurations, e.g. 3x3 4x2 (pits x seeds)")
+    parser.add_argument("--directory", default=".", help="directory of the table files (one per number of pits)")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: CPU cores)")
+    parser.add_argument("--chunk-size", type=int, default=4096, help="positions per worker task")
+    parser.add_argument("--progress", action="store_true", help="print a line per solved level")
+    args = parser.parse_args()
+
+    # Solve the smaller configurations first, so the larger ones reuse their levels.
+    configs = sorted(tuple(int(n) for n in config.split("x")) for config in args.configs)
+    for num_pits, num_seeds in configs:
+        path = os.path.join(args.directory, f"solved-{num_pits}.db")
+        report = solve(path, num_pits, num_seeds, args.processes, args.chunk_size, args.progress)
+        print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
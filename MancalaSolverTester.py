@@ -0,0 +1,58 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 17:40
+# Description: Unit tests for MancalaSolver.py.
+
+import os
+import tempfile
+import unittest
+import Mancala
+import MancalaEndgame
+import MancalaEndgameTester
+import MancalaSolver
+
+
+class SolverTester(unittest.TestCase):
+    """Unit tests for the exhaustive solver."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_same_as_exhaustive_search(self):
+        """Should give the value and first move values of an exhaustive search."""
+        report = MancalaSolver.solve(os.path.join(self.directory.name, "solved.db"), 2, 2, processes=1)
+        board = Mancala.Board(2, 2)
+        board.set_to_move(1)
+        self.assertEqual(report['value'], MancalaEndgameTester.solve(board))
+        self.assertEqual(report['positions'], MancalaEndgame.count_positions(8, 4))
+        for pit, value in report['move_values'].items():
+            board.make_move(1, pit)
+            score = MancalaEndgameTester.solve(board)
+            self.assertEqual(value, score if board.get_to_move() == 1 else -score)
+            board.unmake_move()
+        self.assertEqual(report['move_values'][report['best_move']], report['value'])
+        self.assertIn("2x2:", MancalaSolver.format_report(report))
+
+    def test_parallel_and_resumed(self):
+        """Should write the same table in parallel, and when resumed from a smaller configuration,
+        as the endgame table builder."""
+        expected_path = os.path.join(self.directory.name, "endgame.db")
+        MancalaEndgame.build_endgame_table(expected_path, 12, 3).close()
+        path = os.path.join(self.directory.name, "solved.db")
+        first = MancalaSolver.solve(path, 3, 1, processes=1)
+        self.assertEqual(first['solved'], MancalaEndgame.count_positions(6, 6) - 1)
+        second = MancalaSolver.solve(path, 3, 2, processes=2, chunk_size=64)
+        self.assertEqual(second['solved'], second['positions'] - first['positions'])
+        self.assertEqual([level[0] for level in second['levels']], list(range(7, 13)))
+        with open(expected_path, "rb") as expected, open(path, "rb") as file:
+            self.assertEqual(file.read(), expected.read())
+        again = MancalaSolver.solve(path, 3, 2)
+        self.assertEqual((again['solved'], again['value']), (0, second['value']))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
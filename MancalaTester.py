@@ -4,13 +4,82 @@
 # Date: 2022-11-12, Sat., 22:28
 # Description: Unit tests for Mancala.py.
 
+import contextlib
+import io
+import random
 import unittest
 import Mancala
 
 
+def sow_one_at_a_time(seeds, num_pits, player, pit):
+    """Reference implementation of a turn on a flat seed list, sowing one seed at a time.
+    Returns 'skip' if the player gets another turn, otherwise None."""
+    own_store = player * (num_pits + 1) - 1
+    opponent_store = (3 - player) * (num_pits + 1) - 1
+    current = own_store - num_pits + pit - 1
+    seed_count = seeds[current]
+    seeds[current] = 0
+    while seed_count > 0:
+        current = (current + 1) % len(seeds)
+        if current == opponent_store:
+            continue
+        seed_count -= 1
+        if seed_count == 0 and own_store - num_pits <= current < own_store and seeds[current] == 0:
+            adjacent = 2 * num_pits - current
+            seeds[own_store] += seeds[adjacent] + 1
+            seeds[adjacent] = 0
+        else:
+            seeds[current] += 1
+    return 'skip' if current == own_store else None
+
+
 class MancalaTester(unittest.TestCase):
     """Unit tests for Mancala class."""
-    pass
+
+    def test_play_game_reference(self):
+        """Should return the same seeds from play_game as one-seed-at-a-time sowing, including
+        the final tally."""
+        for seed in range(20):
+            rng = random.Random(seed)
+            game = Mancala.Mancala()
+            game.create_player("Lily")
+            game.create_player("Lucy")
+            seeds = [4] * 6 + [0] + [4] * 6 + [0]
+            with contextlib.redirect_stdout(io.StringIO()):
+                while game.return_winner() == "Game has not ended":
+                    player, pit = rng.randint(1, 2), rng.randint(1, 6)
+                    offset = 0 if player == 1 else 7
+                    if seeds[offset + pit - 1] == 0:
+                        continue
+                    sow_one_at_a_time(seeds, 6, player, pit)
+                    if not any(seeds[:6]) or not any(seeds[7:13]):
+                        seeds = [0] * 6 + [sum(seeds[:7])] + [0] * 6 + [sum(seeds[7:])]
+                    self.assertEqual(game.play_game(player, pit), seeds)
+
+    def test_apply_move_no_output(self):
+        """Should play moves and raise errors without printing anything."""
+        game = Mancala.Mancala()
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            result = game.apply_move(1, 3)
+            self.assertRaises(ValueError, game.apply_move, 1, 3)
+            self.assertRaises(ValueError, game.apply_move, 3, 1)
+        self.assertEqual(out.getvalue(), "")
+        self.assertEqual(result.is_extra_turn(), True)
+        self.assertEqual(result.get_landing(), (1, 'store'))
+        self.assertEqual(game.play_game(1, 1), [0, 5, 1, 6, 6, 5, 1, 4, 4, 4, 4, 4, 4, 0])
+
+    def test_apply_move_game_over(self):
+        """Should report the game over, perform the final tally, and refuse further moves."""
+        game = Mancala.Mancala()
+        for pit in range(1, 6):
+            self.assertEqual(game.apply_move(1, pit).is_game_over(), False)
+        self.assertEqual(game.apply_move(1, 6).is_game_over(), True)
+        self.assertEqual(game.play_game(2, 1), "Game is ended")
+        self.assertRaises(ValueError, game.apply_move, 2, 1)
+        game.create_player("Lily")
+        game.create_player("Lucy")
+        self.assertEqual(game.return_winner(), "Winner is player 2: Lucy")
 
 
 class BoardTester(unittest.TestCase):
@@ -40,6 +109,49 @@ class BoardTester(unittest.TestCase):
         self.assertEqual(final.get_id(), 2)      # Pit 2
         self.assertNotEqual(final, player_1_pit_1)
 
+    def test_shared_topology(self):
+        """Should share the topology between boards of the same size, and keep the seeds of
+        each board, and its container view, separate."""
+        board, other = Mancala.Board(), Mancala.Board()
+        self.assertIs(board.get_topology(), other.get_topology())
+        self.assertIsNot(board.get_topology(), Mancala.Board(4, 4).get_topology())
+        self.assertFalse(hasattr(Mancala.Container(1, 1, 'pit'), '__dict__'))
+        self.assertNotIn('_seeds', Mancala.ContainerBase.__slots__ + Mancala.ContainerView.__slots__)
+        self.assertIs(Mancala.ArrayBoard, Mancala.Board)
+
+        # The view reads and writes the board's seeds, and follows moves.
+        pit = board.get_board()[1][3]
+        board.apply_move(1, 3)
+        self.assertEqual(pit.get_seeds(), 0)
+        self.assertEqual(pit.get_next().get_seeds(), 5)
+        pit.get_adjacent().set_seeds(9)
+        self.assertEqual(board.get_seeds(2, 4), 9)
+        self.assertEqual(other.get_seed_list(), [4, 4, 4, 4, 4, 4, 0, 4, 4, 4, 4, 4, 4, 0])
+
+        # Setting the seeds keeps the view, and setting up the board again replaces it.
+        board.set_seed_list([1] * 14)
+        self.assertEqual(pit.get_seeds(), 1)
+        self.assertIs(board.get_board()[1][3], pit)
+        board.setup_board()
+        self.assertEqual(board.get_board()[1][3].get_seeds(), 4)
+
+    def test_view_updates_totals(self):
+        """Should see the game end when the pits are emptied through the container view."""
+        board = Mancala.Board()
+        for pit in board.get_board()[1].values():
+            if pit.get_type() == 'pit':
+                pit.set_seeds(0)
+        self.assertTrue(board.is_game_over())
+        self.assertEqual(board.return_winner(), 2)
+
+        # Adding seeds back through the view starts the game again.
+        board = Mancala.Board(num_pits=3, num_seeds=0)
+        board.get_board()[1][2].add_seeds(2)
+        board.get_board()[2][1].increment_seeds()
+        self.assertFalse(board.is_game_over())
+        board.get_board()[2][1].clear_seeds()
+        self.assertTrue(board.is_game_over())
+
     def test_is_game_over(self):
         """Should correctly return game that it is a game ending condition."""
         board = Mancala.Board()
@@ -94,6 +206,329 @@ class BoardTester(unittest.TestCase):
             board.play_turn(*move)
         self.assertEqual(board.is_game_over(), False)
 
+    def test_apply_move_capture(self):
+        """Should report the capture, the captured seeds, and the landing pit."""
+        board = Mancala.Board()
+        board.apply_move(1, 5)
+        result = board.apply_move(2, 1)
+        self.assertEqual(result.get_landing(), (2, 6))
+        self.assertEqual(result.is_capture(), False)
+        self.assertEqual(result.get_captured_seeds(), 0)
+        result = board.apply_move(1, 1)
+        self.assertEqual(result.get_landing(), (1, 5))
+        self.assertEqual(result.is_capture(), True)
+        self.assertEqual(result.get_captured_seeds(), 6)
+        self.assertEqual(result.is_extra_turn(), False)
+        self.assertEqual(board.get_seed_list(), [0, 5, 5, 5, 0, 5, 8, 0, 0, 5, 5, 5, 5, 0])
+
+    def test_make_unmake_move(self):
+        """Should restore the seeds and player to move exactly after unmaking every move."""
+        rng = random.Random(11)
+        for board in (Mancala.Board(), Mancala.Board(num_pits=4, num_seeds=20)):
+            history = []
+            while not board.is_game_over():
+                player = board.get_to_move()
+                pits = [i + 1 for i, n in enumerate(board.get_pit_seeds(player)) if n]
+                history.append((board.get_seed_list(), player))
+                result = board.make_move(player, rng.choice(pits))
+                self.assertEqual(board.get_to_move(), player if result.is_extra_turn() else 3 - player)
+            self.assertEqual(board.get_undo_depth(), len(history))
+            while history:
+                board.unmake_move()
+                self.assertEqual((board.get_seed_list(), board.get_to_move()), history.pop())
+            self.assertEqual(board.get_undo_depth(), 0)
+
+    def test_make_move_extra_turn(self):
+        """Should keep the same player to move after an extra turn, and not push invalid moves."""
+        board = Mancala.Board()
+        board.make_move(1, 3)
+        self.assertEqual(board.get_to_move(), 1)
+        self.assertRaises(ValueError, board.make_move, 1, 3)
+        self.assertEqual(board.get_undo_depth(), 1)
+        board.make_move(1, 1)
+        self.assertEqual(board.get_to_move(), 2)
+
+    def test_pit_totals(self):
+        """Should keep the running pit totals equal to the seeds in the pits, through laps,
+        captures, undo and the final tally."""
+        rng = random.Random(5)
+        for board in (Mancala.Board(num_pits=6, num_seeds=4), Mancala.Board(num_pits=4, num_seeds=15)):
+            while not board.is_game_over():
+                player = board.get_to_move()
+                pits = [i + 1 for i, n in enumerate(board.get_pit_seeds(player)) if n]
+                board.make_move(player, rng.choice(pits))
+                if rng.random() < 0.2:
+                    board.unmake_move()
+                for player in (1, 2):
+                    self.assertEqual(board.get_pit_total(player), sum(board.get_pit_seeds(player)))
+            self.assertEqual(min(board.get_pit_total(1), board.get_pit_total(2)), 0)
+            board.final_tally()
+            self.assertEqual((board.get_pit_total(1), board.get_pit_total(2)), (0, 0))
+            self.assertEqual(board.get_store_seeds(1) + board.get_store_seeds(2), sum(board.get_seed_list()))
+
+    def test_legal_moves(self):
+        """Should list the non-empty pits, as a bitmask and a shared tuple, and none once over."""
+        board = Mancala.Board()
+        board.apply_move(1, 3)
+        self.assertEqual(board.get_legal_mask(1), 0b111011)
+        self.assertEqual(board.get_legal_moves(1), (1, 2, 4, 5, 6))
+        self.assertIs(board.get_legal_moves(1), Mancala.legal_moves(0b111011))
+        board.set_seed_list([0, 0, 0, 0, 0, 0, 20, 1, 2, 0, 0, 0, 3, 22])
+        self.assertEqual(board.get_legal_moves(2), ())
+
+    def test_ordered_moves(self):
+        """Should order extra turns first, then captures, then the rest, matching apply_move."""
+        rng = random.Random(9)
+        for board in (Mancala.Board(num_pits=6, num_seeds=4), Mancala.Board(num_pits=3, num_seeds=7)):
+            while not board.is_game_over():
+                player = board.get_to_move()
+                ordered = board.get_ordered_moves(player)
+                self.assertEqual(sorted(ordered), list(board.get_legal_moves(player)))
+                kinds = []
+                for pit in ordered:
+                    result = board.make_move(player, pit)
+                    kinds.append(0 if result.is_extra_turn() else 1 if result.is_capture() else 2)
+                    board.unmake_move()
+                self.assertEqual(kinds, sorted(kinds))
+                board.make_move(player, rng.choice(ordered))
+
+
+class FlatBoardTester(unittest.TestCase):
+    """Unit tests for the flat seed layout of Board, and its circuit and sowing tables."""
+
+    def test_circuit_tables(self):
+        """Should loop back to player 1 pit 1 after 14 steps, and oppose pits 1 and 6."""
+        nxt, opposite, side = Mancala.circuit_tables(6)
+        final = 0
+        for i in range(0, 14):
+            final = nxt[final]
+        self.assertEqual(final, 0)
+        self.assertEqual(opposite[0], 12)   # Player 1 pit 1 faces player 2 pit 6.
+        self.assertEqual(opposite[7], 5)    # Player 2 pit 1 faces player 1 pit 6.
+        self.assertEqual(opposite[6], -1)   # Stores have no opposite.
+        self.assertEqual((side[0], side[6], side[7], side[13]), (1, 0, 2, 0))
+
+    def test_sowing_table(self):
+        """Should give the same landing as walking the Container circuit, for every pit and seed
+        count up to a lap, and be shared by all boards of the same size."""
+        for num_pits in (1, 3, 6):
+            table = Mancala.sowing_table(num_pits)
+            self.assertIs(Mancala.sowing_table(num_pits), table)
+            board = Mancala.Board(num_pits)
+            names = [(1, pit) for pit in range(1, num_pits + 1)] + [(1, 'store')]
+            names += [(2, pit) for pit in range(1, num_pits + 1)] + [(2, 'store')]
+            flat = {name: index for index, name in enumerate(names)}
+            for player in (1, 2):
+                for pit in range(1, num_pits + 1):
+                    for seeds in range(1, 4 * num_pits + 3):
+                        # Walk the circuit, skipping the opposing store.
+                        current, sown = board.get_board()[player][pit], []
+                        while len(sown) < seeds:
+                            current = current.get_next()
+                            if not (current.get_type() == 'store' and current.get_player() != player):
+                                sown.append(flat[(current.get_player(), current.get_id())])
+                        laps, remainder = divmod(seeds - 1, 2 * num_pits + 1)
+                        remainder += 1
+                        landing = table.get_landings()[pit - 1][remainder]
+                        kind = table.get_kinds()[pit - 1][remainder]
+                        self.assertEqual(table.get_flat(player)[landing], sown[-1])
+                        self.assertEqual(kind, Mancala.LANDS_STORE if current.get_type() == 'store' else
+                                         Mancala.LANDS_OWN_PIT if current.get_player() == player else
+                                         Mancala.LANDS_OPPONENT_PIT)
+                        self.assertEqual(list(table.get_order(player)[pit:pit + remainder]), sown[-remainder:])
+                        owners = [board.get_container(index)[0] for index in sown[-remainder:]
+                                  if board.get_container(index)[1] != 'store']
+                        self.assertEqual(table.get_own_gains()[pit - 1][remainder], owners.count(player))
+                        self.assertEqual(table.get_opponent_gains()[pit - 1][remainder], owners.count(3 - player))
+
+        # The tables grow with the square of the number of pits, so the largest boards are cheap.
+        board = Mancala.Board(127, 300)
+        seeds = board.get_seed_list()
+        for player, pit in ((1, 1), (2, 127), (1, 64)):
+            sow_one_at_a_time(seeds, 127, player, pit)
+            board.apply_move(player, pit)
+            self.assertEqual(board.get_seed_list(), seeds)
+
+    def test_final_score(self):
+        """Should correctly return the final scores (seeds in store) for players."""
+        board = Mancala.Board()
+        moves = [(1, 1), (1, 2), (1, 3), (1, 4), (1, 5), (1, 6)]
+        for move in moves:
+            board.play_turn(*move)
+        self.assertEqual(board.is_game_over(), True)
+        self.assertEqual(board.return_winner(), 2)
+        board.final_tally()
+        self.assertEqual(board.get_store_seeds(1), 12)
+        self.assertEqual(board.get_store_seeds(2), 36)
+
+    def test_same_as_reference(self):
+        """Should match one-seed-at-a-time sowing after every move, including laps around the board."""
+        rng = random.Random(7)
+        board = Mancala.Board(num_pits=4, num_seeds=9)
+        seeds = [9] * 4 + [0] + [9] * 4 + [0]
+        with contextlib.redirect_stdout(io.StringIO()):
+            while not board.is_game_over():
+                player = rng.randint(1, 2)
+                pit = rng.choice([i + 1 for i, n in enumerate(board.get_pit_seeds(player)) if n])
+                self.assertEqual(board.play_turn(player, pit), sow_one_at_a_time(seeds, 4, player, pit))
+                self.assertEqual(board.get_pit_seeds(1) + [board.get_store_seeds(1)], seeds[:5])
+                self.assertEqual(board.get_pit_seeds(2) + [board.get_store_seeds(2)], seeds[5:])
+
+
+class SowingTester(unittest.TestCase):
+    """Unit tests for the closed-form (bulk lap) sowing on Board."""
+
+    def test_play(self):
+        """Should report the landing, capture and change in each side's pit seeds of a move,
+        with full laps sown in bulk before the remainder."""
+        table = Mancala.sowing_table(6)
+        seeds = [4] * 6 + [0] + [4] * 6 + [0]
+        self.assertEqual(table.play(seeds, 1, 3), (6, Mancala.LANDS_STORE, None, -1, 0))
+        self.assertEqual(seeds, [4, 4, 0, 5, 5, 5, 1, 4, 4, 4, 4, 4, 4, 0])
+
+        # 14 seeds: a full lap (13 containers), then the last seed in the store.
+        seeds = [0] * 12 + [14, 0]
+        self.assertEqual(table.play(seeds, 2, 6), (13, Mancala.LANDS_STORE, None, -8, 6))
+        self.assertEqual(seeds, [1] * 6 + [0] + [1] * 6 + [2])
+
+        # The last seed lands in the emptied pit after a lap, and captures.
+        seeds = [0, 13] + [0] * 9 + [3, 0, 0]
+        self.assertEqual(table.play(seeds, 1, 2), (1, Mancala.LANDS_OWN_PIT, 4, -8, 2))
+        self.assertEqual(seeds, [1, 0, 1, 1, 1, 1, 6, 1, 1, 1, 1, 0, 1, 0])
+
+    def test_large_seed_counts(self):
+        """Should match one-seed-at-a-time sowing on boards with hundreds of seeds per pit,
+        including captures on the emptied starting pit after a full lap."""
+        rng = random.Random(3)
+        board = Mancala.Board(num_pits=6, num_seeds=48)
+        seeds = [48] * 6 + [0] + [48] * 6 + [0]
+        with contextlib.redirect_stdout(io.StringIO()):
+            while not board.is_game_over():
+                player = rng.randint(1, 2)
+                pit = rng.choice([i + 1 for i, n in enumerate(board.get_pit_seeds(player)) if n] or [1])
+                expected = sow_one_at_a_time(seeds, 6, player, pit)
+                self.assertEqual(board.play_turn(player, pit), expected)
+                self.assertEqual(board.get_pit_seeds(1) + [board.get_store_seeds(1)], seeds[:7])
+                self.assertEqual(board.get_pit_seeds(2) + [board.get_store_seeds(2)], seeds[7:])
+
+    def test_full_lap_capture(self):
+        """Should capture when the last seed of a 13 seed lap lands back in the emptied pit."""
+        board = Mancala.Board(num_pits=6, num_seeds=0)
+        board.get_board()[1][2].set_seeds(13)
+        board.get_board()[2][5].set_seeds(3)
+        board.recount_seeds()
+        board.play_turn(1, 2)
+        self.assertEqual(board.get_pit_seeds(1), [1, 0, 1, 1, 1, 1])
+        self.assertEqual(board.get_store_seeds(1), 1 + 1 + 4)
+        self.assertEqual(board.get_pit_seeds(2), [1, 1, 1, 1, 0, 1])
+
+
+class PositionTester(unittest.TestCase):
+    """Unit tests for Position class."""
+
+    def test_round_trip(self):
+        """Should convert a board to a position and back, with the same seeds and player to move."""
+        board = Mancala.Board()
+        board.make_move(1, 1)
+        position = board.get_position()
+        self.assertEqual(position.get_to_move(), 2)
+        self.assertEqual(position.get_num_pits(), 6)
+        self.assertEqual(len(position.get_key()), 15)
+        copy = position.to_board()
+        self.assertEqual(copy.get_seed_list(), board.get_seed_list())
+        self.assertEqual(copy.get_to_move(), 2)
+        self.assertEqual(Mancala.Position.from_board(copy), position)
+
+    def test_equality_and_hashing(self):
+        """Should be equal and hash the same only for the same seeds and player to move."""
+        seeds = [4] * 6 + [0] + [4] * 6 + [0]
+        position = Mancala.Position(seeds, 1)
+        self.assertEqual(position, Mancala.Position(seeds, 1))
+        self.assertEqual(len({position, Mancala.Position(seeds, 1), Mancala.Position(seeds, 2)}), 2)
+        self.assertEqual(Mancala.Position.from_key(position.get_key()), position)
+
+    def test_large_counts(self):
+        """Should pack counts of 256 or more into 16 bits."""
+        seeds = [48] * 6 + [300] + [0] * 6 + [0]
+        position = Mancala.Position(seeds, 2)
+        self.assertEqual(position.get_seeds(), tuple(seeds))
+        self.assertEqual(position.get_to_move(), 2)
+        self.assertEqual(position.get_num_pits(), 6)
+        self.assertRaises(ValueError, Mancala.Board(num_pits=4).set_position, position)
+
+    def test_canonical(self):
+        """Should map a position with player 2 to move to its mirror, which plays the same moves."""
+        board = Mancala.Board()
+        for player, pit in ((1, 1), (2, 2), (1, 5)):
+            board.make_move(player, pit)
+        position = board.get_position()
+        mirror = position.canonical()
+        self.assertEqual(position.get_to_move(), 2)
+        self.assertTrue(mirror.is_canonical())
+        self.assertEqual(mirror.get_seeds(), position.get_seeds()[7:] + position.get_seeds()[:7])
+        self.assertEqual(mirror.mirror(), position)
+        self.assertIs(mirror.canonical(), mirror)
+        self.assertEqual(position.from_canonical_score(3), -3)
+        self.assertEqual(mirror.from_canonical_score(3), 3)
+
+        # The same pit numbers lead to mirrored positions.
+        mirror_board = mirror.to_board()
+        self.assertEqual(mirror_board.get_legal_moves(1), board.get_legal_moves(2))
+        for pit in board.get_legal_moves(2):
+            board.make_move(2, pit)
+            mirror_board.make_move(1, pit)
+            self.assertEqual(mirror_board.get_position(), board.get_position().mirror())
+            board.unmake_move()
+            mirror_board.unmake_move()
+
+
+class BoardStatsTester(unittest.TestCase):
+    """Unit tests for the opt-in board instrumentation (BoardStats class)."""
+
+    def test_counters(self):
+        """Should count moves, seeds, captures, extra turns, checks and displays."""
+        board = Mancala.Board()
+        self.assertIsNone(board.get_stats())
+        stats = board.enable_stats()
+        game = Mancala.Mancala(board)
+        game.apply_move(1, 3)
+        game.apply_move(1, 6)
+        game.apply_move(2, 1)
+        board.set_seed_list([0, 0, 0, 0, 1, 0, 13, 1, 4, 0, 0, 0, 4, 25])
+        game.apply_move(1, 5)
+        with self.assertRaises(ValueError):
+            board.apply_move(2, 4)
+        with contextlib.redirect_stdout(io.StringIO()):
+            game.print_board()
+        counters = stats.get_counters()
+        self.assertEqual((counters['moves'], counters['invalid_moves'], counters['seeds_sown']), (4, 1, 15))
+        self.assertEqual(counters['containers_traversed'], 15)
+        self.assertEqual((counters['captures'], counters['captured_seeds'], counters['extra_turns']), (1, 1, 1))
+        self.assertEqual((counters['final_tallies'], counters['displays']), (1, 1))
+        self.assertGreater(counters['game_over_checks'], 0)
+        self.assertEqual(sum(stats.get_times().values()), 0.0)
+
+    def test_skipped_stores(self):
+        """Should count the opposing stores skipped by long moves as traversed containers."""
+        board = Mancala.Board(num_pits=6, num_seeds=4)
+        self.assertEqual([board.count_skips(6, seeds) for seeds in (7, 8, 20, 21)], [0, 1, 1, 2])
+        board.set_seed_list([0, 0, 0, 0, 0, 21, 0, 4, 4, 4, 4, 4, 4, 0])
+        stats = board.enable_stats(timing=True)
+        board.apply_move(1, 6)
+        self.assertEqual(stats.get_counters()['containers_traversed'], 23)
+        self.assertGreater(stats.get_times()['apply_move'], 0.0)
+
+    def test_disabled_board_is_unchanged(self):
+        """Should leave no wrappers on the board once disabled, so it plays like a plain board."""
+        board = Mancala.Board()
+        board.enable_stats()
+        board.disable_stats()
+        self.assertIsNone(board.get_stats())
+        for name in Mancala.BoardStats.INSTRUMENTED:
+            self.assertNotIn(name, vars(board))
+        board.apply_move(1, 3)
+        self.assertEqual(board.get_seed_list(), [4, 4, 0, 5, 5, 5, 1, 4, 4, 4, 4, 4, 4, 0])
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -0,0 +1,348 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 11:40
+# Description: Implements a parallel bot-vs-bot tournament runner for the Mancala board game.
+#
+# The module implements the following classes:
+#   Policy - Policy base class representing a move-selection strategy.
+#   RandomPolicy - RandomPolicy class that plays a uniformly random legal move.
+#   GreedyPolicy - GreedyPolicy class that plays the move that puts the most seeds in its store.
+#   SearchPolicy - SearchPolicy class that plays the move chosen by a MancalaSearch.SearchEngine.
+#   TournamentStats - TournamentStats class that aggregates game results as they arrive.
+#   Tournament - Tournament class that plays every pairing of policies across a process pool.
+#
+# Every ordered pairing of policies (so each policy plays both seats) is played for a number of games on each board
+# configuration (num_pits, num_seeds). Each game is seeded from the tournament seed and the game's identity alone, so
+# results are reproducible whatever the number of worker processes or the order games finish in. Games are streamed
+# back from the pool and folded into the statistics one at a time, so the games themselves are never kept in memory.
+#
+# To run a tournament from the command line, e.g.:
+#       python MancalaTournament.py --games 100 --configs 6x4 4x3 --policies random greedy search
+
+import abc
+import argparse
+import multiprocessing
+import random
+
+import Mancala
+import MancalaSearch
+
+
+class Policy(abc.ABC):
+    """Policy base class representing a move-selection strategy. Policies have the same
+    choose_move interface as MancalaSearch.SearchEngine, so they can also be used as computer
+    players in Mancala.new_game. Subclasses must implement choose_move.
+
+    Attributes:
+        _name : string representing the name of the policy.
+        _rng  : random.Random object used for any random choices.
+    """
+    def __init__(self, name):
+        """Initializes a policy."""
+        self._name = name
+        self._rng = random.Random(0)
+
+    def get_name(self):
+        """Returns the name of the policy."""
+        return self._name
+
+    def seed(self, value):
+        """Seeds the random choices of the policy, so that games are reproducible."""
+        self._rng.seed(value)
+
+    def legal_moves(self, board, player_id):
+        """Returns the non-empty pit numbers of a player."""
+        return board.get_legal_moves(player_id)
+
+    @abc.abstractmethod
+    def choose_move(self, board, player_id):
+        """Returns the pit number to play for a player on a board. The board is not modified."""
+
+
+class RandomPolicy(Policy):
+    """RandomPolicy class that plays a uniformly random legal move."""
+    def __init__(self, name="random"):
+        """Initializes a random policy."""
+        super().__init__(name)
+
+    def choose_move(self, board, player_id):
+        """Returns a uniformly random non-empty pit number of the player."""
+        return self._rng.choice(self.legal_moves(board, player_id))
+
+
+class GreedyPolicy(Policy):
+    """GreedyPolicy class that plays the move that leaves the most seeds in its store, preferring
+    moves that earn another turn, and breaking the remaining ties at random."""
+    def __init__(self, name="greedy"):
+        """Initializes a greedy policy."""
+        super().__init__(name)
+
+    def choose_move(self, board, player_id):
+        """Returns the non-empty pit number that maximizes the player's store after the move."""
+        trial = Mancala.Board(board.get_num_pits(), board.get_num_seeds())
+        trial.set_seed_list(board.get_seed_list())
+        best_moves, best_score = [], None
+        for pit in self.legal_moves(board, player_id):
+            result = trial.make_move(player_id, pit)
+            score = (trial.get_store_seeds(player_id), result.is_extra_turn())
+            trial.unmake_move()
+            if best_score is None or score > best_score:
+                best_moves, best_score = [pit], score
+            elif score == best_score:
+                best_moves.append(pit)
+        return self._rng.choice(best_moves)
+
+
+class SearchPolicy(Policy):
+    """SearchPolicy class that plays the move chosen by a MancalaSearch.SearchEngine. Use a node
+    budget rather than a time budget for reproducible tournaments.
+
+    Attributes:
+        _engine : MancalaSearch.SearchEngine object.
+    """
+    def __init__(self, name="search", max_depth=20, node_limit=20000, time_limit=None):
+        """Initializes a search policy."""
+        super().__init__(name)
+        self._engine = MancalaSearch.SearchEngine(name, max_depth=max_depth, time_limit=time_limit,
+                                                  node_limit=node_limit)
+
+    def seed(self, value):
+        """Seeds the policy for a new game, and clears the engine's transposition table, so
+        that the moves of a game do not depend on the games played before it."""
+        super().seed(value)
+        self._engine.clear()
+
+    def choose_move(self, board, player_id):
+        """Returns the best pit number found by the search engine."""
+        return self._engine.choose_move(board, player_id)
+
+
+class TournamentStats:
+    """TournamentStats class that aggregates game results one game at a time.
+
+    Attributes:
+        _games   : integer representing the number of games added.
+        _players : dictionary mapping (num_pits, num_seeds, policy name) to a list of totals
+                    [games, wins, losses, ties, total margin, total squared margin, total moves].
+        _pairs   : dictionary mapping (num_pits, num_seeds, player 1 name, player 2 name) to a
+                    list of totals [games, player 1 wins, player 2 wins, ties].
+    """
+    def __init__(self):
+        """Initializes empty statistics."""
+        self._games = 0
+        self._players = {}
+        self._pairs = {}
+
+    def get_games(self):
+        """Returns the number of games added."""
+        return self._games
+
+    def add(self, game):
+        """Adds the result of one game.
+        Parameters:
+            game : tuple (num_pits, num_seeds, player 1 name, player 2 name, winner, margin, moves),
+                    where winner follows Board.return_winner and margin is player 1's final total
+                    minus player 2's.
+        """
+        num_pits, num_seeds, name_1, name_2, winner, margin, moves = game
+        self._games += 1
+        pair = self._pairs.setdefault((num_pits, num_seeds, name_1, name_2), [0, 0, 0, 0])
+        pair[0] += 1
+        pair[winner if winner else 3] += 1
+        for player, name, player_margin in ((1, name_1, margin), (2, name_2, -margin)):
+            totals = self._players.setdefault((num_pits, num_seeds, name), [0, 0, 0, 0, 0, 0, 0])
+            totals[0] += 1
+            if winner == 0:
+                totals[3] += 1
+            elif winner == player:
+                totals[1] += 1
+            else:
+                totals[2] += 1
+            totals[4] += player_margin
+            totals[5] += player_margin * player_margin
+            totals[6] += moves
+
+    def merge(self, other):
+        """Adds the totals of another TournamentStats object (e.g. from another shard)."""
+        self._games += other._games
+        for table, other_table in ((self._players, other._players), (self._pairs, other._pairs)):
+            for key, totals in other_table.items():
+                mine = table.setdefault(key, [0] * len(totals))
+                for i, value in enumerate(totals):
+                    mine[i] += value
+
+    def get_table(self):
+        """Returns a list of dictionaries, one per (config, policy), sorted by config and win rate:
+            num_pits, num_seeds, policy, games, wins, losses, ties, win_rate, mean_margin,
+            margin_std, mean_length.
+        """
+        rows = []
+        for (num_pits, num_seeds, name), totals in self._players.items():
+            games, wins, losses, ties, margin, margin_squared, moves = totals
+            mean = margin / games
+            rows.append({
+                'num_pits': num_pits, 'num_seeds': num_seeds, 'policy': name, 'games': games,
+                'wins': wins, 'losses': losses, 'ties': ties,
+                'win_rate': (wins + 0.5 * ties) / games,
+                'mean_margin': mean,
+                'margin_std': max(0.0, margin_squared / games - mean * mean) ** 0.5,
+                'mean_length': moves / games,
+            })
+        rows.sort(key=lambda row: (row['num_pits'], row['num_seeds'], -row['win_rate']))
+        return rows
+
+    def get_pairs(self):
+        """Returns a dictionary mapping (num_pits, num_seeds, player 1 name, player 2 name) to
+        (games, player 1 wins, player 2 wins, ties)."""
+        return {key: tuple(totals) for key, totals in self._pairs.items()}
+
+    def format_table(self):
+        """Returns the statistics as a text table."""
+        lines = [f"{'config':>7} {'policy':<12} {'games':>6} {'wins':>6} {'losses':>6} {'ties':>5} "
+                 f"{'win%':>6} {'margin':>7} {'std':>6} {'length':>6}"]
+        for row in self.get_table():
+            lines.append(f"{row['num_pits']:>4}x{row['num_seeds']:<2} {row['policy']:<12} {row['games']:>6} "
+                         f"{row['wins']:>6} {row['losses']:>6} {row['ties']:>5} {100 * row['win_rate']:>6.1f} "
+                         f"{row['mean_margin']:>7.2f} {row['margin_std']:>6.2f} {row['mean_length']:>6.1f}")
+        return "\n".join(lines)
+
+
+# Policies of the worker processes, set by the pool initializer.
+_worker_policies = None
+
+
+def _init_worker(policies):
+    """Pool initializer: keeps the policies in the worker process."""
+    global _worker_policies
+    _worker_policies = policies
+
+
+def _play_task(task):
+    """Pool task: plays one game with the worker policies."""
+    return play_game(_worker_policies, *task)
+
+
+def game_seed(seed, num_pits, num_seeds, name_1, name_2, index):
+    """Returns the deterministic random seed of a game, from the tournament seed and the game identity."""
+    return f"{seed}:{num_pits}x{num_seeds}:{name_1}:{name_2}:{index}"
+
+
+def play_game(policies, seed, num_pits, num_seeds, name_1, name_2, index):
+    """Plays one game between two policies, following the turn order of Mancala.new_game.
+
+    Parameters:
+        policies  : dictionary mapping policy names to Policy objects.
+        seed      : tournament seed.
+        num_pits  : integer representing the number of pits per player.
+        num_seeds : integer representing the initial number of seeds per pit.
+        name_1    : string representing the name of the player 1 policy.
+        name_2    : string representing the name of the player 2 policy.
+        index     : integer representing the game number of the pairing.
+    Returns:
+        Tuple (num_pits, num_seeds, player 1 name, player 2 name, winner, margin, moves), where
+        winner follows Board.return_winner and margin is player 1's final total minus player 2's.
+    """
+    players = {1: policies[name_1], 2: policies[name_2]}
+    rng = random.Random(game_seed(seed, num_pits, num_seeds, name_1, name_2, index))
+    for player in (1, 2):
+        players[player].seed(rng.getrandbits(64))
+
+    board = Mancala.Board(num_pits, num_seeds)
+    game = Mancala.Mancala(board)
+    current, moves = 1, 0
+    while not board.is_game_over():
+        result = game.apply_move(current, players[current].choose_move(board, current))
+        moves += 1
+        if not result.is_extra_turn():
+            current = 3 - current
+    margin = board.get_store_seeds(1) - board.get_store_seeds(2)
+    return num_pits, num_seeds, name_1, name_2, board.return_winner(), margin, moves
+
+
+class Tournament:
+    """Tournament class that plays every ordered pairing of policies, on every board
+    configuration, across a pool of worker processes.
+
+    Attributes:
+        _policies  : dictionary mapping policy names to Policy objects.
+        _configs   : list of (num_pits, num_seeds) tuples representing the board configurations.
+        _games     : integer representing the number of games per pairing and configuration.
+        _seed      : tournament seed; the same seed always plays the same games.
+        _processes : integer representing the number of worker processes (1 to play in-process,
+                        None for one per CPU core).
+        _stats     : TournamentStats object aggregating the results.
+    """
+    def __init__(self, policies, configs=((6, 4),), games=100, seed=0, processes=None):
+        """Initializes a tournament. The policies are told apart by name, so the names must be
+        distinct."""
+        policies = list(policies)
+        self._policies = {policy.get_name(): policy for policy in policies}
+        if len(self._policies) != len(policies):
+            raise ValueError("Every policy in a tournament needs a distinct name.")
+        self._configs = list(configs)
+        self._games = games
+        self._seed = seed
+        self._processes = processes
+        self._stats = TournamentStats()
+
+    def get_stats(self):
+        """Returns the TournamentStats object aggregating the results."""
+        return self._stats
+
+    def tasks(self):
+        """Yields the (seed, num_pits, num_seeds, player 1 name, player 2 name, index) of every game."""
+        for num_pits, num_seeds in self._configs:
+            for name_1 in self._policies:
+                for name_2 in self._policies:
+                    if name_1 == name_2:
+                        continue
+                    for index in range(self._games):
+                        yield self._seed, num_pits, num_seeds, name_1, name_2, index
+
+    def run(self, chunksize=16):
+        """Plays the tournament, yielding each game result (see play_game) as it arrives, after
+        adding it to the statistics. Results arrive in completion order, not task order."""
+        if self._processes == 1:
+            for task in self.tasks():
+                game = play_game(self._policies, *task)
+                self._stats.add(game)
+                yield game
+            return
+
+        with multiprocessing.Pool(self._processes, _init_worker, (self._policies,)) as pool:
+            for game in pool.imap_unordered(_play_task, self.tasks(), chunksize):
+                self._stats.add(game)
+                yield game
+
+    def play(self, progress=0):
+        """Plays the whole tournament, and returns the TournamentStats object.
+        Parameters:
+            progress : integer; if positive, prints the standings every `progress` games.
+        """
+        for _ in self.run():
+            if progress and self._stats.get_games() % progress == 0:
+                print(f"{self._stats.get_games()} games\n{self._stats.format_table()}\n")
+        return self._stats
+
+
+def main():
+    """Runs a tournament from the command line, and prints the standings."""
+    policies = {'random': RandomPolicy, 'greedy': GreedyPolicy, 'search': SearchPolicy}
+    parser = argparse.ArgumentParser(description="Plays a Mancala bot-vs-bot tournament.")
+    parser.add_argument("--games", type=int, default=100, help="games per pairing and configuration")
+    parser.add_argument("--configs", nargs="+", default=["6x4"], help="board configurations, as PITSxSEEDS")
+    parser.add_argument("--policies", nargs="+", default=["random", "greedy"], choices=sorted(policies))
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: CPU cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--progress", type=int, default=0, help="print the standings every N games")
+    args = parser.parse_args()
+
+    configs = [tuple(int(n) for n in config.split("x")) for config in args.configs]
+    tournament = Tournament([policies[name]() for name in args.policies], configs, args.games, args.seed,
+                            args.processes)
+    print(tournament.play(args.progress).format_table())
+
+
+if __name__ == "__main__":
+    main()
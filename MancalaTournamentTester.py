@@ -0,0 +1,81 @@
+# Author: Kevin Kuei
+# GitHub ID: kckuei
+# Course: CS-162
+# Date: 2026-10-18, Sun., 11:40
+# Description: Unit tests for MancalaTournament.py.
+
+import unittest
+import Mancala
+import MancalaTournament
+
+
+class TournamentTester(unittest.TestCase):
+    """Unit tests for Tournament class."""
+
+    def make_tournament(self, processes):
+        """Returns a small random vs greedy tournament."""
+        policies = [MancalaTournament.RandomPolicy(), MancalaTournament.GreedyPolicy()]
+        return MancalaTournament.Tournament(policies, [(6, 4), (3, 2)], games=10, seed=42, processes=processes)
+
+    def test_reproducible_across_processes(self):
+        """Should play the same games in-process and across a process pool."""
+        games_1 = sorted(self.make_tournament(1).run())
+        games_2 = sorted(self.make_tournament(2).run())
+        self.assertEqual(games_1, games_2)
+        self.assertEqual(len(games_1), 2 * 2 * 10)
+
+        # A search policy must not carry anything over from the games a worker played before.
+        def make_search_tournament(processes):
+            policies = [MancalaTournament.SearchPolicy(node_limit=1000), MancalaTournament.GreedyPolicy(),
+                        MancalaTournament.RandomPolicy()]
+            return MancalaTournament.Tournament(policies, [(4, 3)], games=3, seed=1, processes=processes)
+        self.assertEqual(sorted(make_search_tournament(1).run()), sorted(make_search_tournament(3).run(chunksize=1)))
+
+    def test_stats(self):
+        """Should count every game once per seat, with consistent wins, losses and ties."""
+        stats = self.make_tournament(1).play()
+        self.assertEqual(stats.get_games(), 40)
+        rows = stats.get_table()
+        self.assertEqual(len(rows), 4)
+        for row in rows:
+            self.assertEqual(row['games'], 20)
+            self.assertEqual(row['wins'] + row['losses'] + row['ties'], 20)
+        self.assertEqual(sum(row['wins'] for row in rows), sum(row['losses'] for row in rows))
+        self.assertEqual(rows[0]['policy'], 'greedy')
+        self.assertEqual(sum(stats.get_pairs()[(6, 4, 'random', 'greedy')][1:]), 10)
+
+    def test_merge(self):
+        """Should merge statistics from separate shards into the same totals."""
+        games = list(self.make_tournament(1).run())
+        whole, first, second = (MancalaTournament.TournamentStats() for _ in range(3))
+        for i, game in enumerate(games):
+            whole.add(game)
+            (first if i % 2 else second).add(game)
+        first.merge(second)
+        self.assertEqual(first.get_table(), whole.get_table())
+
+
+class PolicyTester(unittest.TestCase):
+    """Unit tests for the Policy classes."""
+
+    def test_greedy_takes_extra_turn(self):
+        """Should prefer the move that ends in its own store from the starting board."""
+        board = Mancala.Board()
+        self.assertEqual(MancalaTournament.GreedyPolicy().choose_move(board, 1), 3)
+        self.assertEqual(board.get_seed_list(), Mancala.Board().get_seed_list())
+
+    def test_policy_interface(self):
+        """Should not construct a policy without choose_move, nor a tournament of policies
+        sharing a name."""
+        class Incomplete(MancalaTournament.Policy):
+            pass
+
+        self.assertRaises(TypeError, Incomplete, "incomplete")
+        policies = [MancalaTournament.SearchPolicy(max_depth=2), MancalaTournament.SearchPolicy(max_depth=4)]
+        self.assertRaises(ValueError, MancalaTournament.Tournament, policies)
+        policies[1] = MancalaTournament.SearchPolicy("search-4", max_depth=4)
+        self.assertEqual(len(list(MancalaTournament.Tournament(policies, games=1).tasks())), 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)